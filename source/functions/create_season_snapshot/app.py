@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+
+from typing import Any, Union
+
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from my_modules.aws.my_s3_client import MyS3Client
+from my_modules.common_functions import (
+    getChangedYtsheetIds,
+    getPlayerCharacterObjects,
+)
+
+"""
+シーズンのスナップショットを作成
+"""
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    """
+
+    メイン処理
+
+    Args:
+        event dict: イベント
+        context LambdaContext: コンテキスト
+    """
+
+    seasonId: int = int(event["SeasonId"])
+    return createSeasonSnapshot(seasonId, getChangedYtsheetIds(event))
+
+
+def createSeasonSnapshot(
+    seasonId: int,
+    changedYtsheetIds: Union[set[str], None] = None,
+) -> dict[str, int]:
+    """シーズンのPCオブジェクトを1つのスナップショットにまとめる
+    前回のスナップショットを元に、変更があったPCと
+    ETagが一致しないPCのみ取得し直す
+
+    Args:
+        seasonId: (int): シーズンID
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合は全PCを取得し直す
+
+    Raises:
+        Exception: PCの取得失敗
+
+    Returns:
+        dict[str, int]: 取得し直したPCの数とスナップショットのPCの数
+            最終更新日時のみ更新したPCも取得し直した数に含める
+    """
+
+    s3: MyS3Client = MyS3Client()
+    previousSnapshot: dict[str, dict[str, Any]] = (
+        {}
+        if changedYtsheetIds is None
+        else s3.GetSeasonSnapshotObject(seasonId)
+    )
+    playerCharacterObjects: dict[str, Union[dict[str, Any], Exception]] = (
+        getPlayerCharacterObjects(
+            s3, seasonId, None, previousSnapshot, changedYtsheetIds
+        )
+    )
+
+    snapshot: dict[str, dict[str, Any]] = {}
+    fetchedCount: int = 0
+    for ytsheetId, playerCharacterObject in playerCharacterObjects.items():
+        if isinstance(playerCharacterObject, Exception):
+            raise Exception(
+                f"PCの取得に失敗しました : {ytsheetId}"
+            ) from playerCharacterObject
+
+        if playerCharacterObject is not previousSnapshot.get(ytsheetId):
+            fetchedCount += 1
+
+        snapshot[ytsheetId] = playerCharacterObject
+
+    # 前回から変わらなければ保存しない
+    if fetchedCount > 0 or snapshot.keys() != previousSnapshot.keys():
+        s3.PutSeasonSnapshotObject(seasonId, snapshot)
+
+    return {
+        "FetchedCount": fetchedCount,
+        "SnapshotCount": len(snapshot),
+    }
@@ -1,22 +1,65 @@
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import sha256
 from json import dumps
 from os import getenv
 from time import sleep
-from typing import Any
+from typing import Any, Union
+from urllib.parse import urlparse
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
 from my_modules.aws.my_s3_client import MyS3Client
 from my_modules.aws.my_sns_client import MySNSClient
 from my_modules.common_functions import MakeYtsheetUrl
-from my_modules.constants.env_keys import GET_YTSHEET_INTERVAL_SECONDS
-from requests import Response, get
+from my_modules.constants.common import DEFAULT_YTSHEET_REQUESTS_PER_SECOND
+from my_modules.constants.env_keys import YTSHEET_REQUESTS_PER_SECOND
+from my_modules.token_bucket import TokenBucket
+from requests import Response, Session, exceptions
+from requests.adapters import HTTPAdapter
 
 """
 ゆとシートデータを取得
 """
 
+# 変更検知に使うPCオブジェクトのメタデータのキー
+_METADATA_CONTENT_HASH: str = "content-sha256"
+_METADATA_ETAG: str = "ytsheet-etag"
+_METADATA_LAST_MODIFIED: str = "ytsheet-last-modified"
+
+# ゆとシートを並列で取得するときの最大スレッド数
+_MAX_WORKERS: int = 8
+
+# 接続先のホストごとの流量制限
+_tokenBuckets: dict[str, TokenBucket] = {}
+
+# ゆとシートへのリクエストのタイムアウト秒数(接続、読み込み)
+_TIMEOUT_SECONDS: tuple[float, float] = (10, 30)
+
+# 再試行するステータスコードと最大再試行回数
+_RETRY_STATUS_CODES: set[int] = {429, 500, 502, 503, 504}
+_MAX_RETRIES: int = 3
+
+# 再試行までの待機秒数の基準値、再試行ごとに2倍にする
+_RETRY_BACKOFF_SECONDS: float = 2
+
+# Retry-Afterに従って待機する最大秒数
+# 長すぎる指定でLambdaがタイムアウトしないよう制限する
+_MAX_RETRY_AFTER_SECONDS: float = 10
+
+# 1PCの取得に再試行を含めてかかる最大秒数
+# ステートマシンはLambdaのタイムアウトからこの秒数を除いて1回に取得するPC数を決める
+_MAX_SECONDS_PER_PLAYER_CHARACTER: float = (_MAX_RETRIES + 1) * sum(
+    _TIMEOUT_SECONDS
+) + _MAX_RETRIES * max(
+    _MAX_RETRY_AFTER_SECONDS, _RETRY_BACKOFF_SECONDS * 2 ** (_MAX_RETRIES - 1)
+)
+
+# ゆとシートにアクセスするセッション
+# ウォームスタート時は前回の呼び出しの接続を再利用する
+_session: Union[Session, None] = None
+
 
 def lambda_handler(event: dict, context: LambdaContext):
     """
@@ -29,68 +72,369 @@ def lambda_handler(event: dict, context: LambdaContext):
     """
 
     seasonId: int = int(event["SeasonId"])
-    player: dict = ConvertDynamoDBToJson(event["Player"])
-    getYtsheetData(seasonId, player)
+
+    # 複数のプレイヤーをまとめて受け取る
+    players: list[dict] = [
+        ConvertDynamoDBToJson(x) for x in event["Players"]
+    ]
+    return getYtsheetData(seasonId, players)
 
 
 def getYtsheetData(
     seasonId: int,
-    player: dict[str, Any],
-):
+    players: list[dict[str, Any]],
+) -> dict[str, Any]:
     """ゆとシートデータを取得
+    全プレイヤーのPCをまとめて並列で取得し、
+    ゆとシートへのアクセスのみ流量を制限する
 
     Args:
         seasonId: (int): シーズンID
-        player: (dict[str, Any]): プレイヤー情報
+        players: (list[dict[str, Any]]): プレイヤー情報
+
+    Raises:
+        Exception: 全てのPCの取得に失敗した
+
+    Returns:
+        dict[str, Any]: 前回から変更があったPCのゆとシートIDとその数、
+            取得に失敗したPCのゆとシートID、
+            処理したプレイヤー数、ゆとシートへのリクエストの計測値
     """
 
+    # S3クライアントはバッチ内の全プレイヤーで共有する
     s3: MyS3Client = MyS3Client()
-    isAccessedYtsheet: bool = False
-    characters: list[dict[str, Any]] = player["characters"]
-    for character in characters:
-        if character["is_deleted"]:
-            # 削除済みの場合はスキップ
-            continue
-
-        if isAccessedYtsheet:
-            # 連続アクセスを避けるために待機
-            sleep(int(getenv(GET_YTSHEET_INTERVAL_SECONDS, "5")))
-
-        isAccessedYtsheet = True
-
-        # ゆとシートにアクセス
-        ytsheetId: str = character["ytsheet_id"]
-        response: Response = get(f"{MakeYtsheetUrl(ytsheetId)}&mode=json")
-
-        # ステータスコード200以外はエラー
-        if response.status_code != 200:
-            publish_error_message(
-                {
-                    "message": "ステータスコードエラー",
-                    "id": player["id"],
-                    "ytsheet_id": ytsheetId,
-                    "status_code": response.status_code,
-                }
+
+    # プレイヤーID、ゆとシートID、URLの組
+    # 削除済みの場合はスキップ
+    targets: list[tuple[Any, str, str]] = [
+        (
+            player["id"],
+            x["ytsheet_id"],
+            f"{MakeYtsheetUrl(x['ytsheet_id'])}&mode=json",
+        )
+        for player in players
+        for x in player["characters"]
+        if not x["is_deleted"]
+    ]
+    metrics: dict[str, float] = {
+        "Requests": 0,
+        "Retries": 0,
+        "BytesReceived": 0,
+        "TimeToFirstByteSeconds": 0,
+        "EncodingFallbacks": 0,
+    }
+    changedYtsheetIds: list[str] = []
+    if len(targets) == 0:
+        return {
+            "ChangedCount": 0,
+            "ChangedYtsheetIds": changedYtsheetIds,
+            "FailedYtsheetIds": [],
+            "PlayerCount": len(players),
+            "Metrics": metrics,
+        }
+
+    # 流量制限はスレッド間で共有するため、並列処理の前に作成する
+    tokenBuckets: dict[str, TokenBucket] = {
+        x: getTokenBucket(x) for _, _, x in targets
+    }
+
+    # 1PCの失敗で取得済みのPCの結果を失わないよう、例外はPCごとに扱う
+    failedYtsheetIds: list[str] = []
+    lastError: Union[Exception, None] = None
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_WORKERS, len(targets))
+    ) as executor:
+        futures: list[Future[tuple[bool, dict[str, float]]]] = [
+            executor.submit(
+                getPlayerCharacterData,
+                s3,
+                seasonId,
+                playerId,
+                ytsheetId,
+                url,
+                tokenBuckets[url],
             )
-            continue
+            for playerId, ytsheetId, url in targets
+        ]
+
+        # 入力順に結果を集計する
+        for (playerId, ytsheetId, _), future in zip(targets, futures):
+            try:
+                isChanged, requestMetrics = future.result()
+            except Exception as e:
+                publish_error_message(
+                    {
+                        "message": "取得エラー",
+                        "id": playerId,
+                        "ytsheet_id": ytsheetId,
+                        "error": repr(e),
+                    }
+                )
+                failedYtsheetIds.append(ytsheetId)
+                lastError = e
+                continue
+
+            if isChanged:
+                changedYtsheetIds.append(ytsheetId)
+
+            for key, value in requestMetrics.items():
+                metrics[key] += value
+
+    # 全て失敗した場合は保存したPCもないため、再実行できるよう例外とする
+    if lastError is not None and len(failedYtsheetIds) == len(targets):
+        raise Exception(
+            f"全てのPCの取得に失敗しました : {len(targets)}件"
+        ) from lastError
+
+    return {
+        "ChangedCount": len(changedYtsheetIds),
+        "ChangedYtsheetIds": changedYtsheetIds,
+        "FailedYtsheetIds": failedYtsheetIds,
+        "PlayerCount": len(players),
+        "Metrics": metrics,
+    }
+
+
+def getPlayerCharacterData(
+    s3: MyS3Client,
+    seasonId: int,
+    playerId: Any,
+    ytsheetId: str,
+    url: str,
+    tokenBucket: TokenBucket,
+) -> tuple[bool, dict[str, float]]:
+    """1PC分のゆとシートデータを取得し、変更があればS3に保存
+
+    Args:
+        s3: (MyS3Client): S3クライアント
+        seasonId: (int): シーズンID
+        playerId: (Any): プレイヤーID
+        ytsheetId: (str): ゆとシートID
+        url: (str): ゆとシートのURL
+        tokenBucket: (TokenBucket): ゆとシートへのアクセスの流量制限
+
+    Returns:
+        tuple[bool, dict[str, float]]:
+            前回から変更があった場合はTrue、ゆとシートへのリクエストの計測値
+    """
+
+    # 前回取得時の情報
+    metadata: dict[str, str] = s3.GetPlayerCharacterMetadata(
+        seasonId, ytsheetId
+    )
+
+    # ゆとシートにアクセス
+    # 前回から変更がなければ304が返る
+    headers: dict[str, str] = {}
+    if _METADATA_ETAG in metadata:
+        headers["If-None-Match"] = metadata[_METADATA_ETAG]
+
+    if _METADATA_LAST_MODIFIED in metadata:
+        headers["If-Modified-Since"] = metadata[_METADATA_LAST_MODIFIED]
+
+    response: Union[Response, exceptions.RequestException]
+    metrics: dict[str, float]
+    response, metrics = requestYtsheet(url, headers, tokenBucket)
+
+    # 再試行しても接続できなければエラー
+    if isinstance(response, exceptions.RequestException):
+        publish_error_message(
+            {
+                "message": "接続エラー",
+                "id": playerId,
+                "ytsheet_id": ytsheetId,
+                "error": str(response),
+            }
+        )
+        return False, metrics
+
+    if response.status_code == 304:
+        # 変更なし
+        return False, metrics
 
+    # ステータスコード200以外はエラー
+    if response.status_code != 200:
+        publish_error_message(
+            {
+                "message": "ステータスコードエラー",
+                "id": playerId,
+                "ytsheet_id": ytsheetId,
+                "status_code": response.status_code,
+            }
+        )
+        return False, metrics
+
+    # JSON形式でなければエラー
+    if response.headers["Content-Type"] != "application/json":
+        # 文字化けすることがあるため文字コード指定
+        response.encoding = response.apparent_encoding  # type: ignore
+        publish_error_message(
+            {
+                "message": "JSON形式ではありません",
+                "id": playerId,
+                "ytsheet_id": ytsheetId,
+                "response": response.text,
+            }
+        )
+        return False, metrics
+
+    # 内容が前回と同じ場合は保存しない
+    contentHash: str = sha256(response.content).hexdigest()
+    if metadata.get(_METADATA_CONTENT_HASH, "") == contentHash:
+        return False, metrics
+
+    # S3に保存
+    newMetadata: dict[str, str] = {_METADATA_CONTENT_HASH: contentHash}
+    if "ETag" in response.headers:
+        newMetadata[_METADATA_ETAG] = response.headers["ETag"]
+
+    if "Last-Modified" in response.headers:
+        newMetadata[_METADATA_LAST_MODIFIED] = response.headers[
+            "Last-Modified"
+        ]
+
+    body: bytes
+    isFallback: bool
+    body, isFallback = toUtf8(response)
+    if isFallback:
+        metrics["EncodingFallbacks"] += 1
+
+    s3.PutPlayerCharacterObject(seasonId, ytsheetId, body, newMetadata)
+    return True, metrics
+
+
+def toUtf8(response: Response) -> tuple[bytes, bool]:
+    """レスポンスの本文をUTF-8のバイト列で取得
+    文字コードの推定は本文全体を走査して重いため、
+    UTF-8として解釈できない場合のみ行う
+
+    Args:
+        response: (Response): ゆとシートのレスポンス
+
+    Returns:
+        tuple[bytes, bool]: UTF-8の本文、文字コードを推定した場合はTrue
+    """
+    try:
+        # UTF-8であればそのまま保存する
+        response.content.decode("utf-8")
+        return response.content, False
+    except UnicodeDecodeError:
         # 文字化けすることがあるため文字コード指定
         response.encoding = response.apparent_encoding  # type: ignore
+        return response.text.encode("utf-8"), True
+
+
+def requestYtsheet(
+    url: str,
+    headers: dict[str, str],
+    tokenBucket: TokenBucket,
+) -> tuple[Union[Response, exceptions.RequestException], dict[str, float]]:
+    """ゆとシートにアクセス
+    429と5xx、接続エラーとタイムアウトの場合は待機時間を延ばしながら再試行する
+
+    Args:
+        url: (str): ゆとシートのURL
+        headers: (dict[str, str]): リクエストヘッダー
+        tokenBucket: (TokenBucket): ゆとシートへのアクセスの流量制限
 
-        # JSON形式でなければエラー
-        if response.headers["Content-Type"] != "application/json":
-            publish_error_message(
-                {
-                    "message": "JSON形式ではありません",
-                    "id": player["id"],
-                    "ytsheet_id": ytsheetId,
-                    "response": response.text,
-                }
+    Returns:
+        tuple[Union[Response, exceptions.RequestException], dict[str, float]]:
+            最後のレスポンス、再試行しても接続できない場合は最後の例外
+            リクエスト数・再試行回数・受信バイト数・
+            最初のバイトを受信するまでの秒数の合計
+    """
+    metrics: dict[str, float] = {
+        "Requests": 0,
+        "Retries": 0,
+        "BytesReceived": 0,
+        "TimeToFirstByteSeconds": 0,
+        "EncodingFallbacks": 0,
+    }
+    retryCount: int = 0
+    while True:
+        # 連続アクセスを避けるため、流量の上限に達している場合は待機
+        # 再試行も流量制限の対象とする
+        tokenBucket.Acquire()
+        metrics["Requests"] += 1
+        waitSeconds: float = _RETRY_BACKOFF_SECONDS * 2**retryCount
+        try:
+            response: Response = getSession().get(
+                url, headers=headers, timeout=_TIMEOUT_SECONDS
+            )
+        except (exceptions.ConnectionError, exceptions.Timeout) as e:
+            # 一時的な障害の可能性があるため、ステータスコードと同じく再試行する
+            # 他のPCの取得を止めないよう、例外は送出せずに返却する
+            if retryCount >= _MAX_RETRIES:
+                return e, metrics
+        else:
+            # elapsedはレスポンスヘッダーを受信するまでの時間
+            # 受信バイト数は圧縮されたままの本文の大きさ
+            metrics["TimeToFirstByteSeconds"] += (
+                response.elapsed.total_seconds()
+            )
+            metrics["BytesReceived"] += response.raw.tell()
+
+            if (
+                response.status_code not in _RETRY_STATUS_CODES
+                or retryCount >= _MAX_RETRIES
+            ):
+                return response, metrics
+
+            # Retry-Afterの指定があれば上限までは従う
+            retryAfter: str = response.headers.get("Retry-After", "")
+            if retryAfter.isdigit():
+                waitSeconds = min(
+                    float(retryAfter), _MAX_RETRY_AFTER_SECONDS
+                )
+
+        sleep(waitSeconds)
+        retryCount += 1
+        metrics["Retries"] += 1
+
+
+def getSession() -> Session:
+    """ゆとシートにアクセスするセッションを取得
+    ウォームスタート時は前回の呼び出しのセッションを再利用する
+
+    Returns:
+        Session: セッション
+    """
+    global _session
+    if _session is None:
+        # 並列で取得するスレッドの数だけ接続を維持する
+        session: Session = Session()
+        adapter: HTTPAdapter = HTTPAdapter(pool_maxsize=_MAX_WORKERS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+
+    return _session
+
+
+def getTokenBucket(url: str) -> TokenBucket:
+    """接続先のホストの流量制限を取得
+    ウォームスタート時は前回の呼び出しの流量制限を引き継ぐ
+
+    Args:
+        url: (str): 接続先のURL
+
+    Returns:
+        TokenBucket: 流量制限
+    """
+    host: str = urlparse(url).netloc
+    if host not in _tokenBuckets:
+        # 直前に別のコンテナがアクセスしている可能性があるため、
+        # トークンが空の状態から開始する
+        _tokenBuckets[host] = TokenBucket(
+            float(
+                getenv(
+                    YTSHEET_REQUESTS_PER_SECOND,
+                    str(DEFAULT_YTSHEET_REQUESTS_PER_SECOND),
+                )
             )
-            continue
+        )
 
-        # S3に保存
-        s3.PutPlayerCharacterObject(seasonId, ytsheetId, response.text)
+    return _tokenBuckets[host]
 
 
 def publish_error_message(message: dict):
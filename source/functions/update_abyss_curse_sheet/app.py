@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 
 
-from typing import Any
+from typing import Any, Union
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from gspread.utils import rowcol_to_a1
 from gspread.worksheet import CellFormat
 from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
-from my_modules.common_functions import initializePlayers
+from my_modules.common_functions import (
+    getChangedRowIndexes,
+    getChangedYtsheetIds,
+    initializePlayers,
+)
 from my_modules.constants.spread_sheet import (
     ACTIVE_HEADER_TEXT,
     DEFAULT_TEXT_FORMAT,
@@ -20,7 +24,9 @@ from my_modules.constants.spread_sheet import (
     TRUE_STRING,
 )
 from my_modules.constants.sword_world import ABYSS_CURSES
+from my_modules.spreadsheet.my_spreadsheet import MySpreadsheet
 from my_modules.spreadsheet.my_worksheet import MyWorksheet
+from my_modules.sword_world.character_table import CharacterTable
 from my_modules.sword_world.player import Player
 
 """
@@ -48,8 +54,11 @@ def lambda_handler(event: dict, context: LambdaContext):
         playerJsons, levelCap, int(environment["season_id"])
     )
 
-    updateAbyssCurseSheet(
-        environment["spreadsheet_id"], googleServiceAccount, players
+    return updateAbyssCurseSheet(
+        environment["spreadsheet_id"],
+        googleServiceAccount,
+        players,
+        getChangedYtsheetIds(event),
     )
 
 
@@ -57,17 +66,26 @@ def updateAbyssCurseSheet(
     spreadsheetId: str,
     googleServiceAccount: dict[str, str],
     players: list[Player],
-):
+    changedYtsheetIds: Union[set[str], None] = None,
+    spreadsheet: Union[MySpreadsheet, None] = None,
+) -> dict[str, int]:
     """アビスカースシートを更新する
 
     Args:
         spreadsheetId: (str): スプレッドシートのID
         googleServiceAccount: (dict[str, str]): スプレッドシート認証情報
         players: (list[Player]): プレイヤー情報
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合はシート全体を更新
+        spreadsheet: (Union[MySpreadsheet, None]):
+            共有するスプレッドシート、Noneの場合は新たにログインする
+
+    Returns:
+        dict[str, int]: 更新したセル数と送信したバイト数
     """
 
     worksheet: MyWorksheet = MyWorksheet(
-        googleServiceAccount, spreadsheetId, "アビスカース"
+        googleServiceAccount, spreadsheetId, "アビスカース", spreadsheet
     )
     updateData: list[list] = []
 
@@ -93,9 +111,11 @@ def updateAbyssCurseSheet(
             # アビスカースの情報を取得
             receivedCurses: list[str] = []
             receivedCursesString: str = ""
-            for abyssCurse in ABYSS_CURSES:
+            for abyssCurse, isReceived in zip(
+                ABYSS_CURSES, character.GetAbyssCurseIndex()
+            ):
                 receivedCurse: str = ""
-                if abyssCurse in character.AbyssCurses:
+                if isReceived:
                     receivedCurse = TRUE_STRING
                     receivedCursesString += abyssCurse
 
@@ -140,21 +160,13 @@ def updateAbyssCurseSheet(
     total: list = [None] * notTotalColumnCount
     total[TOTAL_COLUMN_INDEX] = TOTAL_TEXT
 
+    abyssCurseCounts: list[int] = CharacterTable(players).CountAbyssCurses()
+
     # アビスカースの数
-    total.append(
-        sum(sum(len(y.AbyssCurses) for y in x.Characters) for x in players)
-    )
+    total.append(sum(abyssCurseCounts))
 
     # 各カースの数
-    total += list(
-        map(
-            lambda x: sum(
-                sum(1 for z in y.Characters if x in z.AbyssCurses)
-                for y in players
-            ),
-            ABYSS_CURSES,
-        )
-    )
+    total += abyssCurseCounts
     updateData.append(total)
 
     # 書式設定
@@ -191,4 +203,9 @@ def updateAbyssCurseSheet(
     )
 
     # 更新
-    worksheet.Update(updateData, formats, True)
+    return worksheet.Update(
+        updateData,
+        formats,
+        True,
+        getChangedRowIndexes(players, changedYtsheetIds),
+    )
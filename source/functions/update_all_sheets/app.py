@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+
+from typing import Any, Callable, Union
+
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
+from my_modules.common_functions import (
+    getChangedYtsheetIds,
+    initializePlayers,
+)
+from my_modules.spreadsheet.my_spreadsheet import MySpreadsheet
+from my_modules.sword_world.player import Player
+from update_ability_sheet.app import updateAbilitySheet
+from update_abyss_curse_sheet.app import updateAbyssCurseSheet
+from update_basic_sheet.app import updateBasicSheet
+from update_combat_skill_sheet.app import updateCombatSkillSheet
+from update_general_skill_sheet.app import updateGeneralSkillSheet
+from update_honor_sheet.app import updateHonorSheet
+from update_language_sheet.app import updateLanguageSheet
+from update_player_sheet.app import updatePlayerSheet
+from update_status_sheet.app import updateStatusSheet
+from update_template_sheet.app import updateTemplateSheet
+
+"""
+全シートを更新
+S3からのPC取得と解析を1回にまとめ、各シートの更新処理で共有する
+シートへの書き込みも全シート分をまとめて送信する
+"""
+
+# シートの更新処理(シートの並び順)
+_SHEET_UPDATERS: list[
+    Callable[
+        [
+            str,
+            dict[str, str],
+            list[Player],
+            Union[set[str], None],
+            Union[MySpreadsheet, None],
+        ],
+        dict[str, int],
+    ]
+] = [
+    updatePlayerSheet,
+    updateBasicSheet,
+    updateAbilitySheet,
+    updateStatusSheet,
+    updateCombatSkillSheet,
+    updateHonorSheet,
+    updateAbyssCurseSheet,
+    updateGeneralSkillSheet,
+    updateLanguageSheet,
+    updateTemplateSheet,
+]
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    """
+
+    メイン処理
+
+    Args:
+        event dict: イベント
+        context LambdaContext: コンテキスト
+    """
+    environment: dict[str, Any] = ConvertDynamoDBToJson(event["Environment"])
+    googleServiceAccount: dict[str, str] = ConvertDynamoDBToJson(
+        event["GoogleServiceAccount"]
+    )
+    levelCap: dict[str, Any] = ConvertDynamoDBToJson(event["LevelCap"])
+    playerJsons: list[dict[str, Any]] = ConvertDynamoDBToJson(event["Players"])
+
+    # PCの取得と解析は全シートで1回だけ行う
+    players: list[Player] = initializePlayers(
+        playerJsons, levelCap, int(environment["season_id"])
+    )
+
+    return updateAllSheets(
+        environment["spreadsheet_id"],
+        googleServiceAccount,
+        players,
+        getChangedYtsheetIds(event),
+    )
+
+
+def updateAllSheets(
+    spreadsheetId: str,
+    googleServiceAccount: dict[str, str],
+    players: list[Player],
+    changedYtsheetIds: Union[set[str], None] = None,
+) -> dict[str, Any]:
+    """全シートを更新する
+
+    Args:
+        spreadsheetId: (str): スプレッドシートのID
+        googleServiceAccount: (dict[str, str]): スプレッドシート認証情報
+        players: (list[Player]): プレイヤー情報
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合はシート全体を更新
+
+    Returns:
+        dict[str, Any]: 更新したセル数や送信したバイト数の合計とシートごとの内訳
+    """
+    # ログインは1回だけ行い、書き込みは最後にまとめて送信する
+    spreadsheet: MySpreadsheet = MySpreadsheet(
+        googleServiceAccount, spreadsheetId, isDeferred=True
+    )
+
+    result: dict[str, Any] = {"Sheets": {}}
+    for updateSheet in _SHEET_UPDATERS:
+        sheetResult: dict[str, int] = updateSheet(
+            spreadsheetId,
+            googleServiceAccount,
+            players,
+            changedYtsheetIds,
+            spreadsheet,
+        )
+        for key, value in sheetResult.items():
+            result[key] = result.get(key, 0) + value
+
+        result["Sheets"][updateSheet.__name__] = sheetResult
+
+    spreadsheet.flushBatchUpdate()
+
+    return result
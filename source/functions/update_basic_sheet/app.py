@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 
 
-from typing import Any
+from typing import Any, Union
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from gspread.utils import rowcol_to_a1
 from gspread.worksheet import CellFormat
 from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
-from my_modules.common_functions import initializePlayers
+from my_modules.common_functions import (
+    getChangedRowIndexes,
+    getChangedYtsheetIds,
+    initializePlayers,
+)
 from my_modules.constants.spread_sheet import (
     ACTIVE_HEADER_TEXT,
     DEFAULT_TEXT_FORMAT,
@@ -29,6 +33,7 @@ from my_modules.constants.spread_sheet import (
     UPDATE_DATETIME_HEADER_TEXT,
     VAGRANTS_HEADER_TEXT,
 )
+from my_modules.spreadsheet.my_spreadsheet import MySpreadsheet
 from my_modules.spreadsheet.my_worksheet import MyWorksheet
 from my_modules.sword_world.player import Player
 
@@ -57,8 +62,11 @@ def lambda_handler(event: dict, context: LambdaContext):
         playerJsons, levelCap, int(environment["season_id"])
     )
 
-    updateBasicSheet(
-        environment["spreadsheet_id"], googleServiceAccount, players
+    return updateBasicSheet(
+        environment["spreadsheet_id"],
+        googleServiceAccount,
+        players,
+        getChangedYtsheetIds(event),
     )
 
 
@@ -66,17 +74,26 @@ def updateBasicSheet(
     spreadsheetId: str,
     googleServiceAccount: dict[str, str],
     players: list[Player],
-):
+    changedYtsheetIds: Union[set[str], None] = None,
+    spreadsheet: Union[MySpreadsheet, None] = None,
+) -> dict[str, int]:
     """基本シートを更新する
 
     Args:
         spreadsheetId: (str): スプレッドシートのID
         googleServiceAccount: (dict[str, str]): スプレッドシート認証情報
         players: (list[Player]): プレイヤー情報
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合はシート全体を更新
+        spreadsheet: (Union[MySpreadsheet, None]):
+            共有するスプレッドシート、Noneの場合は新たにログインする
+
+    Returns:
+        dict[str, int]: 更新したセル数と送信したバイト数
     """
 
     worksheet: MyWorksheet = MyWorksheet(
-        googleServiceAccount, spreadsheetId, "基本"
+        googleServiceAccount, spreadsheetId, "基本", spreadsheet
     )
     updateData: list[list] = []
 
@@ -272,4 +289,9 @@ def updateBasicSheet(
     )
 
     # 更新
-    worksheet.Update(updateData, formats, True)
+    return worksheet.Update(
+        updateData,
+        formats,
+        True,
+        getChangedRowIndexes(players, changedYtsheetIds),
+    )
@@ -7,7 +7,11 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 from gspread.utils import rowcol_to_a1
 from gspread.worksheet import CellFormat
 from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
-from my_modules.common_functions import initializePlayers
+from my_modules.common_functions import (
+    getChangedRowIndexes,
+    getChangedYtsheetIds,
+    initializePlayers,
+)
 from my_modules.constants.spread_sheet import (
     ACTIVE_HEADER_TEXT,
     BATTLE_DANCER_HEADER_TEXT,
@@ -23,11 +27,12 @@ from my_modules.constants.spread_sheet import (
     TRUE_STRING,
 )
 from my_modules.constants.sword_world import COMBAT_SKILLS
+from my_modules.spreadsheet.my_spreadsheet import MySpreadsheet
 from my_modules.spreadsheet.my_worksheet import (
     ConvertToVerticalHeaders,
     MyWorksheet,
 )
-from my_modules.sword_world.combat_skill import CombatSkill
+from my_modules.sword_world.character_table import CharacterTable
 from my_modules.sword_world.player import Player
 
 """
@@ -57,8 +62,11 @@ def lambda_handler(event: dict, context: LambdaContext):
         playerJsons, levelCap, int(environment["season_id"])
     )
 
-    updateCombatSkillSheet(
-        environment["spreadsheet_id"], googleServiceAccount, players
+    return updateCombatSkillSheet(
+        environment["spreadsheet_id"],
+        googleServiceAccount,
+        players,
+        getChangedYtsheetIds(event),
     )
 
 
@@ -66,17 +74,26 @@ def updateCombatSkillSheet(
     spreadsheetId: str,
     googleServiceAccount: dict[str, str],
     players: list[Player],
-):
+    changedYtsheetIds: Union[set[str], None] = None,
+    spreadsheet: Union[MySpreadsheet, None] = None,
+) -> dict[str, int]:
     """戦闘特技シートを更新する
 
     Args:
         spreadsheetId: (str): スプレッドシートのID
         googleServiceAccount: (dict[str, str]): スプレッドシート認証情報
         players: (list[Player]): プレイヤー情報
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合はシート全体を更新
+        spreadsheet: (Union[MySpreadsheet, None]):
+            共有するスプレッドシート、Noneの場合は新たにログインする
+
+    Returns:
+        dict[str, int]: 更新したセル数と送信したバイト数
     """
 
     worksheet: MyWorksheet = MyWorksheet(
-        googleServiceAccount, spreadsheetId, "戦闘特技"
+        googleServiceAccount, spreadsheetId, "戦闘特技", spreadsheet
     )
     updateData: list[list] = []
 
@@ -98,6 +115,7 @@ def updateCombatSkillSheet(
     updateData.append(headers)
 
     formats: list[CellFormat] = []
+
     no: int = 0
     for player in players:
         for character in player.Characters:
@@ -226,11 +244,8 @@ def updateCombatSkillSheet(
             row += skillByLevel
 
             # 戦闘特技の取得状況
-            for combatSkillName in COMBAT_SKILLS:
+            for combatSkill in character.GetCombatSkillIndex():
                 combatSkillStatus: str = ""
-                combatSkill: Union[CombatSkill, None] = (
-                    character.GetCombatSkillByName(combatSkillName)
-                )
                 if combatSkill is not None:
                     if combatSkill.detail == "":
                         # 習得している戦闘特技で、詳細がない場合は○を表示
@@ -294,20 +309,7 @@ def updateCombatSkillSheet(
     notTotalColumnCount: int = len(headers) - len(COMBAT_SKILLS)
     total: list = [None] * notTotalColumnCount
     total[TOTAL_COLUMN_INDEX] = TOTAL_TEXT
-    for totalCombatSkill in COMBAT_SKILLS:
-        total.append(
-            sum(
-                sum(
-                    1
-                    for y in x.Characters
-                    if any(
-                        z.IsSameCombatSkill(totalCombatSkill)
-                        for z in y.GetCombatSkills()
-                    )
-                )
-                for x in players
-            )
-        )
+    total.extend(CharacterTable(players).CountCombatSkills())
 
     updateData.append(total)
 
@@ -355,4 +357,9 @@ def updateCombatSkillSheet(
     )
 
     # 更新
-    worksheet.Update(updateData, formats, True)
+    return worksheet.Update(
+        updateData,
+        formats,
+        True,
+        getChangedRowIndexes(players, changedYtsheetIds),
+    )
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 
 
-from typing import Any
+from typing import Any, Union
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from gspread.utils import rowcol_to_a1
 from gspread.worksheet import CellFormat
 from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
-from my_modules.common_functions import initializePlayers
+from my_modules.common_functions import (
+    getChangedRowIndexes,
+    getChangedYtsheetIds,
+    initializePlayers,
+)
 from my_modules.constants.spread_sheet import (
     ACTIVE_HEADER_TEXT,
     DEFAULT_TEXT_FORMAT,
@@ -19,11 +23,13 @@ from my_modules.constants.spread_sheet import (
     TOTAL_TEXT,
 )
 from my_modules.constants.sword_world import OFFICIAL_GENERAL_SKILLS
+from my_modules.spreadsheet.my_spreadsheet import MySpreadsheet
 from my_modules.spreadsheet.my_worksheet import (
     ConvertToVerticalHeaders,
     MyWorksheet,
 )
-from my_modules.sword_world.general_skill import GeneralSkill
+from my_modules.sword_world.character_table import CharacterTable
+from my_modules.sword_world.general_skill import LearnedGeneralSkill
 from my_modules.sword_world.player import Player
 
 """
@@ -51,8 +57,11 @@ def lambda_handler(event: dict, context: LambdaContext):
         playerJsons, levelCap, int(environment["season_id"])
     )
 
-    updateGeneralSkillSheet(
-        environment["spreadsheet_id"], googleServiceAccount, players
+    return updateGeneralSkillSheet(
+        environment["spreadsheet_id"],
+        googleServiceAccount,
+        players,
+        getChangedYtsheetIds(event),
     )
 
 
@@ -60,17 +69,26 @@ def updateGeneralSkillSheet(
     spreadsheetId: str,
     googleServiceAccount: dict[str, str],
     players: list[Player],
-):
+    changedYtsheetIds: Union[set[str], None] = None,
+    spreadsheet: Union[MySpreadsheet, None] = None,
+) -> dict[str, int]:
     """一般技能シートを更新する
 
     Args:
         spreadsheetId: (str): スプレッドシートのID
         googleServiceAccount: (dict[str, str]): スプレッドシート認証情報
         players: (list[Player]): プレイヤー情報
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合はシート全体を更新
+        spreadsheet: (Union[MySpreadsheet, None]):
+            共有するスプレッドシート、Noneの場合は新たにログインする
+
+    Returns:
+        dict[str, int]: 更新したセル数と送信したバイト数
     """
 
     worksheet: MyWorksheet = MyWorksheet(
-        googleServiceAccount, spreadsheetId, "一般技能"
+        googleServiceAccount, spreadsheetId, "一般技能", spreadsheet
     )
     updateData: list[list] = []
 
@@ -102,9 +120,9 @@ def updateGeneralSkillSheet(
     for player in players:
         for character in player.Characters:
             # 公式一般技能のレベル取得
-            officialGeneralSkills: list[GeneralSkill] = list(
+            officialGeneralSkills: list[LearnedGeneralSkill] = list(
                 filter(
-                    lambda x: not x.IsOriginal,
+                    lambda x: not x.Skill.IsOriginal,
                     character.GeneralSkills,
                 )
             )
@@ -138,7 +156,7 @@ def updateGeneralSkillSheet(
                         x.getFormattedSkillAndLevel()
                         for x in list(
                             filter(
-                                lambda x: x.IsOriginal,
+                                lambda x: x.Skill.IsOriginal,
                                 character.GeneralSkills,
                             )
                         )
@@ -147,17 +165,10 @@ def updateGeneralSkillSheet(
             )
 
             # 公式技能のレベル
-            for officialGeneralSkill in OFFICIAL_GENERAL_SKILLS:
-                row.append(
-                    next(
-                        (
-                            x.Level
-                            for x in officialGeneralSkills
-                            if x.compareWithGeneralSkill(officialGeneralSkill)
-                        ),
-                        None,
-                    )
-                )
+            row.extend(
+                None if x is None else x.Level
+                for x in character.GetGeneralSkillIndex()
+            )
 
             updateData.append(row)
 
@@ -178,20 +189,7 @@ def updateGeneralSkillSheet(
     notTotalColumnCount: int = len(headers) - len(OFFICIAL_GENERAL_SKILLS)
     total: list = [None] * notTotalColumnCount
     total[TOTAL_COLUMN_INDEX] = TOTAL_TEXT
-    for officialGeneralSkill in OFFICIAL_GENERAL_SKILLS:
-        total.append(
-            sum(
-                sum(
-                    1
-                    for y in x.Characters
-                    if any(
-                        z.compareWithGeneralSkill(officialGeneralSkill)
-                        for z in y.GeneralSkills
-                    )
-                )
-                for x in players
-            )
-        )
+    total.extend(CharacterTable(players).CountGeneralSkills())
 
     updateData.append(total)
 
@@ -229,4 +227,9 @@ def updateGeneralSkillSheet(
     )
 
     # 更新
-    worksheet.Update(updateData, formats, True)
+    return worksheet.Update(
+        updateData,
+        formats,
+        True,
+        getChangedRowIndexes(players, changedYtsheetIds),
+    )
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 
 
-from typing import Any
+from typing import Any, Union
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from gspread.utils import rowcol_to_a1
 from gspread.worksheet import CellFormat
 from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
-from my_modules.common_functions import initializePlayers
+from my_modules.common_functions import (
+    getChangedRowIndexes,
+    getChangedYtsheetIds,
+    initializePlayers,
+)
 from my_modules.constants.spread_sheet import (
     ACTIVE_HEADER_TEXT,
     DEFAULT_TEXT_FORMAT,
@@ -20,10 +24,12 @@ from my_modules.constants.spread_sheet import (
     TRUE_STRING,
 )
 from my_modules.constants.sword_world import STYLES
+from my_modules.spreadsheet.my_spreadsheet import MySpreadsheet
 from my_modules.spreadsheet.my_worksheet import (
     ConvertToVerticalHeaders,
     MyWorksheet,
 )
+from my_modules.sword_world.character_table import CharacterTable
 from my_modules.sword_world.player import Player
 
 """
@@ -51,8 +57,11 @@ def lambda_handler(event: dict, context: LambdaContext):
         playerJsons, levelCap, int(environment["season_id"])
     )
 
-    updateHonorSheet(
-        environment["spreadsheet_id"], googleServiceAccount, players
+    return updateHonorSheet(
+        environment["spreadsheet_id"],
+        googleServiceAccount,
+        players,
+        getChangedYtsheetIds(event),
     )
 
 
@@ -60,17 +69,26 @@ def updateHonorSheet(
     spreadsheetId: str,
     googleServiceAccount: dict[str, str],
     players: list[Player],
-):
+    changedYtsheetIds: Union[set[str], None] = None,
+    spreadsheet: Union[MySpreadsheet, None] = None,
+) -> dict[str, int]:
     """名誉点・流派シートを更新する
 
     Args:
         spreadsheetId: (str): スプレッドシートのID
         googleServiceAccount: (dict[str, str]): スプレッドシート認証情報
         players: (list[Player]): プレイヤー情報
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合はシート全体を更新
+        spreadsheet: (Union[MySpreadsheet, None]):
+            共有するスプレッドシート、Noneの場合は新たにログインする
+
+    Returns:
+        dict[str, int]: 更新したセル数と送信したバイト数
     """
 
     worksheet: MyWorksheet = MyWorksheet(
-        googleServiceAccount, spreadsheetId, "名誉点・流派"
+        googleServiceAccount, spreadsheetId, "名誉点・流派", spreadsheet
     )
     updateData: list[list] = []
 
@@ -99,9 +117,9 @@ def updateHonorSheet(
             # 流派の情報を取得
             is20: bool = False
             learnedStyles: list[str] = []
-            for style in STYLES:
+            for style, isLearned in zip(STYLES, character.GetStyleIndex()):
                 learnedStyle: str = ""
-                if style in character.Styles:
+                if isLearned:
                     # 該当する流派に入門している
                     learnedStyle = TRUE_STRING
                     if style.Is20:
@@ -163,14 +181,7 @@ def updateHonorSheet(
     )
 
     # 各流派
-    total += list(
-        map(
-            lambda x: sum(
-                sum(1 for z in y.Characters if x in z.Styles) for y in players
-            ),
-            STYLES,
-        )
-    )
+    total += CharacterTable(players).CountStyles()
     updateData.append(total)
 
     # 書式設定
@@ -217,4 +228,9 @@ def updateHonorSheet(
     )
 
     # 更新
-    worksheet.Update(updateData, formats, True)
+    return worksheet.Update(
+        updateData,
+        formats,
+        True,
+        getChangedRowIndexes(players, changedYtsheetIds),
+    )
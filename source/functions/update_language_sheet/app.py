@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 
 
-from typing import Any
+from typing import Any, Union
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from gspread.utils import rowcol_to_a1
 from gspread.worksheet import CellFormat
 from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
-from my_modules.common_functions import initializePlayers
+from my_modules.common_functions import (
+    getChangedRowIndexes,
+    getChangedYtsheetIds,
+    initializePlayers,
+)
 from my_modules.constants.spread_sheet import (
     ACTIVE_HEADER_TEXT,
     DEFAULT_TEXT_FORMAT,
@@ -21,10 +25,12 @@ from my_modules.constants.spread_sheet import (
     TRUE_STRING,
 )
 from my_modules.constants.sword_world import LANGUAGES
+from my_modules.spreadsheet.my_spreadsheet import MySpreadsheet
 from my_modules.spreadsheet.my_worksheet import (
     ConvertToVerticalHeaders,
     MyWorksheet,
 )
+from my_modules.sword_world.character_table import CharacterTable
 from my_modules.sword_world.player import Player
 
 """
@@ -52,8 +58,11 @@ def lambda_handler(event: dict, context: LambdaContext):
         playerJsons, levelCap, int(environment["season_id"])
     )
 
-    updateLanguageSheet(
-        environment["spreadsheet_id"], googleServiceAccount, players
+    return updateLanguageSheet(
+        environment["spreadsheet_id"],
+        googleServiceAccount,
+        players,
+        getChangedYtsheetIds(event),
     )
 
 
@@ -61,17 +70,26 @@ def updateLanguageSheet(
     spreadsheetId: str,
     googleServiceAccount: dict[str, str],
     players: list[Player],
-):
+    changedYtsheetIds: Union[set[str], None] = None,
+    spreadsheet: Union[MySpreadsheet, None] = None,
+) -> dict[str, int]:
     """言語シートを更新する
 
     Args:
         spreadsheetId: (str): スプレッドシートのID
         googleServiceAccount: (dict[str, str]): スプレッドシート認証情報
         players: (list[Player]): プレイヤー情報
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合はシート全体を更新
+        spreadsheet: (Union[MySpreadsheet, None]):
+            共有するスプレッドシート、Noneの場合は新たにログインする
+
+    Returns:
+        dict[str, int]: 更新したセル数と送信したバイト数
     """
 
     worksheet: MyWorksheet = MyWorksheet(
-        googleServiceAccount, spreadsheetId, "言語"
+        googleServiceAccount, spreadsheetId, "言語", spreadsheet
     )
     updateData: list[list] = []
 
@@ -105,13 +123,9 @@ def updateLanguageSheet(
 
             summary: list[str] = []
             languageStatuses: list[str] = []
-            for language in LANGUAGES:
+            for learnedLanguage in character.GetLanguageIndex():
                 languageStatus: str = ""
-                for learnedLanguage in character.GetLanguages():
-                    if not learnedLanguage.Name.startswith(language):
-                        # 未習得
-                        continue
-
+                if learnedLanguage is not None:
                     # 習得済み
                     summaryLine: str = learnedLanguage.Name
                     languageStatus = TRUE_STRING
@@ -125,7 +139,6 @@ def updateLanguageSheet(
                         languageStatus = "読"
 
                     summary.append(summaryLine)
-                    break
 
                 languageStatuses.append(languageStatus)
 
@@ -154,19 +167,7 @@ def updateLanguageSheet(
     notTotalColumnCount: int = len(headers) - len(LANGUAGES)
     total: list = [None] * notTotalColumnCount
     total[TOTAL_COLUMN_INDEX] = TOTAL_TEXT
-    for language in LANGUAGES:
-        total.append(
-            sum(
-                sum(
-                    1
-                    for y in x.Characters
-                    if any(
-                        z.Name.startswith(language) for z in y.GetLanguages()
-                    )
-                )
-                for x in players
-            )
-        )
+    total.extend(CharacterTable(players).CountLanguages())
 
     updateData.append(total)
 
@@ -214,4 +215,9 @@ def updateLanguageSheet(
     )
 
     # 更新
-    worksheet.Update(updateData, formats, True)
+    return worksheet.Update(
+        updateData,
+        formats,
+        True,
+        getChangedRowIndexes(players, changedYtsheetIds),
+    )
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 
 
-from typing import Any
+from typing import Any, Union
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from gspread.utils import rowcol_to_a1
 from gspread.worksheet import CellFormat
 from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
-from my_modules.common_functions import initializePlayers
+from my_modules.common_functions import (
+    getChangedRowIndexes,
+    getChangedYtsheetIds,
+    initializePlayers,
+)
 from my_modules.constants.spread_sheet import (
     ACTIVE_HEADER_TEXT,
     ADVENTURER_BIRTH_HEADER_TEXT,
@@ -20,6 +24,7 @@ from my_modules.constants.spread_sheet import (
     RACE_HEADER_TEXT,
     TRUE_STRING,
 )
+from my_modules.spreadsheet.my_spreadsheet import MySpreadsheet
 from my_modules.spreadsheet.my_worksheet import MyWorksheet
 from my_modules.sword_world.player import Player
 from my_modules.sword_world.races_base_status import RacesBaseStatus
@@ -49,8 +54,11 @@ def lambda_handler(event: dict, context: LambdaContext):
         playerJsons, levelCap, int(environment["season_id"])
     )
 
-    updateStatusSheet(
-        environment["spreadsheet_id"], googleServiceAccount, players
+    return updateStatusSheet(
+        environment["spreadsheet_id"],
+        googleServiceAccount,
+        players,
+        getChangedYtsheetIds(event),
     )
 
 
@@ -58,17 +66,26 @@ def updateStatusSheet(
     spreadsheetId: str,
     googleServiceAccount: dict[str, str],
     players: list[Player],
-):
+    changedYtsheetIds: Union[set[str], None] = None,
+    spreadsheet: Union[MySpreadsheet, None] = None,
+) -> dict[str, int]:
     """能力値シートを更新する
 
     Args:
         spreadsheetId: (str): スプレッドシートのID
         googleServiceAccount: (dict[str, str]): スプレッドシート認証情報
         players: (list[Player]): プレイヤー情報
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合はシート全体を更新
+        spreadsheet: (Union[MySpreadsheet, None]):
+            共有するスプレッドシート、Noneの場合は新たにログインする
+
+    Returns:
+        dict[str, int]: 更新したセル数と送信したバイト数
     """
 
     worksheet: MyWorksheet = MyWorksheet(
-        googleServiceAccount, spreadsheetId, "能力値"
+        googleServiceAccount, spreadsheetId, "能力値", spreadsheet
     )
     updateData: list[list] = []
 
@@ -255,4 +272,9 @@ def updateStatusSheet(
     )
 
     # 更新
-    worksheet.Update(updateData, formats, False)
+    return worksheet.Update(
+        updateData,
+        formats,
+        False,
+        getChangedRowIndexes(players, changedYtsheetIds),
+    )
@@ -1,18 +1,23 @@
 # -*- coding: utf-8 -*-
 
 
-from typing import Any
+from typing import Any, Union
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from gspread.utils import rowcol_to_a1
 from gspread.worksheet import CellFormat
 from my_modules.aws.my_dynamo_db_client import ConvertDynamoDBToJson
-from my_modules.common_functions import initializePlayers
+from my_modules.common_functions import (
+    getChangedRowIndexes,
+    getChangedYtsheetIds,
+    initializePlayers,
+)
 from my_modules.constants.spread_sheet import (
     DEFAULT_TEXT_FORMAT,
     NO_HEADER_TEXT,
     PLAYER_CHARACTER_NAME_HEADER_TEXT,
 )
+from my_modules.spreadsheet.my_spreadsheet import MySpreadsheet
 from my_modules.spreadsheet.my_worksheet import MyWorksheet
 from my_modules.sword_world.player import Player
 
@@ -41,8 +46,11 @@ def lambda_handler(event: dict, context: LambdaContext):
         playerJsons, levelCap, int(environment["season_id"])
     )
 
-    updateTemplateSheet(
-        environment["spreadsheet_id"], googleServiceAccount, players
+    return updateTemplateSheet(
+        environment["spreadsheet_id"],
+        googleServiceAccount,
+        players,
+        getChangedYtsheetIds(event),
     )
 
 
@@ -50,17 +58,26 @@ def updateTemplateSheet(
     spreadsheetId: str,
     googleServiceAccount: dict[str, str],
     players: list[Player],
-):
+    changedYtsheetIds: Union[set[str], None] = None,
+    spreadsheet: Union[MySpreadsheet, None] = None,
+) -> dict[str, int]:
     """テンプレートシートを更新する
 
     Args:
         spreadsheetId: (str): スプレッドシートのID
         googleServiceAccount: (dict[str, str]): スプレッドシート認証情報
         players: (list[Player]): プレイヤー情報
+        changedYtsheetIds: (Union[set[str], None]):
+            変更があったPCのゆとシートID、Noneの場合はシート全体を更新
+        spreadsheet: (Union[MySpreadsheet, None]):
+            共有するスプレッドシート、Noneの場合は新たにログインする
+
+    Returns:
+        dict[str, int]: 更新したセル数と送信したバイト数
     """
 
     worksheet: MyWorksheet = MyWorksheet(
-        googleServiceAccount, spreadsheetId, "テンプレート"
+        googleServiceAccount, spreadsheetId, "テンプレート", spreadsheet
     )
     updateData: list[list] = []
 
@@ -86,13 +103,14 @@ def updateTemplateSheet(
             row.append(character.Name)
 
             # 参加申請
-            character.CombatAbilities.sort(
-                key=lambda combatAbility: combatAbility.Level, reverse=True
-            )
             combatAbilityStr: str = "、".join(
                 [
                     f"{combatAbility.SkillName}{combatAbility.Level}"
-                    for combatAbility in character.CombatAbilities
+                    for combatAbility in sorted(
+                        character.CombatAbilities,
+                        key=lambda combatAbility: combatAbility.Level,
+                        reverse=True,
+                    )
                 ]
             )
             url: str = character.GetYtsheetUrl()
@@ -125,4 +143,9 @@ def updateTemplateSheet(
             )
 
     # 更新
-    worksheet.Update(updateData, formats, False)
+    return worksheet.Update(
+        updateData,
+        formats,
+        False,
+        getChangedRowIndexes(players, changedYtsheetIds),
+    )
@@ -282,6 +282,9 @@ def _ConvertDynamoDBToJsonByTypeKey(
     elif key == "L":
         # リスト
         return list(map(_ConvertDynamoDBToJsonByTypeKey, value))
+    elif key == "SS":
+        # 文字列のセット
+        return list(value)
 
     raise Exception("未対応の型です")
 
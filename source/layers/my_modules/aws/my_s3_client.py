@@ -1,18 +1,32 @@
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from gzip import GzipFile, compress, decompress
+from io import BytesIO
 from json import dumps, loads
 from os import getenv
-from typing import Any
+from typing import Any, Union
 
 from boto3 import client
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from mypy_boto3_dynamodb.type_defs import AttributeValueTypeDef
 from mypy_boto3_s3.client import S3Client
-from mypy_boto3_s3.type_defs import GetObjectOutputTypeDef
+from mypy_boto3_s3.type_defs import (
+    GetObjectOutputTypeDef,
+    HeadObjectOutputTypeDef,
+    PutObjectRequestTypeDef,
+)
 from pytz import timezone
 
 from ..constants.common import BACKUP_KEY, TIMEZONE
-from ..constants.env_keys import MY_AWS_REGION, MY_BUCKET_NAME
+from ..constants.env_keys import (
+    MY_AWS_REGION,
+    MY_BUCKET_NAME,
+    PLAYER_CHARACTER_CONTENT_ENCODING,
+    S3_MAX_CONCURRENCY,
+)
 
 """
 S3Client拡張クラス
@@ -27,14 +41,29 @@ class MyS3Client:
     # S3のディレクトリ名
     _S3_DIRECTORY_BACKUPS: str = "backups"
     _S3_DIRECTORY_PLAYER_CHARACTERS: str = "player_characters"
+    _S3_DIRECTORY_SEASON_SNAPSHOTS: str = "season_snapshots"
+    _S3_DIRECTORY_PARSED_PLAYER_CHARACTERS: str = "parsed_player_characters"
+
+    # 並列取得時の最大同時接続数の既定値
+    _DEFAULT_MAX_CONCURRENCY: int = 16
+
+    # PCオブジェクトをgzip圧縮する場合の圧縮形式
+    _CONTENT_ENCODING_GZIP: str = "gzip"
 
     def __init__(self):
         """
         コンストラクタ
         """
 
+        self.MaxConcurrency: int = int(
+            getenv(S3_MAX_CONCURRENCY, str(self._DEFAULT_MAX_CONCURRENCY))
+        )
+
+        # 並列取得時に接続待ちが発生しないよう、コネクションプールを広げる
         self.Client: S3Client = client(
-            "s3", region_name=getenv(MY_AWS_REGION, "")
+            "s3",
+            region_name=getenv(MY_AWS_REGION, ""),
+            config=Config(max_pool_connections=max(self.MaxConcurrency, 10)),
         )
 
     def PutBackupObject(
@@ -92,26 +121,82 @@ class MyS3Client:
         self,
         seasonId: int,
         ytsheetId: str,
-        body: str,
+        body: Union[str, bytes],
+        metadata: Union[dict[str, str], None] = None,
     ) -> None:
         """
 
         PCオブジェクトを保存
+        環境変数でgzipが指定されている場合は圧縮して保存する
 
         Args:
             seasonId (int): シーズンID
             ytsheetId (str): ファイル名
-            body (list[dict]): ゆとシートのデータ
+            body (Union[str, bytes]): ゆとシートのデータ、
+                                      バイト列の場合はUTF-8
+            metadata (Union[dict[str, str], None]): オブジェクトのメタデータ
         """
-        # バケットからファイルを取得
-        self.Client.put_object(
-            Bucket=getenv(MY_BUCKET_NAME, ""),
-            Key=(
+        if metadata is None:
+            metadata = {}
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        request: PutObjectRequestTypeDef = {
+            "Bucket": getenv(MY_BUCKET_NAME, ""),
+            "Key": (
                 f"{self._S3_DIRECTORY_PLAYER_CHARACTERS}/"
                 f"{seasonId}/{ytsheetId}.json"
             ),
-            Body=body,
-        )
+            "ContentType": "application/json",
+            "Metadata": metadata,
+        }
+
+        # 取得時に展開できるよう、圧縮形式はContent-Encodingに記録する
+        # 同じ内容であればETagが変わらないよう、gzipヘッダーの時刻は固定する
+        if (
+            getenv(PLAYER_CHARACTER_CONTENT_ENCODING, "")
+            == self._CONTENT_ENCODING_GZIP
+        ):
+            body = compress(body, mtime=0)
+            request["ContentEncoding"] = self._CONTENT_ENCODING_GZIP
+
+        request["Body"] = body
+        self.Client.put_object(**request)
+
+    def GetPlayerCharacterMetadata(
+        self, seasonId: int, ytsheetId: str
+    ) -> dict[str, str]:
+        """
+
+        PCオブジェクトのメタデータを取得
+
+        Args:
+            seasonId (int): シーズンID
+            ytsheetId (str): ファイル名
+
+        Returns:
+            dict[str, str]: メタデータ、オブジェクトが存在しない場合は空
+        """
+        try:
+            response: HeadObjectOutputTypeDef = self.Client.head_object(
+                Bucket=getenv(MY_BUCKET_NAME, ""),
+                Key=(
+                    f"{self._S3_DIRECTORY_PLAYER_CHARACTERS}/"
+                    f"{seasonId}/{ytsheetId}.json"
+                ),
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code", "") in (
+                "404",
+                "NoSuchKey",
+            ):
+                # ファイルが存在しない
+                return {}
+
+            raise e
+
+        return response.get("Metadata", {})
 
     def GetPlayerCharacterObject(
         self, seasonId: int, ytsheetId: str
@@ -125,7 +210,7 @@ class MyS3Client:
             ytsheetId (str): ファイル名
 
         Returns:
-            dict: PCデータ
+            dict: PCデータ、最終更新日時、ETag
         """
         # バケットからファイルを取得
         response: GetObjectOutputTypeDef = self.Client.get_object(
@@ -136,11 +221,230 @@ class MyS3Client:
             ),
         )
 
+        # 圧縮されていない既存のオブジェクトはそのまま読み込む
+        body: bytes = response["Body"].read()
+        if response.get("ContentEncoding", "") == self._CONTENT_ENCODING_GZIP:
+            body = decompress(body)
+
         return {
-            "Body": loads(
-                response["Body"].read().decode("utf-8"),
-            ),
+            "Body": loads(body.decode("utf-8")),
             "LastModified": response["LastModified"].astimezone(
                 timezone(TIMEZONE)
             ),
+            "ETag": response["ETag"],
         }
+
+    def GetPlayerCharacterObjects(
+        self,
+        keys: list[tuple[int, str]],
+        maxConcurrency: Union[int, None] = None,
+    ) -> list[Union[dict[str, Any], Exception]]:
+        """
+
+        PCオブジェクトを並列で取得
+
+        Args:
+            keys (list[tuple[int, str]]): シーズンIDとファイル名の組
+            maxConcurrency (Union[int, None]): 最大同時接続数、
+                                               Noneの場合は環境変数の値
+
+        Returns:
+            list[Union[dict[str, Any], Exception]]: PCデータ
+                keysと同じ順序で返却する。取得に失敗したものは例外を格納する
+        """
+        if len(keys) == 0:
+            return []
+
+        if maxConcurrency is None:
+            maxConcurrency = self.MaxConcurrency
+
+        def getObject(
+            key: tuple[int, str],
+        ) -> Union[dict[str, Any], Exception]:
+            try:
+                return self.GetPlayerCharacterObject(*key)
+            except Exception as e:
+                # 1件の失敗で全体を止めないよう、例外を結果として返却
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(maxConcurrency, len(keys)))
+        ) as executor:
+            # mapは入力順に結果を返却する
+            return list(executor.map(getObject, keys))
+
+    def ListPlayerCharacterVersions(
+        self, seasonId: int
+    ) -> dict[str, dict[str, Any]]:
+        """
+
+        シーズン内のPCオブジェクトのETagと最終更新日時を取得
+        1000件ごとに1回のリクエストで取得できる
+
+        Args:
+            seasonId (int): シーズンID
+
+        Returns:
+            dict[str, dict[str, Any]]: ファイル名をキーとしたETag、最終更新日時
+        """
+        prefix: str = f"{self._S3_DIRECTORY_PLAYER_CHARACTERS}/{seasonId}/"
+        versions: dict[str, dict[str, Any]] = {}
+        for page in self.Client.get_paginator("list_objects_v2").paginate(
+            Bucket=getenv(MY_BUCKET_NAME, ""),
+            Prefix=prefix,
+        ):
+            for content in page.get("Contents", []):
+                ytsheetId: str = (
+                    content["Key"].removeprefix(prefix).removesuffix(".json")
+                )
+                versions[ytsheetId] = {
+                    "ETag": content["ETag"],
+                    "LastModified": content["LastModified"].astimezone(
+                        timezone(TIMEZONE)
+                    ),
+                }
+
+        return versions
+
+    def PutSeasonSnapshotObject(
+        self,
+        seasonId: int,
+        playerCharacterObjects: dict[str, dict[str, Any]],
+    ) -> None:
+        """
+
+        シーズンのスナップショットオブジェクトを保存
+        1行1PCのJSON(NDJSON)をgzip圧縮して保存する
+
+        Args:
+            seasonId (int): シーズンID
+            playerCharacterObjects (dict[str, dict[str, Any]]):
+                ファイル名をキーとしたPCデータ
+        """
+        # 全体の文字列を作らず、1行ずつ圧縮して書き込む
+        body: BytesIO = BytesIO()
+        with GzipFile(fileobj=body, mode="wb") as lines:
+            for ytsheetId, playerCharacterObject in (
+                playerCharacterObjects.items()
+            ):
+                lines.write(
+                    dumps(
+                        {
+                            "ytsheet_id": ytsheetId,
+                            "last_modified": playerCharacterObject[
+                                "LastModified"
+                            ].isoformat(),
+                            "etag": playerCharacterObject.get("ETag"),
+                            "body": playerCharacterObject["Body"],
+                        },
+                        ensure_ascii=False,
+                    ).encode("utf-8")
+                    + b"\n"
+                )
+
+        body.seek(0)
+        self.Client.put_object(
+            Bucket=getenv(MY_BUCKET_NAME, ""),
+            Key=f"{self._S3_DIRECTORY_SEASON_SNAPSHOTS}/{seasonId}.ndjson.gz",
+            Body=body,
+            ContentType="application/gzip",
+        )
+
+    def GetSeasonSnapshotObject(
+        self, seasonId: int
+    ) -> dict[str, dict[str, Any]]:
+        """
+
+        シーズンのスナップショットオブジェクトを取得
+
+        Args:
+            seasonId (int): シーズンID
+
+        Returns:
+            dict[str, dict[str, Any]]: ファイル名をキーとしたPCデータ
+                スナップショットが存在しない場合は空
+        """
+        try:
+            response: GetObjectOutputTypeDef = self.Client.get_object(
+                Bucket=getenv(MY_BUCKET_NAME, ""),
+                Key=(
+                    f"{self._S3_DIRECTORY_SEASON_SNAPSHOTS}/"
+                    f"{seasonId}.ndjson.gz"
+                ),
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code", "") == "NoSuchKey":
+                # スナップショットが存在しない
+                return {}
+
+            raise e
+
+        # 全体をメモリに展開せず、1行ずつ解凍して読み込む
+        playerCharacterObjects: dict[str, dict[str, Any]] = {}
+        with GzipFile(fileobj=response["Body"]) as lines:
+            for line in lines:
+                if not line.strip():
+                    continue
+
+                playerCharacter: dict[str, Any] = loads(line)
+                playerCharacterObjects[playerCharacter["ytsheet_id"]] = {
+                    "Body": playerCharacter["body"],
+                    "LastModified": datetime.fromisoformat(
+                        playerCharacter["last_modified"]
+                    ),
+                    # ETagを含まない古いスナップショットの場合はNone
+                    "ETag": playerCharacter.get("etag"),
+                }
+
+        return playerCharacterObjects
+
+    def PutParsedPlayerCharactersObject(
+        self, seasonId: int, body: bytes
+    ) -> None:
+        """
+
+        シーズンの解析済みPCオブジェクトを保存
+
+        Args:
+            seasonId (int): シーズンID
+            body (bytes): 解析済みPCのキャッシュ
+        """
+        self.Client.put_object(
+            Bucket=getenv(MY_BUCKET_NAME, ""),
+            Key=(
+                f"{self._S3_DIRECTORY_PARSED_PLAYER_CHARACTERS}/"
+                f"{seasonId}.bin"
+            ),
+            Body=body,
+            ContentType="application/octet-stream",
+        )
+
+    def GetParsedPlayerCharactersObject(
+        self, seasonId: int
+    ) -> Union[bytes, None]:
+        """
+
+        シーズンの解析済みPCオブジェクトを取得
+
+        Args:
+            seasonId (int): シーズンID
+
+        Returns:
+            Union[bytes, None]: 解析済みPCのキャッシュ、存在しない場合はNone
+        """
+        try:
+            response: GetObjectOutputTypeDef = self.Client.get_object(
+                Bucket=getenv(MY_BUCKET_NAME, ""),
+                Key=(
+                    f"{self._S3_DIRECTORY_PARSED_PLAYER_CHARACTERS}/"
+                    f"{seasonId}.bin"
+                ),
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code", "") == "NoSuchKey":
+                # まだ保存されていない
+                return None
+
+            raise e
+
+        return response["Body"].read()
@@ -2,7 +2,7 @@
 
 
 from json import dumps
-from typing import Any
+from typing import Any, Union
 
 from requests import put
 
@@ -14,6 +14,13 @@ from .constants.aws import (
 )
 from .sword_world.player import Player
 from .sword_world.player_character import PlayerCharacter
+from .sword_world.player_character_cache import (
+    DumpPlayerCharacterCache,
+    FindPlayerCharacter,
+    GetPlayerCharacter,
+    IsPlayerCharacterCacheLoaded,
+    LoadPlayerCharacterCache,
+)
 
 """
 汎用関数
@@ -71,12 +78,136 @@ def putCloudFormationResponse(
     put(response.ResponseUrl, data=responseBody, headers=headers)
 
 
+def getChangedYtsheetIds(event: dict) -> Union[set[str], None]:
+    """変更があったPCのゆとシートIDを取得
+
+    Args:
+        event (dict): Lambdaのイベント情報
+
+    Returns:
+        Union[set[str], None]: 変更があったPCのゆとシートID
+            指定がない場合は全PCを更新対象とするためNone
+    """
+    changedYtsheetIds: Union[list[str], None] = event.get(
+        "ChangedYtsheetIds"
+    )
+    if changedYtsheetIds is None:
+        return None
+
+    return set(changedYtsheetIds)
+
+
+def getChangedRowIndexes(
+    players: list[Player],
+    changedYtsheetIds: Union[set[str], None],
+    isPlayerRow: bool = False,
+) -> Union[list[int], None]:
+    """変更があった行番号を取得
+
+    1行目はヘッダー、2行目以降はプレイヤー順にPC(プレイヤー)が並ぶものとする
+
+    Args:
+        players (list[Player]): プレイヤー情報
+        changedYtsheetIds (Union[set[str], None]): 変更があったPCのゆとシートID
+        isPlayerRow (bool): 1行に1プレイヤーを出力するシートか
+
+    Returns:
+        Union[list[int], None]: 変更があった行番号
+            全PCを更新対象とする場合はNone
+    """
+    if changedYtsheetIds is None:
+        return None
+
+    isChangedRows: list[bool] = (
+        [
+            any(x.YtsheetId in changedYtsheetIds for x in player.Characters)
+            for player in players
+        ]
+        if isPlayerRow
+        else [
+            character.YtsheetId in changedYtsheetIds
+            for player in players
+            for character in player.Characters
+        ]
+    )
+    return [i + 2 for i, isChanged in enumerate(isChangedRows) if isChanged]
+
+
+def getPlayerCharacterObjects(
+    s3: MyS3Client,
+    seasonId: int,
+    ytsheetIds: Union[list[str], None],
+    snapshot: dict[str, dict[str, Any]],
+    changedYtsheetIds: Union[set[str], None] = None,
+    versions: Union[dict[str, dict[str, Any]], None] = None,
+) -> dict[str, Union[dict[str, Any], Exception]]:
+    """最新のPCオブジェクトを取得
+    スナップショットのETagが現在のPCオブジェクトと一致する場合はそのまま使い、
+    それ以外は個別に並列で取得する
+    同じ内容で保存し直された場合はETagが変わらないため、
+    最終更新日時は一覧取得の値で更新する
+
+    Args:
+        s3 (MyS3Client): S3クライアント
+        seasonId (int): シーズンID
+        ytsheetIds (Union[list[str], None]): ゆとシートID
+            Noneの場合はシーズン内の全PC
+        snapshot (dict[str, dict[str, Any]]): 前回のスナップショット
+        changedYtsheetIds (Union[set[str], None]):
+            ETagに関わらず個別に取得するPCのゆとシートID
+        versions (Union[dict[str, dict[str, Any]], None]):
+            一覧取得したETagと最終更新日時、Noneの場合はここで取得する
+
+    Returns:
+        dict[str, Union[dict[str, Any], Exception]]:
+            ゆとシートIDをキーとしたPCデータ、取得に失敗したものは例外
+    """
+    # 現在のETagと最終更新日時は一覧取得でまとめて確認する
+    if versions is None:
+        versions = s3.ListPlayerCharacterVersions(seasonId)
+
+    if ytsheetIds is None:
+        ytsheetIds = list(versions)
+
+    if changedYtsheetIds is None:
+        changedYtsheetIds = set()
+
+    playerCharacterObjects: dict[str, Union[dict[str, Any], Exception]] = {}
+    missingKeys: list[tuple[int, str]] = []
+    for ytsheetId in ytsheetIds:
+        version: Union[dict[str, Any], None] = versions.get(ytsheetId)
+        if (
+            version is None
+            or ytsheetId not in snapshot
+            or ytsheetId in changedYtsheetIds
+            or snapshot[ytsheetId].get("ETag") != version["ETag"]
+        ):
+            missingKeys.append((seasonId, ytsheetId))
+        elif snapshot[ytsheetId]["LastModified"] != version["LastModified"]:
+            # 本文は再利用し、最終更新日時のみ差し替える
+            playerCharacterObjects[ytsheetId] = {
+                **snapshot[ytsheetId],
+                "LastModified": version["LastModified"],
+            }
+        else:
+            playerCharacterObjects[ytsheetId] = snapshot[ytsheetId]
+
+    playerCharacterObjects.update(
+        zip(
+            map(lambda x: x[1], missingKeys),
+            s3.GetPlayerCharacterObjects(missingKeys),
+        )
+    )
+    return playerCharacterObjects
+
+
 def initializePlayers(
     playerJsons: list[dict[str, Any]],
     levelCap: dict[str, Any],
     seasonId: int,
 ) -> list[Player]:
     """プレイヤー情報初期化
+    解析済みのPCはS3に保存し、変更がなければ次回の実行で再利用する
 
     Args:
         playerJsons (list[dict[str, Any]]): プレイヤー情報のJSON
@@ -84,27 +215,97 @@ def initializePlayers(
         seasonId (int): シーズンID
 
     Raises:
-        Exception: playerJsonsのフォーマット不正
+        Exception: playerJsonsのフォーマット不正、PCの取得失敗
 
     Returns:
         list[Player]: プレイヤー情報
     """
     s3: MyS3Client = MyS3Client()
+    maxExp: int = levelCap["max_exp"]
+    minimumExp: int = levelCap["minimum_exp"]
+    ytsheetIds: list[str] = [
+        character["ytsheet_id"]
+        for playerJson in playerJsons
+        for character in playerJson["characters"]
+    ]
+
+    # 前回までに解析したPCを読み込む
+    # コンテナが再利用された場合は読み込み済み
+    if not IsPlayerCharacterCacheLoaded(seasonId):
+        LoadPlayerCharacterCache(
+            seasonId, s3.GetParsedPlayerCharactersObject(seasonId)
+        )
+
+    # 現在のETagと最終更新日時で、解析済みのPCが最新か判定する
+    versions: dict[str, dict[str, Any]] = s3.ListPlayerCharacterVersions(
+        seasonId
+    )
+    playerCharacters: dict[str, PlayerCharacter] = {}
+    for playerJson in playerJsons:
+        for character in playerJson["characters"]:
+            version: Union[dict[str, Any], None] = versions.get(
+                character["ytsheet_id"]
+            )
+            cached: Union[PlayerCharacter, None] = (
+                None
+                if version is None
+                else FindPlayerCharacter(
+                    seasonId,
+                    character["ytsheet_id"],
+                    version["ETag"],
+                    version["LastModified"],
+                    playerJson["name"],
+                    maxExp,
+                    minimumExp,
+                )
+            )
+            if cached is not None:
+                playerCharacters[character["ytsheet_id"]] = cached
+
+    # 解析済みでないPCのみ、シーズンのスナップショットから1回でまとめて取得
+    # 最新でないPCのみ個別に取得する
+    missingYtsheetIds: list[str] = [
+        x for x in ytsheetIds if x not in playerCharacters
+    ]
+    playerCharacterObjects: dict[str, Union[dict[str, Any], Exception]] = (
+        {}
+        if len(missingYtsheetIds) == 0
+        else getPlayerCharacterObjects(
+            s3,
+            seasonId,
+            missingYtsheetIds,
+            s3.GetSeasonSnapshotObject(seasonId),
+            versions=versions,
+        )
+    )
+
     players: list[Player] = []
     for playerJson in playerJsons:
         characters: list[PlayerCharacter] = []
         playerName: str = playerJson["name"]
         for character in playerJson["characters"]:
-            # S3から取得
-            playerCharacterObject: dict[str, Any] = (
-                s3.GetPlayerCharacterObject(seasonId, character["ytsheet_id"])
+            ytsheetId: str = character["ytsheet_id"]
+            if ytsheetId in playerCharacters:
+                characters.append(playerCharacters[ytsheetId])
+                continue
+
+            playerCharacterObject: Union[dict[str, Any], Exception] = (
+                playerCharacterObjects[ytsheetId]
             )
+            if isinstance(playerCharacterObject, Exception):
+                raise Exception(
+                    f"PCの取得に失敗しました : {ytsheetId}"
+                ) from playerCharacterObject
+
             characters.append(
-                PlayerCharacter(
+                GetPlayerCharacter(
+                    seasonId,
+                    ytsheetId,
+                    playerCharacterObject.get("ETag"),
                     playerCharacterObject["Body"],
                     playerName,
-                    levelCap["max_exp"],
-                    levelCap["minimum_exp"],
+                    maxExp,
+                    minimumExp,
                     playerCharacterObject["LastModified"],
                 )
             )
@@ -116,4 +317,11 @@ def initializePlayers(
             )
         )
 
+    # 新たに解析したPCがあれば、次回の実行のために保存する
+    parsedPlayerCharacters: Union[bytes, None] = DumpPlayerCharacterCache(
+        seasonId, ytsheetIds
+    )
+    if parsedPlayerCharacters is not None:
+        s3.PutParsedPlayerCharactersObject(seasonId, parsedPlayerCharacters)
+
     return players
@@ -10,3 +10,7 @@ BACKUP_KEY: str = "data"
 
 # タイムゾーン
 TIMEZONE: str = "Asia/Tokyo"
+
+# ゆとシートにアクセスする1秒あたりの上限回数の既定値
+# template.yamlのYtsheetRequestsPerSecondの既定値と合わせる
+DEFAULT_YTSHEET_REQUESTS_PER_SECOND: float = 0.1
@@ -10,12 +10,18 @@ MY_AWS_REGION: str = "MY_AWS_REGION"
 # リソース名のプレフィックス
 PREFIX: str = "PREFIX"
 
-# ゆとシートにアクセスする感覚
-GET_YTSHEET_INTERVAL_SECONDS: str = "GET_YTSHEET_INTERVAL_SECONDS"
+# ゆとシートにアクセスする1秒あたりの上限回数
+YTSHEET_REQUESTS_PER_SECOND: str = "YTSHEET_REQUESTS_PER_SECOND"
 
 # バケット名
 MY_BUCKET_NAME: str = "MY_BUCKET_NAME"
 
+# S3からPCを並列取得するときの最大同時接続数
+S3_MAX_CONCURRENCY: str = "S3_MAX_CONCURRENCY"
+
+# PCオブジェクトの圧縮形式
+PLAYER_CHARACTER_CONTENT_ENCODING: str = "PLAYER_CHARACTER_CONTENT_ENCODING"
+
 # SNS トピック ARN
 MY_SNS_TOPIC_ARN: str = "MY_SNS_TOPIC_ARN"
 
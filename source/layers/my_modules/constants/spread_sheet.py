@@ -8,6 +8,9 @@
 API_RETRY_COUNT = 3
 API_RETRY_WAIT_SECOND = 5
 
+# ワークシートのメタデータをキャッシュする秒数
+WORKSHEET_CACHE_SECONDS = 600
+
 # スプレッドシート全体に適用するテキストの書式
 DEFAULT_TEXT_FORMAT: dict = {
     "fontFamily": "Meiryo",
@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 
+from time import monotonic
+
+from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 from gspread.auth import authorize
 from gspread.client import Client
-from gspread.exceptions import APIError
+from gspread.exceptions import APIError, WorksheetNotFound
 from gspread.spreadsheet import Spreadsheet
+from gspread.utils import ValueInputOption
 from gspread.worksheet import Worksheet
 from tenacity import (
     retry,
@@ -13,12 +17,28 @@ from tenacity import (
     wait_fixed,
 )
 
-from ..constants.spread_sheet import API_RETRY_COUNT, API_RETRY_WAIT_SECOND
+from ..constants.spread_sheet import (
+    API_RETRY_COUNT,
+    API_RETRY_WAIT_SECOND,
+    WORKSHEET_CACHE_SECONDS,
+)
 
 """
 Spreadsheet拡張クラス
 """
 
+# ウォームスタート時に認証とメタデータの取得を省略するためのキャッシュ
+# サービスアカウントをキーとした認証情報とクライアント
+_clientCache: dict[str, tuple[service_account.Credentials, Client]] = {}
+
+# サービスアカウントとスプレッドシートのIDをキーとしたスプレッドシート
+_spreadsheetCache: dict[tuple[str, str], Spreadsheet] = {}
+
+# サービスアカウントとスプレッドシートのIDをキーとした取得時刻とワークシート
+_worksheetCache: dict[tuple[str, str], tuple[float, dict[str, Worksheet]]] = (
+    {}
+)
+
 
 class MySpreadsheet:
     """
@@ -29,21 +49,31 @@ class MySpreadsheet:
         self,
         googleServiceAccount: dict[str, str],
         spreadsheetId: str,
+        isDeferred: bool = False,
     ):
         """コンストラクター
 
         Args:
             googleServiceAccount (dict[str, str]): 認証情報
             spreadsheetId (str): スプレッドシートのID
+            isDeferred (bool): 更新をflushBatchUpdateまで保留するか
         """
 
         # サービスアカウントでスプレッドシートにログイン
-        credentials = service_account.Credentials.from_service_account_info(
-            googleServiceAccount,
-            scopes=["https://www.googleapis.com/auth/spreadsheets"],
-        )
-        client: Client = authorize(credentials)
-        self.spreadsheet: Spreadsheet = client.open_by_key(spreadsheetId)
+        accountKey: str = _getAccountKey(googleServiceAccount)
+        client: Client = _getClient(accountKey, googleServiceAccount)
+        self.cacheKey: tuple[str, str] = (accountKey, spreadsheetId)
+        if self.cacheKey not in _spreadsheetCache:
+            _spreadsheetCache[self.cacheKey] = client.open_by_key(
+                spreadsheetId
+            )
+
+        self.spreadsheet: Spreadsheet = _spreadsheetCache[self.cacheKey]
+
+        # 保留中の更新
+        self.isDeferred: bool = isDeferred
+        self.pendingData: list[dict] = []
+        self.pendingRequests: list[dict] = []
 
     @retry(
         stop=stop_after_attempt(API_RETRY_COUNT),
@@ -58,8 +88,27 @@ class MySpreadsheet:
 
         Returns:
             Worksheet: ワークシート
+
+        Raises:
+            WorksheetNotFound: ワークシートが存在しない
         """
-        return self.spreadsheet.worksheet(title)
+        fetchedAt, worksheets = _worksheetCache.get(self.cacheKey, (0.0, {}))
+        if (
+            title not in worksheets
+            or monotonic() - fetchedAt > WORKSHEET_CACHE_SECONDS
+        ):
+            # シートの追加や名前の変更に追従するため取得し直す
+            worksheets = {x.title: x for x in self.spreadsheet.worksheets()}
+            _worksheetCache[self.cacheKey] = (monotonic(), worksheets)
+
+        if title not in worksheets:
+            raise WorksheetNotFound(title)
+
+        return worksheets[title]
+
+    def invalidateWorksheets(self):
+        """キャッシュしたワークシートを破棄する"""
+        _worksheetCache.pop(self.cacheKey, None)
 
     @retry(
         stop=stop_after_attempt(API_RETRY_COUNT),
@@ -75,3 +124,96 @@ class MySpreadsheet:
         self.spreadsheet.reorder_worksheets(
             map(lambda x: self.getWorksheet(x), titles)
         )
+
+        # シートの位置が変わるため破棄する
+        self.invalidateWorksheets()
+
+    def batchUpdate(self, data: list[dict], requests: list[dict]):
+        """値と書式を更新する
+
+        保留する場合は、flushBatchUpdateで全シート分をまとめて送信する
+
+        Args:
+            data (list[dict]): シート名を含む範囲と値
+            requests (list[dict]): spreadsheets.batchUpdateのリクエスト
+        """
+        if self.isDeferred:
+            self.pendingData.extend(data)
+            self.pendingRequests.extend(requests)
+            return
+
+        self._sendBatchUpdate(data, requests)
+
+    @retry(
+        stop=stop_after_attempt(API_RETRY_COUNT),
+        wait=wait_fixed(API_RETRY_WAIT_SECOND),
+        retry=retry_if_exception_type(APIError),
+    )
+    def flushBatchUpdate(self):
+        """保留中の更新を送信する"""
+        self._sendBatchUpdate(self.pendingData, self.pendingRequests)
+        self.pendingData = []
+        self.pendingRequests = []
+
+    def _sendBatchUpdate(self, data: list[dict], requests: list[dict]):
+        """値と書式をそれぞれ1回のリクエストで更新する
+
+        Args:
+            data (list[dict]): シート名を含む範囲と値
+            requests (list[dict]): spreadsheets.batchUpdateのリクエスト
+        """
+        if len(data) != 0:
+            self.spreadsheet.values_batch_update(
+                {
+                    "valueInputOption": ValueInputOption.user_entered,
+                    "data": data,
+                }
+            )
+
+        if len(requests) != 0:
+            self.spreadsheet.batch_update({"requests": requests})
+
+
+def _getAccountKey(googleServiceAccount: dict[str, str]) -> str:
+    """サービスアカウントを識別するキーを返す
+
+    Args:
+        googleServiceAccount (dict[str, str]): 認証情報
+
+    Returns:
+        str: キー
+    """
+    return (
+        f"{googleServiceAccount.get('client_email', '')}/"
+        f"{googleServiceAccount.get('private_key_id', '')}"
+    )
+
+
+def _getClient(
+    accountKey: str, googleServiceAccount: dict[str, str]
+) -> Client:
+    """認証済みのクライアントを返す
+
+    キャッシュがあれば再利用し、アクセストークンが期限切れ間近なら更新する
+
+    Args:
+        accountKey (str): サービスアカウントを識別するキー
+        googleServiceAccount (dict[str, str]): 認証情報
+
+    Returns:
+        Client: クライアント
+    """
+    if accountKey not in _clientCache:
+        credentials = service_account.Credentials.from_service_account_info(
+            googleServiceAccount,
+            scopes=["https://www.googleapis.com/auth/spreadsheets"],
+        )
+        _clientCache[accountKey] = (credentials, authorize(credentials))
+
+    credentials, client = _clientCache[accountKey]
+
+    # validは期限の数分前からFalseになる
+    if not credentials.valid:
+        credentials.refresh(Request())
+
+    return client
@@ -1,7 +1,18 @@
 # -*- coding: utf-8 -*-
 
+from itertools import chain
+from json import dumps
+from sys import maxsize
+from typing import Any, Union
+
 from gspread.exceptions import APIError
-from gspread.utils import ValueInputOption, rowcol_to_a1
+from gspread.utils import (
+    DateTimeOption,
+    ValueRenderOption,
+    a1_range_to_grid_range,
+    absolute_range_name,
+    rowcol_to_a1,
+)
 from gspread.worksheet import CellFormat, Worksheet
 from tenacity import (
     retry,
@@ -33,6 +44,7 @@ class MyWorksheet:
         googleServiceAccount: dict[str, str],
         spreadsheetId: str,
         worksheetName: str,
+        spreadsheet: Union[MySpreadsheet, None] = None,
     ):
         """コンストラクター
 
@@ -40,12 +52,15 @@ class MyWorksheet:
             googleServiceAccount (dict[str, str]): 認証情報
             spreadsheetId (str): スプレッドシートのID
             worksheetName (str): シート名
+            spreadsheet (Union[MySpreadsheet, None]): 共有するスプレッドシート
+                Noneの場合は新たにログインする
         """
 
-        # サービスアカウントでスプレッドシートにログイン
-        spreadsheet: MySpreadsheet = MySpreadsheet(
-            googleServiceAccount, spreadsheetId
-        )
+        if spreadsheet is None:
+            # サービスアカウントでスプレッドシートにログイン
+            spreadsheet = MySpreadsheet(googleServiceAccount, spreadsheetId)
+
+        self.spreadsheet: MySpreadsheet = spreadsheet
         self.worksheet: Worksheet = spreadsheet.getWorksheet(worksheetName)
 
     @retry(
@@ -58,26 +73,87 @@ class MyWorksheet:
         values: list[list],
         additionalFormats: list[CellFormat],
         isContainTotalRow: bool,
-    ):
+        changedRowIndexes: Union[list[int], None] = None,
+    ) -> dict[str, int]:
         """更新する
 
+        現在の値と比較し、値が異なるセルのみ更新する
+
         Args:
             values (list[list]): 更新する値
             additionalFormats (list[CellFormat]): 書式
             isContainTotalRow (bool): 合計行を含むか
+            changedRowIndexes (Union[list[int], None]): 変更があった行番号
+                Noneの場合はシート全体を更新する
+
+        Returns:
+            dict[str, int]: 更新したセル数と送信したバイト数
         """
-        # 初期化
-        self.worksheet.clear()
-        self.worksheet.clear_basic_filter()
+        if changedRowIndexes is not None and self._IsSameLayout(
+            values, changedRowIndexes, isContainTotalRow
+        ):
+            # 変更があった行と合計行のみ更新
+            return self._UpdateRows(
+                values, additionalFormats, isContainTotalRow, changedRowIndexes
+            )
 
-        # 更新
-        self.worksheet.update(
-            values, value_input_option=ValueInputOption.user_entered
+        # 現在の値を取得
+        rowCount: int = len(values)
+        columnCount: int = max(map(lambda x: len(x), values))
+        currentValues: list[list] = self._GetCurrentValues()
+        currentRowCount: int = len(currentValues)
+        currentColumnCount: int = max(
+            map(lambda x: len(x), currentValues), default=0
         )
 
+        # 値が異なるセルのみ更新
+        # 行が減った場合は余った行を空文字で上書きする
+        data: list[dict] = []
+        changedRows: set[int] = set()
+        for rowIndex in range(1, max(rowCount, currentRowCount) + 1):
+            row: list = values[rowIndex - 1] if rowIndex <= rowCount else []
+            currentRow: list = (
+                currentValues[rowIndex - 1]
+                if rowIndex <= currentRowCount
+                else []
+            )
+            for startColumn, endColumn in _GetChangedColumnRanges(
+                row, currentRow, max(columnCount, currentColumnCount)
+            ):
+                data.append(
+                    {
+                        "range": (
+                            f"{rowcol_to_a1(rowIndex, startColumn)}:"
+                            f"{rowcol_to_a1(rowIndex, endColumn)}"
+                        ),
+                        "values": [
+                            [
+                                _ToCellValue(row, x)
+                                for x in range(startColumn - 1, endColumn)
+                            ]
+                        ],
+                    }
+                )
+                changedRows.add(rowIndex)
+
+        if rowCount == currentRowCount and columnCount == currentColumnCount:
+            # 行数と列数が変わらない場合、書式は値が変わった行のみ適用する
+            # 以前の書式が残らないよう、デフォルトの書式に戻してから適用する
+            sameSizeFormats: list[CellFormat] = _GetDefaultRowFormats(
+                changedRows, columnCount
+            )
+            if 1 in changedRows:
+                sameSizeFormats.append(_GetHeaderFormat(columnCount))
+
+            return self._BatchUpdate(
+                data,
+                sameSizeFormats
+                + _FilterFormatsByRows(additionalFormats, changedRows),
+                [],
+            )
+
+        # 行数や列数が変わった場合は書式とフィルターを設定し直す
         formats: list[CellFormat] = []
-        rowCount: int = len(values)
-        columnCount: int = max(map(lambda x: len(x), values))
 
         # デフォルトの書式設定
         startA1: str = rowcol_to_a1(1, 1)
@@ -93,33 +169,250 @@ class MyWorksheet:
         )
 
         # ヘッダーの書式設定
-        startA1 = rowcol_to_a1(1, 1)
-        endA1 = rowcol_to_a1(1, columnCount)
-        formats.append(
-            {
-                "range": f"{startA1}:{endA1}",
-                "format": HORIZONTAL_ALIGNMENT_CENTER
-                | {
-                    "verticalAlignment": "BOTTOM",
-                    "textRotation": {"vertical": False},
-                },
-            }
-        )
+        formats.append(_GetHeaderFormat(columnCount))
 
         formats.extend(additionalFormats)
-        self.worksheet.batch_format(formats)
 
         # 行列の固定
-        self.worksheet.freeze(1, 2)
+        requests: list[dict] = []
+        requests.append(
+            {
+                "updateSheetProperties": {
+                    "properties": {
+                        "sheetId": self.worksheet.id,
+                        "gridProperties": {
+                            "frozenRowCount": 1,
+                            "frozenColumnCount": 2,
+                        },
+                    },
+                    "fields": (
+                        "gridProperties/frozenRowCount,"
+                        "gridProperties/frozenColumnCount"
+                    ),
+                }
+            }
+        )
 
         # フィルター
-        self.worksheet.set_basic_filter(
-            1,
-            1,
+        # 既存のフィルターは置き換えられる
+        startA1 = rowcol_to_a1(1, 1)
+        endA1 = rowcol_to_a1(
             rowCount
             - (1 if isContainTotalRow else 0),  # 合計行はフィルターしない
             columnCount,
         )
+        requests.append(
+            {
+                "setBasicFilter": {
+                    "filter": {
+                        "range": a1_range_to_grid_range(
+                            f"{startA1}:{endA1}", self.worksheet.id
+                        )
+                    }
+                }
+            }
+        )
+
+        return self._BatchUpdate(data, formats, requests)
+
+    def _GetCurrentValues(self) -> list[list]:
+        """シートの現在の値を取得する
+
+        Returns:
+            list[list]: 現在の値
+        """
+        # 日時は書式設定後の文字列、それ以外は書式設定前の値で取得する
+        # キャッシュしたシートの行数と列数に依存しないよう、範囲は指定しない
+        currentValues = self.worksheet.get(
+            value_render_option=ValueRenderOption.unformatted,
+            date_time_render_option=DateTimeOption.formatted_string,
+        )
+
+        # 末尾の空行は返却されないが、途中の空行は空のリストになる
+        return list(currentValues)
+
+    def _BuildFormatRequests(self, formats: list[CellFormat]) -> list[dict]:
+        """書式をspreadsheets.batchUpdateのリクエストに変換する
+
+        Args:
+            formats (list[CellFormat]): 書式
+
+        Returns:
+            list[dict]: リクエスト
+        """
+        return [
+            {
+                "repeatCell": {
+                    "range": a1_range_to_grid_range(
+                        x["range"], self.worksheet.id
+                    ),
+                    "cell": {"userEnteredFormat": x["format"]},
+                    "fields": f"userEnteredFormat({','.join(x['format'])})",
+                }
+            }
+            for x in formats
+        ]
+
+    def _BatchUpdate(
+        self,
+        data: list[dict],
+        formats: list[CellFormat],
+        requests: list[dict],
+    ) -> dict[str, int]:
+        """値と書式をまとめて更新する
+
+        Args:
+            data (list[dict]): 更新する範囲と値
+            formats (list[CellFormat]): 書式
+            requests (list[dict]): 書式以外のspreadsheets.batchUpdateのリクエスト
+
+        Returns:
+            dict[str, int]: 更新したセル数と送信したバイト数
+                書式の最適化で削減したバイト数
+        """
+        # 同じ書式の範囲をまとめてから送信する
+        # バイト数は要素ごとに1回だけJSONに変換して数える
+        formatRequestSizes: dict[int, tuple[dict, int]] = {}
+        formatSizes: list[int] = []
+        for cellFormat, formatRequest in zip(
+            formats, self._BuildFormatRequests(formats)
+        ):
+            formatSizes.append(_GetJsonSize(formatRequest))
+            formatRequestSizes[id(cellFormat)] = (
+                formatRequest,
+                formatSizes[-1],
+            )
+
+        optimizedRequestSizes: list[tuple[dict, int]] = []
+        for cellFormat in OptimizeFormats(formats):
+            if id(cellFormat) in formatRequestSizes:
+                optimizedRequestSizes.append(
+                    formatRequestSizes[id(cellFormat)]
+                )
+                continue
+
+            # 範囲をまとめた書式
+            formatRequest = self._BuildFormatRequests([cellFormat])[0]
+            optimizedRequestSizes.append(
+                (formatRequest, _GetJsonSize(formatRequest))
+            )
+
+        requests = [x[0] for x in optimizedRequestSizes] + requests
+
+        # 複数シートの更新をまとめられるよう、範囲にシート名を含める
+        data = [
+            x
+            | {"range": absolute_range_name(self.worksheet.title, x["range"])}
+            for x in data
+        ]
+        self.spreadsheet.batchUpdate(data, requests)
+
+        # {"data": [...], "requests": [...]} のバイト数
+        requestSizes: list[int] = [x[1] for x in optimizedRequestSizes] + [
+            _GetJsonSize(x) for x in requests[len(optimizedRequestSizes) :]
+        ]
+        return {
+            "CellsWritten": sum(
+                sum(len(y) for y in x["values"]) for x in data
+            ),
+            "BytesSent": len('{"data": , "requests": }')
+            + _GetJsonListSize([_GetJsonSize(x) for x in data])
+            + _GetJsonListSize(requestSizes),
+            "FormatBytesSaved": _GetJsonListSize(formatSizes)
+            - _GetJsonListSize([x[1] for x in optimizedRequestSizes]),
+        }
+
+    def _IsSameLayout(
+        self,
+        values: list[list],
+        changedRowIndexes: list[int],
+        isContainTotalRow: bool,
+    ) -> bool:
+        """シートの行構成が更新する値と同じか
+
+        ヘッダーと、変更がない行のPC名(PL名)列を比較する
+
+        Args:
+            values (list[list]): 更新する値
+            changedRowIndexes (list[int]): 変更があった行番号
+            isContainTotalRow (bool): 合計行を含むか
+
+        Returns:
+            bool: True 同じ
+        """
+        currentHeader, currentNames = self.worksheet.batch_get(["1:1", "B:B"])
+        if (currentHeader[0] if currentHeader else []) != [
+            str(x) for x in values[0]
+        ]:
+            # ヘッダーが変わった
+            return False
+
+        if len(currentNames) != len(values):
+            # 行数が変わった
+            return False
+
+        totalRowIndex: int = len(values) if isContainTotalRow else 0
+        for rowIndex in range(2, len(values) + 1):
+            if rowIndex in changedRowIndexes or rowIndex == totalRowIndex:
+                continue
+
+            currentName: str = (
+                currentNames[rowIndex - 1][0]
+                if currentNames[rowIndex - 1]
+                else ""
+            )
+            if currentName != str(values[rowIndex - 1][1]):
+                # 変更がないはずの行がずれている
+                return False
+
+        return True
+
+    def _UpdateRows(
+        self,
+        values: list[list],
+        additionalFormats: list[CellFormat],
+        isContainTotalRow: bool,
+        changedRowIndexes: list[int],
+    ) -> dict[str, int]:
+        """変更があった行と合計行のみ更新する
+
+        Args:
+            values (list[list]): 更新する値
+            additionalFormats (list[CellFormat]): 書式
+            isContainTotalRow (bool): 合計行を含むか
+            changedRowIndexes (list[int]): 変更があった行番号
+
+        Returns:
+            dict[str, int]: 更新したセル数と送信したバイト数
+        """
+        rowIndexes: set[int] = set(changedRowIndexes)
+        if isContainTotalRow:
+            rowIndexes.add(len(values))
+
+        columnCount: int = max(map(lambda x: len(x), values))
+        return self._BatchUpdate(
+            [
+                {
+                    "range": (
+                        f"{rowcol_to_a1(rowIndex, 1)}:"
+                        f"{rowcol_to_a1(rowIndex, columnCount)}"
+                    ),
+                    # 以前の値が残らないよう、空のセルも空文字で上書きする
+                    "values": [
+                        [
+                            _ToCellValue(values[rowIndex - 1], x)
+                            for x in range(columnCount)
+                        ]
+                    ],
+                }
+                for rowIndex in sorted(rowIndexes)
+            ],
+            # 以前の書式が残らないよう、デフォルトの書式に戻してから
+            # 更新した行に収まる書式のみ適用
+            _GetDefaultRowFormats(rowIndexes, columnCount)
+            + _FilterFormatsByRows(additionalFormats, rowIndexes),
+            [],
+        )
 
 
 def ConvertToVerticalHeaders(horizontalHeaders: list[str]) -> list[str]:
@@ -141,3 +434,418 @@ def ConvertToVerticalHeaders(horizontalHeaders: list[str]) -> list[str]:
             horizontalHeaders,
         )
     )
+
+
+def _ToCellValue(row: list, columnIndex: int) -> Any:
+    """
+    セルに書き込む値を返す
+    値がないセルは以前の値が残らないよう空文字にする
+
+    Args:
+        row (list): 行の値
+        columnIndex (int): 列のインデックス(0始まり)
+    Returns:
+        Any: セルに書き込む値
+    """
+    if columnIndex >= len(row) or row[columnIndex] is None:
+        return ""
+
+    return row[columnIndex]
+
+
+def _IsSameCellValue(value: Any, currentValue: Any) -> bool:
+    """
+    書き込む値とセルの現在の値が同じか
+
+    Args:
+        value (Any): 書き込む値
+        currentValue (Any): セルの現在の値
+    Returns:
+        bool: True 同じ
+    """
+    if value is None or value == "":
+        return currentValue is None or currentValue == ""
+
+    if isinstance(currentValue, (int, float)) and not isinstance(
+        currentValue, bool
+    ):
+        # 数値として解釈されたセルは数値で比較する
+        try:
+            return float(value) == float(currentValue)
+        except (TypeError, ValueError):
+            return False
+
+    return str(value) == str(currentValue)
+
+
+def _GetChangedColumnRanges(
+    row: list, currentRow: list, columnCount: int
+) -> list[tuple[int, int]]:
+    """
+    値が異なる列の範囲を返す
+
+    Args:
+        row (list): 書き込む行の値
+        currentRow (list): 現在の行の値
+        columnCount (int): 比較する列数
+    Returns:
+        list[tuple[int, int]]: 連続する列の開始列番号と終了列番号(1始まり)
+    """
+    ranges: list[tuple[int, int]] = []
+    startColumn: Union[int, None] = None
+    for columnIndex in range(columnCount):
+        value: Any = row[columnIndex] if columnIndex < len(row) else None
+        currentValue: Any = (
+            currentRow[columnIndex] if columnIndex < len(currentRow) else None
+        )
+        if not _IsSameCellValue(value, currentValue):
+            if startColumn is None:
+                startColumn = columnIndex + 1
+
+            continue
+
+        if startColumn is not None:
+            ranges.append((startColumn, columnIndex))
+            startColumn = None
+
+    if startColumn is not None:
+        ranges.append((startColumn, columnCount))
+
+    return ranges
+
+
+def _GetDefaultRowFormats(
+    rowIndexes: set[int], columnCount: int
+) -> list[CellFormat]:
+    """
+    指定した行をデフォルトの書式に戻す書式を返す
+
+    Args:
+        rowIndexes (set[int]): 行番号
+        columnCount (int): 列数
+    Returns:
+        list[CellFormat]: デフォルトの書式
+    """
+    return [
+        {
+            "range": (
+                f"{rowcol_to_a1(rowIndex, 1)}:"
+                f"{rowcol_to_a1(rowIndex, columnCount)}"
+            ),
+            "format": {
+                "verticalAlignment": "MIDDLE",
+                "textFormat": DEFAULT_TEXT_FORMAT,
+            },
+        }
+        for rowIndex in sorted(rowIndexes)
+    ]
+
+
+def _GetHeaderFormat(columnCount: int) -> CellFormat:
+    """
+    ヘッダーの書式を返す
+
+    Args:
+        columnCount (int): 列数
+    Returns:
+        CellFormat: ヘッダーの書式
+    """
+    return {
+        "range": f"{rowcol_to_a1(1, 1)}:{rowcol_to_a1(1, columnCount)}",
+        "format": HORIZONTAL_ALIGNMENT_CENTER
+        | {
+            "verticalAlignment": "BOTTOM",
+            "textRotation": {"vertical": False},
+        },
+    }
+
+
+def _GetJsonSize(value: Any) -> int:
+    """
+    JSONに変換した際のバイト数を返す
+
+    Args:
+        value (Any): 値
+    Returns:
+        int: UTF-8でのバイト数
+    """
+    return len(dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+def _GetJsonListSize(sizes: list[int]) -> int:
+    """
+    要素のバイト数から、JSONの配列に変換した際のバイト数を返す
+
+    Args:
+        sizes (list[int]): 要素ごとのバイト数
+    Returns:
+        int: 区切り文字を含むバイト数
+    """
+    return len("[]") + sum(sizes) + len(", ") * max(len(sizes) - 1, 0)
+
+
+def _FilterFormatsByRows(
+    formats: list[CellFormat], rowIndexes: set[int]
+) -> list[CellFormat]:
+    """
+    指定した行に収まる書式のみを返す
+
+    Args:
+        formats (list[CellFormat]): 書式
+        rowIndexes (set[int]): 行番号
+    Returns:
+        list[CellFormat]: 指定した行に収まる書式
+    """
+    filteredFormats: list[CellFormat] = []
+    for cellFormat in formats:
+        gridRange: dict[str, int] = a1_range_to_grid_range(cellFormat["range"])
+        if all(
+            x in rowIndexes
+            for x in range(
+                gridRange["startRowIndex"] + 1,
+                gridRange["endRowIndex"] + 1,
+            )
+        ):
+            filteredFormats.append(cellFormat)
+
+    return filteredFormats
+
+
+def OptimizeFormats(formats: list[CellFormat]) -> list[CellFormat]:
+    """
+    書式を最適化する
+    同じ書式で隣接する範囲を1つの矩形にまとめ、重複する書式を除く
+    適用順序が結果に影響しないよう、間に別の書式が重なる場合はまとめない
+
+    Args:
+        formats (list[CellFormat]): 書式
+    Returns:
+        list[CellFormat]: 最適化した書式
+    """
+    # 範囲、書式の比較キー、書式
+    optimizedFormats: list[tuple[dict[str, int], str, CellFormat]] = []
+    # 書式の比較キーごとの位置(昇順)
+    indexesByKey: dict[str, list[int]] = {}
+    # 行ごとの、その行に掛かる書式の位置
+    # 行が指定されていない範囲は全行に掛かるものとして別に持つ
+    indexesByRow: dict[int, list[int]] = {}
+    unboundedRowIndexes: list[int] = []
+
+    for cellFormat in formats:
+        gridRange: dict[str, int] = a1_range_to_grid_range(cellFormat["range"])
+        formatKey: str = dumps(cellFormat["format"], sort_keys=True)
+        rows: Union[range, None] = _GetRows(gridRange)
+
+        # 重なる別の書式のうち最後のものより後ろにのみ移動できる
+        candidateIndexes: list[int] = list(unboundedRowIndexes)
+        if rows is None:
+            candidateIndexes = list(range(len(optimizedFormats)))
+        else:
+            for row in rows:
+                candidateIndexes.extend(indexesByRow.get(row, []))
+
+        barrierIndex: int = max(
+            (
+                x
+                for x in candidateIndexes
+                if optimizedFormats[x][1] != formatKey
+                and _IsOverlappedGridRanges(optimizedFormats[x][0], gridRange)
+            ),
+            default=-1,
+        )
+
+        isMerged: bool = False
+        for i in reversed(indexesByKey.get(formatKey, [])):
+            if i <= barrierIndex:
+                break
+
+            otherGridRange, _, otherFormat = optimizedFormats[i]
+            mergedGridRange: Union[dict[str, int], None] = _MergeGridRanges(
+                otherGridRange, gridRange
+            )
+            if mergedGridRange is None:
+                continue
+
+            optimizedFormats[i] = (
+                mergedGridRange,
+                formatKey,
+                (
+                    otherFormat
+                    if mergedGridRange == otherGridRange
+                    else {
+                        "range": _GridRangeToA1(mergedGridRange),
+                        "format": otherFormat["format"],
+                    }
+                ),
+            )
+            # 広がった行のみ追加する
+            # まとめた範囲は行と列が指定されている
+            for row in chain(
+                range(
+                    mergedGridRange["startRowIndex"],
+                    otherGridRange["startRowIndex"],
+                ),
+                range(
+                    otherGridRange["endRowIndex"],
+                    mergedGridRange["endRowIndex"],
+                ),
+            ):
+                indexesByRow.setdefault(row, []).append(i)
+
+            isMerged = True
+            break
+
+        if not isMerged:
+            index: int = len(optimizedFormats)
+            indexesByKey.setdefault(formatKey, []).append(index)
+            if rows is None:
+                unboundedRowIndexes.append(index)
+            else:
+                for row in rows:
+                    indexesByRow.setdefault(row, []).append(index)
+
+            optimizedFormats.append((gridRange, formatKey, cellFormat))
+
+    return [x[2] for x in optimizedFormats]
+
+
+def _GetRows(gridRange: dict[str, int]) -> Union[range, None]:
+    """
+    範囲の行のインデックスを返す
+
+    Args:
+        gridRange (dict[str, int]): 範囲
+    Returns:
+        Union[range, None]: 行のインデックス(0始まり)
+            行が指定されていない場合はNone
+    """
+    if "startRowIndex" not in gridRange or "endRowIndex" not in gridRange:
+        return None
+
+    return range(gridRange["startRowIndex"], gridRange["endRowIndex"])
+
+
+def _IsBoundedGridRange(gridRange: dict[str, int]) -> bool:
+    """
+    範囲の行と列がすべて指定されているか
+
+    Args:
+        gridRange (dict[str, int]): 範囲
+    Returns:
+        bool: True すべて指定されている
+    """
+    return all(
+        x in gridRange
+        for x in (
+            "startRowIndex",
+            "endRowIndex",
+            "startColumnIndex",
+            "endColumnIndex",
+        )
+    )
+
+
+def _IsOverlappedGridRanges(
+    gridRange1: dict[str, int], gridRange2: dict[str, int]
+) -> bool:
+    """
+    範囲が重なるか
+    行や列が指定されていない範囲は、シートの端までとして扱う
+
+    Args:
+        gridRange1 (dict[str, int]): 範囲
+        gridRange2 (dict[str, int]): 範囲
+    Returns:
+        bool: True 重なる
+    """
+    for start, end in (
+        ("startRowIndex", "endRowIndex"),
+        ("startColumnIndex", "endColumnIndex"),
+    ):
+        if gridRange1.get(start, 0) >= gridRange2.get(end, maxsize):
+            return False
+
+        if gridRange2.get(start, 0) >= gridRange1.get(end, maxsize):
+            return False
+
+    return True
+
+
+def _MergeGridRanges(
+    gridRange1: dict[str, int], gridRange2: dict[str, int]
+) -> Union[dict[str, int], None]:
+    """
+    2つの範囲を合わせた矩形を返す
+
+    Args:
+        gridRange1 (dict[str, int]): 範囲
+        gridRange2 (dict[str, int]): 範囲
+    Returns:
+        Union[dict[str, int], None]: 合わせた範囲
+            矩形にならない場合はNone
+    """
+    if not _IsBoundedGridRange(gridRange1) or not _IsBoundedGridRange(
+        gridRange2
+    ):
+        return None
+
+    for start, end, otherStart, otherEnd in (
+        ("startRowIndex", "endRowIndex", "startColumnIndex", "endColumnIndex"),
+        ("startColumnIndex", "endColumnIndex", "startRowIndex", "endRowIndex"),
+    ):
+        if (
+            gridRange1[otherStart] != gridRange2[otherStart]
+            or gridRange1[otherEnd] != gridRange2[otherEnd]
+        ):
+            continue
+
+        if (
+            gridRange1[start] > gridRange2[end]
+            or gridRange2[start] > gridRange1[end]
+        ):
+            # 離れている
+            continue
+
+        return gridRange1 | {
+            start: min(gridRange1[start], gridRange2[start]),
+            end: max(gridRange1[end], gridRange2[end]),
+        }
+
+    # 一方が他方に含まれる場合
+    if all(
+        gridRange1[x] <= gridRange2[x]
+        for x in ("startRowIndex", "startColumnIndex")
+    ) and all(
+        gridRange1[x] >= gridRange2[x]
+        for x in ("endRowIndex", "endColumnIndex")
+    ):
+        return gridRange1
+
+    if all(
+        gridRange2[x] <= gridRange1[x]
+        for x in ("startRowIndex", "startColumnIndex")
+    ) and all(
+        gridRange2[x] >= gridRange1[x]
+        for x in ("endRowIndex", "endColumnIndex")
+    ):
+        return gridRange2
+
+    return None
+
+
+def _GridRangeToA1(gridRange: dict[str, int]) -> str:
+    """
+    範囲をA1形式に変換する
+
+    Args:
+        gridRange (dict[str, int]): 範囲
+    Returns:
+        str: A1形式の範囲
+    """
+    startA1: str = rowcol_to_a1(
+        gridRange["startRowIndex"] + 1, gridRange["startColumnIndex"] + 1
+    )
+    endA1: str = rowcol_to_a1(
+        gridRange["endRowIndex"], gridRange["endColumnIndex"]
+    )
+    return f"{startA1}:{endA1}"
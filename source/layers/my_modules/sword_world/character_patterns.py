@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+from re import Pattern, compile
+from typing import Union
+
+from ..constants import sword_world
+from .style import Style
+
+"""
+PCの解析に使用するパターン
+モジュールの読み込み時に1回だけコンパイルする
+"""
+
+# フリガナ
+FURIGANA_PATTERN: Pattern[str] = compile(r"\|([^《]*)《[^》]*》")
+
+# 死亡時の備考
+DIED_PATTERN: Pattern[str] = compile("死亡")
+
+# マイナー種族(カッコの中身)
+MINOR_RACE_PATTERN: Pattern[str] = compile(r"(?<=（)(.+)(?=）)")
+
+# マイナー種族を含むカッコ
+MINOR_RACE_BRACKETS_PATTERN: Pattern[str] = compile(r"（.+）")
+
+# 一般技能名とカッコの中を分ける区切り
+GENERAL_SKILL_SEPARATOR_PATTERN: Pattern[str] = compile(r"[\(（《　]+")
+
+# 経歴から身長を抽出する
+# キーワードを含む行のみ置換し、後に一致したものを優先する
+HEIGHT_PATTERNS: list[tuple[str, Pattern[str]]] = [
+    (keyword, compile(rf".*{keyword}[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*"))
+    for keyword in ["身長", "背丈"]
+]
+
+# 経歴から体重を抽出する
+WEIGHT_PATTERNS: list[tuple[str, Pattern[str]]] = [
+    (keyword, compile(rf".*{keyword}[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*"))
+    for keyword in ["体重"]
+]
+
+# 流派ごとのキーワード
+_STYLE_PATTERNS: list[tuple[Style, Pattern[str]]] = [
+    (x, compile(x.GetKeywordsRegexp())) for x in sword_world.STYLES
+]
+
+# 全流派のキーワード
+_ALL_STYLES_PATTERN: Pattern[str] = compile(
+    "|".join(x.GetKeywordsRegexp() for x in sword_world.STYLES)
+)
+
+
+def FindStyle(string: str) -> Union[Style, None]:
+    """
+
+    引数が流派を表す文字列か調べ、一致する流派を返却する
+
+    Args:
+        string str: 確認する文字列
+
+    Returns:
+        Union[Style, None]: 存在する場合は流派、それ以外はNone
+    """
+
+    if not _ALL_STYLES_PATTERN.search(string):
+        # どの流派のキーワードも含まない
+        return None
+
+    # 複数の流派に一致する場合は先に定義した流派を優先する
+    for style, pattern in _STYLE_PATTERNS:
+        if pattern.search(string):
+            return style
+
+    return None
+
+
+def FindAbyssCurses(strings: list[str]) -> set[str]:
+    """
+
+    引数に含まれるアビスカースを返却する
+    全ての文字列を連結し、アビスカースごとに1回だけ検索する
+
+    Args:
+        strings list[str]: 確認する文字列
+
+    Returns:
+        set[str]: 引数に含まれるアビスカース
+    """
+
+    # アビスカースに含まれない改行で区切り、文字列をまたいで一致させない
+    text: str = "\n".join(strings)
+    return {x for x in sword_world.ABYSS_CURSES if x in text}
+
+
+def ExtractFreeNoteValue(
+    freeNote: str, patterns: list[tuple[str, Pattern[str]]]
+) -> Union[str, None]:
+    """
+
+    経歴の1行から数値を抽出する
+
+    Args:
+        freeNote str: 経歴の1行
+        patterns list[tuple[str, Pattern[str]]]: キーワードと抽出するパターン
+
+    Returns:
+        Union[str, None]: 抽出した数値、存在しない場合はNone
+    """
+
+    value: Union[str, None] = None
+    for keyword, pattern in patterns:
+        if keyword not in freeNote:
+            continue
+
+        replaced: str = pattern.sub(r"\1", freeNote)
+        if replaced != freeNote:
+            value = replaced
+
+    return value
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Iterable, Sequence
+
+from ..constants import sword_world
+from .player import Player
+from .player_character import PlayerCharacter
+
+"""
+PCの表
+"""
+
+
+class CharacterTable:
+    """
+    PCの表
+    全PLのPCを行、集計対象を列とし、列ごとの合計を求める
+    """
+
+    def __init__(self, players: list[Player]):
+        """
+        コンストラクタ
+
+        Args:
+            players (list[Player]): プレイヤー情報
+        """
+        self.Characters: list[PlayerCharacter] = [
+            y for x in players for y in x.Characters
+        ]
+
+    def CountLanguages(self) -> list[int]:
+        """
+        LANGUAGESの順に習得しているPCの数を返却する
+
+        Returns:
+            list[int]: PCの数
+        """
+        return _CountColumns(
+            (x.GetLanguageIndex() for x in self.Characters),
+            len(sword_world.LANGUAGES),
+        )
+
+    def CountCombatSkills(self) -> list[int]:
+        """
+        COMBAT_SKILLSの順に習得しているPCの数を返却する
+
+        Returns:
+            list[int]: PCの数
+        """
+        return _CountColumns(
+            (x.GetCombatSkillIndex() for x in self.Characters),
+            len(sword_world.COMBAT_SKILLS),
+        )
+
+    def CountGeneralSkills(self) -> list[int]:
+        """
+        OFFICIAL_GENERAL_SKILLSの順に習得しているPCの数を返却する
+
+        Returns:
+            list[int]: PCの数
+        """
+        return _CountColumns(
+            (x.GetGeneralSkillIndex() for x in self.Characters),
+            len(sword_world.OFFICIAL_GENERAL_SKILLS),
+        )
+
+    def CountStyles(self) -> list[int]:
+        """
+        STYLESの順に入門しているPCの数を返却する
+
+        Returns:
+            list[int]: PCの数
+        """
+        return _CountColumns(
+            (x.GetStyleIndex() for x in self.Characters),
+            len(sword_world.STYLES),
+        )
+
+    def CountAbyssCurses(self) -> list[int]:
+        """
+        ABYSS_CURSESの順にアビスカースを受けているPCの数を返却する
+
+        Returns:
+            list[int]: PCの数
+        """
+        return _CountColumns(
+            (x.GetAbyssCurseIndex() for x in self.Characters),
+            len(sword_world.ABYSS_CURSES),
+        )
+
+
+def _CountColumns(
+    rows: Iterable[Sequence[Any]], columnCount: int
+) -> list[int]:
+    """
+    列ごとにNoneとFalse以外の値の数を返却する
+
+    Args:
+        rows (Iterable[Sequence[Any]]): 行
+        columnCount (int): 列数
+    Returns:
+        list[int]: 列ごとの数
+    """
+    counts: list[int] = [sum(map(bool, x)) for x in zip(*rows)]
+    if len(counts) == 0:
+        # PCがいない
+        return [0] * columnCount
+
+    return counts
@@ -4,8 +4,16 @@
 戦闘特技
 """
 
+from typing import Union
+
 from my_modules.constants.sword_world import COMBAT_SKILLS
 
+# 前方一致検索用の戦闘特技名とCOMBAT_SKILLSのインデックス
+_COMBAT_SKILL_INDEXES: dict[str, int] = {
+    x: i for i, x in enumerate(COMBAT_SKILLS)
+}
+_MAX_COMBAT_SKILL_NAME_LENGTH: int = max(map(len, COMBAT_SKILLS))
+
 
 class CombatSkill:
     """
@@ -23,23 +31,20 @@ class CombatSkill:
             skillName str: スキル名
         """
         self.detail = ""
-        for combatSkill in COMBAT_SKILLS:
-            if combatSkill == skillName:
-                # スキル名と一致
-                self.SkillName = combatSkill
-                return
+        combatSkill: Union[str, None] = _FindLongestCombatSkillName(skillName)
+        if combatSkill is None:
+            raise ValueError(f"未対応の戦闘特技: {skillName}")
 
-            if skillName.startswith(combatSkill):
-                # スキル名が前方一致
-                self.SkillName = skillName
+        if combatSkill == skillName:
+            # スキル名と一致
+            self.SkillName = combatSkill
+            return
 
-                # 武器習熟や魔法拡大などの詳細部分のみを設定
-                self.detail = skillName.removeprefix(combatSkill).removeprefix(
-                    "／"
-                )
-                return
+        # スキル名が前方一致
+        self.SkillName = skillName
 
-        raise ValueError(f"未対応の戦闘特技: {skillName}")
+        # 武器習熟や魔法拡大などの詳細部分のみを設定
+        self.detail = skillName.removeprefix(combatSkill).removeprefix("／")
 
     def IsSameCombatSkill(self, skillName: str) -> bool:
         """
@@ -51,3 +56,65 @@ class CombatSkill:
             bool: 同じ戦闘特技の場合はTrue、それ以外はFalse
         """
         return self.SkillName.startswith(skillName)
+
+
+# 詳細のない戦闘特技(同じ戦闘特技は1つのインスタンスを共有する)
+_internedCombatSkills: dict[str, CombatSkill] = {}
+
+
+def GetCombatSkill(skillName: str) -> CombatSkill:
+    """
+    戦闘特技を返却する
+    詳細のない戦闘特技は生成済みのインスタンスを返却する
+
+    Args:
+        skillName str: スキル名
+    Returns:
+        CombatSkill: 戦闘特技
+    """
+    if skillName in _internedCombatSkills:
+        return _internedCombatSkills[skillName]
+
+    combatSkill: CombatSkill = CombatSkill(skillName)
+    if combatSkill.detail == "" and skillName in _COMBAT_SKILL_INDEXES:
+        _internedCombatSkills[skillName] = combatSkill
+
+    return combatSkill
+
+
+def GetCombatSkillIndexes(skillName: str) -> list[int]:
+    """
+    スキル名が前方一致する戦闘特技のCOMBAT_SKILLSのインデックスを返却する
+    IsSameCombatSkillがTrueになる戦闘特技と同じ
+
+    Args:
+        skillName str: スキル名
+    Returns:
+        list[int]: インデックス
+    """
+    return [
+        _COMBAT_SKILL_INDEXES[skillName[:length]]
+        for length in range(
+            min(len(skillName), _MAX_COMBAT_SKILL_NAME_LENGTH), 0, -1
+        )
+        if skillName[:length] in _COMBAT_SKILL_INDEXES
+    ]
+
+
+def _FindLongestCombatSkillName(skillName: str) -> Union[str, None]:
+    """
+    スキル名に前方一致する最も長い戦闘特技名を返却する
+
+    Args:
+        skillName str: スキル名
+    Returns:
+        Union[str, None]: 戦闘特技名、存在しない場合はNone
+    """
+    for length in range(
+        min(len(skillName), _MAX_COMBAT_SKILL_NAME_LENGTH), 0, -1
+    ):
+        if skillName[:length] in _COMBAT_SKILL_INDEXES:
+            return skillName[:length]
+
+    return None
+
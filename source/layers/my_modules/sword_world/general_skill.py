@@ -102,3 +102,26 @@ class GeneralSkill:
             self.SkillName == target.SkillName
             and self.DisplayJob == target.DisplayJob
         )
+
+
+@dataclass(frozen=True)
+class LearnedGeneralSkill:
+    """
+    PCが習得している一般技能
+    公式一般技能はOFFICIAL_GENERAL_SKILLSのインスタンスを共有する
+    Attributes:
+        Skill GeneralSkill: 一般技能
+        Level int: レベル
+    """
+
+    Skill: GeneralSkill
+    Level: int
+
+    def getFormattedSkillAndLevel(self) -> str:
+        """
+        整形した一般技能情報を返す
+
+        Returns:
+            str: 整形した一般技能情報
+        """
+        return f"{self.Skill.getFormattedSkill()} : {self.Level}"
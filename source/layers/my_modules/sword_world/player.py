@@ -3,6 +3,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Union
 
 from .exp_status import ExpStatus
 from .player_character import PlayerCharacter
@@ -34,6 +35,9 @@ class Player:
         self.Name: str = name
         self.Characters: list[PlayerCharacter] = characters
 
+        # 全PCのGMしたシナリオのキー(初回参照時に作成)
+        self._gameMasterScenarioKeys: Union[set[str], None] = None
+
     def CountActivePlayerCharacters(self) -> int:
         """
 
@@ -83,12 +87,13 @@ class Player:
         Returns:
             int: GM回数
         """
-        gameMasterScenarioKeys: list[str] = []
-        for character in self.Characters:
-            gameMasterScenarioKeys.extend(character.GameMasterScenarioKeys)
+        if self._gameMasterScenarioKeys is None:
+            # 同一シナリオの重複を排除
+            self._gameMasterScenarioKeys = set().union(
+                *(x.GameMasterScenarioKeys for x in self.Characters)
+            )
 
-        # 同一シナリオの重複を排除してGM回数を集計
-        return len(set(gameMasterScenarioKeys))
+        return len(self._gameMasterScenarioKeys)
 
     def GetUpdateDatetime(self) -> datetime:
         """最終更新日時を取得
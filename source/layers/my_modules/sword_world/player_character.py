@@ -1,21 +1,35 @@
 # -*- coding: utf-8 -*-
 
-from copy import deepcopy
-from dataclasses import dataclass
 from datetime import datetime
-from re import Match, search, split, sub
-from typing import Union
+from re import Match
+from typing import Any, Union
 from unicodedata import normalize
 
 from my_modules.constants.sword_world import RACES
-from my_modules.sword_world.combat_skill import CombatSkill
+from my_modules.sword_world.combat_skill import (
+    CombatSkill,
+    GetCombatSkill,
+    GetCombatSkillIndexes,
+)
 from my_modules.sword_world.language import Language
 from my_modules.sword_world.race import Race
 
 from ..constants import sword_world
+from .character_patterns import (
+    DIED_PATTERN,
+    FURIGANA_PATTERN,
+    GENERAL_SKILL_SEPARATOR_PATTERN,
+    HEIGHT_PATTERNS,
+    MINOR_RACE_BRACKETS_PATTERN,
+    MINOR_RACE_PATTERN,
+    WEIGHT_PATTERNS,
+    ExtractFreeNoteValue,
+    FindAbyssCurses,
+    FindStyle,
+)
 from .combat_ability import CombatAbility
 from .exp_status import ExpStatus
-from .general_skill import GeneralSkill
+from .general_skill import GeneralSkill, LearnedGeneralSkill
 from .status import Status
 from .style import Style
 
@@ -23,6 +37,33 @@ from .style import Style
 PC
 """
 
+# 公式一般技能ごとのOFFICIAL_GENERAL_SKILLSのインデックス
+_OFFICIAL_GENERAL_SKILL_INDEXES: dict[tuple[str, str], int] = {
+    (x.SkillName, x.DisplayJob): i
+    for i, x in enumerate(sword_world.OFFICIAL_GENERAL_SKILLS)
+}
+
+# 種族名ごとの種族
+_RACES: dict[str, Race] = {x.Name: x for x in RACES}
+
+# スキル名・職業名・キーワードごとのOFFICIAL_GENERAL_SKILLSのインデックス
+# 複数の公式一般技能に一致する場合は先に定義したものを優先する
+_OFFICIAL_GENERAL_SKILL_NAME_INDEXES: dict[str, int] = {
+    y: i
+    for i, x in reversed(list(enumerate(sword_world.OFFICIAL_GENERAL_SKILLS)))
+    for y in [x.SkillName, *x.keywords]
+}
+
+# 流派名ごとのSTYLESのインデックス
+_STYLE_INDEXES: dict[str, int] = {
+    x.Name: i for i, x in enumerate(sword_world.STYLES)
+}
+
+# アビスカースごとのABYSS_CURSESのインデックス
+_ABYSS_CURSE_INDEXES: dict[str, int] = {
+    x: i for i, x in enumerate(sword_world.ABYSS_CURSES)
+}
+
 # 自分が開催したときのGM名
 _SELF_GAME_MASTER_NAMES: list[str] = [
     "俺",
@@ -30,16 +71,78 @@ _SELF_GAME_MASTER_NAMES: list[str] = [
     "自分",
 ]
 
-# 死亡時の備考
-_DIED_REGEXP: str = "死亡"
-
 
-@dataclass
 class PlayerCharacter:
     """
     PC
+    構築後は公開属性を変更できない
+    流派・アビスカース・一般技能・身長・体重は初回参照時に解析する
     """
 
+    __slots__ = (
+        "UpdateDatetime",
+        "YtsheetId",
+        "Race",
+        "Age",
+        "Gender",
+        "Birth",
+        "CombatFeatsLv1",
+        "CombatFeatsLv3",
+        "CombatFeatsLv5",
+        "CombatFeatsLv7",
+        "CombatFeatsLv9",
+        "CombatFeatsLv11",
+        "CombatFeatsLv13",
+        "CombatFeatsLv1bat",
+        "AdventurerRank",
+        "Level",
+        "Exp",
+        "GrowthTimes",
+        "TotalHonor",
+        "Hp",
+        "Mp",
+        "LifeResistance",
+        "SpiritResistance",
+        "MonsterKnowledge",
+        "Initiative",
+        "HistoryMoneyTotal",
+        "Sin",
+        "MajorRace",
+        "LearnedLanguages",
+        "Name",
+        "ActiveStatus",
+        "Faith",
+        "AutoCombatFeats",
+        "CombatAbilities",
+        "Dexterity",
+        "Agility",
+        "Strength",
+        "Vitality",
+        "Intelligence",
+        "Mental",
+        "Accuracy",
+        "Evasion",
+        "GameMasterScenarioKeys",
+        "PlayerTimes",
+        "DiedTimes",
+        "_characterJson",
+        "_styles",
+        "_abyssCurses",
+        "_generalSkills",
+        "_height",
+        "_weight",
+        "_combatSkillIndex",
+        "_languageIndex",
+        "_generalSkillIndex",
+        "_styleIndex",
+        "_abyssCurseIndex",
+        "_combatSkills",
+        "_languages",
+        "_isBattleDancer",
+        "_isVagrants",
+        "_isFrozen",
+    )
+
     def __init__(
         self,
         characterJson: dict,
@@ -58,8 +161,60 @@ class PlayerCharacter:
             minimumExp int: 最小経験点
             updateTime datetime: 最終更新日時
         """
+        # 構築が終わるまでは公開属性を変更できる
+        self._isFrozen: bool = False
+
         self.UpdateDatetime: datetime = updateTime
 
+        # 初回参照時に解析する項目の元データ
+        self._characterJson: dict = characterJson
+
+        # 流派(初回参照時に解析)
+        self._styles: Union[tuple[Style, ...], None] = None
+
+        # アビスカース(初回参照時に解析)
+        self._abyssCurses: Union[tuple[str, ...], None] = None
+
+        # 一般技能(初回参照時に解析)
+        self._generalSkills: Union[tuple[LearnedGeneralSkill, ...], None] = (
+            None
+        )
+
+        # 身長・体重(初回参照時に解析)
+        self._height: Union[str, None] = None
+        self._weight: Union[str, None] = None
+
+        # COMBAT_SKILLSの順に並べた戦闘特技(初回参照時に作成)
+        self._combatSkillIndex: Union[
+            tuple[Union[CombatSkill, None], ...], None
+        ] = None
+
+        # LANGUAGESの順に並べた言語(初回参照時に作成)
+        self._languageIndex: Union[tuple[Union[Language, None], ...], None] = (
+            None
+        )
+
+        # OFFICIAL_GENERAL_SKILLSの順に並べた一般技能(初回参照時に作成)
+        self._generalSkillIndex: Union[
+            tuple[Union[LearnedGeneralSkill, None], ...], None
+        ] = None
+
+        # STYLESの順に並べた入門状況(初回参照時に作成)
+        self._styleIndex: Union[tuple[bool, ...], None] = None
+
+        # ABYSS_CURSESの順に並べたアビスカースの有無(初回参照時に作成)
+        self._abyssCurseIndex: Union[tuple[bool, ...], None] = None
+
+        # 習得済みの戦闘特技(初回参照時に作成)
+        self._combatSkills: Union[tuple[CombatSkill, ...], None] = None
+
+        # 習得済みの言語(初回参照時に作成)
+        self._languages: Union[tuple[Language, ...], None] = None
+
+        # バトルダンサー・ヴァグランツかどうか(初回参照時に判定)
+        self._isBattleDancer: Union[bool, None] = None
+        self._isVagrants: Union[bool, None] = None
+
         # 文字列
         self.YtsheetId: str = characterJson["id"]
         self.Race: str = characterJson.get("race", "")
@@ -68,33 +223,43 @@ class PlayerCharacter:
         self.Birth: str = characterJson.get("birth", "")
         self.CombatFeatsLv1: Union[CombatSkill, None] = None
         if "combatFeatsLv1" in characterJson:
-            self.CombatFeatsLv1 = CombatSkill(characterJson["combatFeatsLv1"])
+            self.CombatFeatsLv1 = GetCombatSkill(
+                characterJson["combatFeatsLv1"]
+            )
 
         self.CombatFeatsLv3: Union[CombatSkill, None] = None
         if "combatFeatsLv3" in characterJson:
-            self.CombatFeatsLv3 = CombatSkill(characterJson["combatFeatsLv3"])
+            self.CombatFeatsLv3 = GetCombatSkill(
+                characterJson["combatFeatsLv3"]
+            )
         self.CombatFeatsLv5: Union[CombatSkill, None] = None
         if "combatFeatsLv5" in characterJson:
-            self.CombatFeatsLv5 = CombatSkill(characterJson["combatFeatsLv5"])
+            self.CombatFeatsLv5 = GetCombatSkill(
+                characterJson["combatFeatsLv5"]
+            )
         self.CombatFeatsLv7: Union[CombatSkill, None] = None
         if "combatFeatsLv7" in characterJson:
-            self.CombatFeatsLv7 = CombatSkill(characterJson["combatFeatsLv7"])
+            self.CombatFeatsLv7 = GetCombatSkill(
+                characterJson["combatFeatsLv7"]
+            )
         self.CombatFeatsLv9: Union[CombatSkill, None] = None
         if "combatFeatsLv9" in characterJson:
-            self.CombatFeatsLv9 = CombatSkill(characterJson["combatFeatsLv9"])
+            self.CombatFeatsLv9 = GetCombatSkill(
+                characterJson["combatFeatsLv9"]
+            )
         self.CombatFeatsLv11: Union[CombatSkill, None] = None
         if "combatFeatsLv11" in characterJson:
-            self.CombatFeatsLv11 = CombatSkill(
+            self.CombatFeatsLv11 = GetCombatSkill(
                 characterJson["combatFeatsLv11"]
             )
         self.CombatFeatsLv13: Union[CombatSkill, None] = None
         if "combatFeatsLv13" in characterJson:
-            self.CombatFeatsLv13 = CombatSkill(
+            self.CombatFeatsLv13 = GetCombatSkill(
                 characterJson["combatFeatsLv13"]
             )
         self.CombatFeatsLv1bat: Union[CombatSkill, None] = None
         if "combatFeatsLv1bat" in characterJson:
-            self.CombatFeatsLv1bat = CombatSkill(
+            self.CombatFeatsLv1bat = GetCombatSkill(
                 characterJson["combatFeatsLv1bat"]
             )
         self.AdventurerRank: str = characterJson.get("rank", "")
@@ -122,17 +287,15 @@ class PlayerCharacter:
         self.Sin: str = characterJson.get("sin", "0")
 
         # メジャー種族
-        majorRace: Union[Race, None] = next(
-            (x for x in RACES if x.Name == self.GetMajorRace()),
-            None,
-        )
+        majorRaceName: str = self.GetMajorRace()
+        majorRace: Union[Race, None] = _RACES.get(majorRaceName)
         if majorRace is None:
-            raise ValueError(f"不正な種族 : {self.GetMajorRace()}")
+            raise ValueError(f"不正な種族 : {majorRaceName}")
 
         self.MajorRace: Race = majorRace
 
         # 言語(生まれつき習得しているものを除く)
-        self.LearnedLanguages: list[Language] = []
+        learnedLanguages: list[Language] = []
         languageNum: int = int(characterJson.get("languageNum", "0"))
         for i in range(1, languageNum + 1):
             languageName: str = characterJson.get(f"language{i}", "")
@@ -144,14 +307,15 @@ class PlayerCharacter:
             canRead: bool = characterJson.get(f"language{i}Read", "") != ""
             if canTalk or canRead:
                 # 会話か読文が可能なものを設定する
-                self.LearnedLanguages.append(
+                learnedLanguages.append(
                     Language(languageName, canTalk, canRead)
                 )
 
+        self.LearnedLanguages: tuple[Language, ...] = tuple(learnedLanguages)
+
         # PC名
         # フリガナを削除
-        self.Name: str = sub(
-            r"\|([^《]*)《[^》]*》",
+        self.Name: str = FURIGANA_PATTERN.sub(
             r"\1",
             characterJson.get("characterName", ""),
         )
@@ -172,19 +336,23 @@ class PlayerCharacter:
             self.Faith = characterJson.get("faithOther", self.Faith)
 
         # 自動取得
-        self.AutoCombatFeats: list[CombatSkill] = []
+        self.AutoCombatFeats: tuple[CombatSkill, ...] = ()
         if "combatFeatsAuto" in characterJson:
-            for skillName in characterJson["combatFeatsAuto"].split(","):
-                self.AutoCombatFeats.append(CombatSkill(skillName))
+            self.AutoCombatFeats = tuple(
+                GetCombatSkill(x)
+                for x in characterJson["combatFeatsAuto"].split(",")
+            )
 
         # 技能レベル
-        self.CombatAbilities: list[CombatAbility] = []
+        combatAbilities: list[CombatAbility] = []
         for key, skillName in sword_world.COMBAT_ABILITIES.items():
             skillLevel: int = int(characterJson.get(key, "0"))
             if skillLevel > 0:
-                self.CombatAbilities.append(
-                    CombatAbility(skillName, skillLevel)
-                )
+                combatAbilities.append(CombatAbility(skillName, skillLevel))
+
+        self.CombatAbilities: tuple[CombatAbility, ...] = tuple(
+            combatAbilities
+        )
 
         # 各能力値
         self.Dexterity: Status = Status(
@@ -224,42 +392,9 @@ class PlayerCharacter:
             int(characterJson.get("sttEquipF", "0")),
         )
 
-        # 秘伝
-        self.Styles: list[Style] = []
-        mysticArtsNum: int = int(characterJson.get("mysticArtsNum", "0"))
-        for i in range(1, mysticArtsNum + 1):
-            style: Union[Style, None] = _FindStyle(
-                characterJson.get(f"mysticArts{i}", "")
-            )
-            if style is not None and style not in self.Styles:
-                self.Styles.append(style)
-
-        # 秘伝魔法
-        mysticMagicNum: int = int(characterJson.get("mysticMagicNum", "0"))
-        for i in range(1, mysticMagicNum + 1):
-            style = _FindStyle(characterJson.get(f"mysticMagic{i}", ""))
-            if style is not None and style not in self.Styles:
-                self.Styles.append(style)
-
-        # 名誉アイテム
-        honorItemsNum: int = int(characterJson.get("honorItemsNum", "0"))
-        for i in range(1, honorItemsNum + 1):
-            style = _FindStyle(characterJson.get(f"honorItem{i}", ""))
-            if style is not None and style not in self.Styles:
-                self.Styles.append(style)
-
-        # 不名誉詳細
-        disHonorItemsNum: int = int(characterJson.get("dishonorItemsNum", "0"))
-        for i in range(1, disHonorItemsNum + 1):
-            style = _FindStyle(characterJson.get(f"dishonorItem{i}", ""))
-            if style is not None and style not in self.Styles:
-                self.Styles.append(style)
-
         # 武器
         self.Accuracy: int = 0
-        self.AbyssCurses: list[str] = []
         weaponNum: int = int(characterJson.get("weaponNum", "0"))
-
         for i in range(1, weaponNum + 1):
             # 命中
             self.Accuracy = max(
@@ -267,24 +402,6 @@ class PlayerCharacter:
                 int(characterJson.get(f"weapon{i}AccTotal", "0")),
             )
 
-            # アビスカース
-            self.AbyssCurses += _FindAbyssCurses(
-                characterJson.get(f"weapon{i}Name", "")
-            )
-            self.AbyssCurses += _FindAbyssCurses(
-                characterJson.get(f"weapon{i}Note", "")
-            )
-
-        # 鎧
-        armourNum: int = int(characterJson.get("armourNum", "0"))
-        for i in range(1, armourNum + 1):
-            self.AbyssCurses += _FindAbyssCurses(
-                characterJson.get(f"armour{i}Name", "")
-            )
-            self.AbyssCurses += _FindAbyssCurses(
-                characterJson.get(f"armour{i}Note", "")
-            )
-
         # 回避合計など
         self.Evasion: int = 0
         defenseNum: int = int(characterJson.get("defenseNum", "0"))
@@ -295,8 +412,210 @@ class PlayerCharacter:
                 int(characterJson.get(f"defenseTotal{i}Eva", "0")),
             )
 
+        # セッション履歴を集計
+        gameMasterScenarioKeys: list[str] = []
+
+        # 日付ごとのGM回数
+        gameMasterCounts: dict[str, int] = {}
+        self.PlayerTimes: int = 0
+        self.DiedTimes: int = 0
+        historyNum: int = int(characterJson.get("historyNum", "0"))
+        for i in range(1, historyNum + 1):
+            gameMaster: str = characterJson.get(f"history{i}Gm", "")
+            if gameMaster == "":
+                continue
+
+            # 参加、GM回数を集計
+            if (
+                gameMaster == playerName
+                or gameMaster in _SELF_GAME_MASTER_NAMES
+            ):
+                # 複数PC所持PLのGM回数集計のため、シナリオごとに一意のキーを作成
+                date: str = characterJson.get(f"history{i}Date", "")
+                count: int = gameMasterCounts.get(date, 0)
+                gameMasterCounts[date] = count + 1
+
+                # 重複を避けるため、同一日の場合は連番を付与
+                gameMasterScenarioKeys.append(f"{date}_{count}")
+            else:
+                self.PlayerTimes += 1
+
+            # 備考
+            if DIED_PATTERN.search(characterJson.get(f"history{i}Note", "")):
+                # 死亡回数を集計
+                self.DiedTimes += 1
+
+        self.GameMasterScenarioKeys: tuple[str, ...] = tuple(
+            gameMasterScenarioKeys
+        )
+
+        # 以降は公開属性の変更を禁止する
+        self._isFrozen = True
+
+    def __setattr__(self, name: str, value: Any):
+        """
+        構築後の公開属性の変更を禁止する
+        初回参照時に作成する非公開属性のみ変更できる
+
+        Args:
+            name str: 属性名
+            value Any: 値
+        """
+        if not name.startswith("_") and self._isFrozen:
+            raise AttributeError(f"PCの属性は変更できません : {name}")
+
+        super().__setattr__(name, value)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        保存する状態を返却する
+        初回参照時に解析する項目は解析してから保存し、元データは保存しない
+
+        Returns:
+            dict[str, Any]: 属性名をキーとした値
+        """
+        # 復元後は元データがないため、全て解析しておく
+        self.Styles
+        self.AbyssCurses
+        self.GeneralSkills
+        self.Height
+        return {
+            x: getattr(self, x)
+            for x in self.__slots__
+            if x != "_characterJson" and hasattr(self, x)
+        }
+
+    def __setstate__(self, state: dict[str, Any]):
+        """
+        保存した状態から復元する
+
+        Args:
+            state dict[str, Any]: __getstate__で返却した状態
+        """
+        # 公開属性は変更できないため、直接設定する
+        object.__setattr__(self, "_characterJson", {})
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def Styles(self) -> tuple[Style, ...]:
+        """
+        流派
+
+        Returns:
+            tuple[Style, ...]: 秘伝・名誉アイテムなどから判定した流派
+        """
+        if self._styles is None:
+            self._styles = self._ParseStyles()
+
+        return self._styles
+
+    @property
+    def AbyssCurses(self) -> tuple[str, ...]:
+        """
+        アビスカース
+
+        Returns:
+            tuple[str, ...]: 装備・所持品などに含まれるアビスカース
+        """
+        if self._abyssCurses is None:
+            self._abyssCurses = self._ParseAbyssCurses()
+
+        return self._abyssCurses
+
+    @property
+    def GeneralSkills(self) -> tuple[LearnedGeneralSkill, ...]:
+        """
+        一般技能
+
+        Returns:
+            tuple[LearnedGeneralSkill, ...]: 一般技能
+        """
+        if self._generalSkills is None:
+            self._generalSkills = self._ParseGeneralSkills()
+
+        return self._generalSkills
+
+    @property
+    def Height(self) -> str:
+        """
+        身長
+
+        Returns:
+            str: 経歴から抽出した身長
+        """
+        if self._height is None or self._weight is None:
+            self._height, self._weight = self._ParseFreeNote()
+
+        return self._height
+
+    @property
+    def Weight(self) -> str:
+        """
+        体重
+
+        Returns:
+            str: 経歴から抽出した体重
+        """
+        if self._height is None or self._weight is None:
+            self._height, self._weight = self._ParseFreeNote()
+
+        return self._weight
+
+    def _ParseStyles(self) -> tuple[Style, ...]:
+        """
+        秘伝・秘伝魔法・名誉アイテム・不名誉詳細から流派を解析する
+
+        Returns:
+            tuple[Style, ...]: 流派
+        """
+        characterJson: dict = self._characterJson
+        styles: list[Style] = []
+        for numKey, key in [
+            # 秘伝
+            ("mysticArtsNum", "mysticArts"),
+            # 秘伝魔法
+            ("mysticMagicNum", "mysticMagic"),
+            # 名誉アイテム
+            ("honorItemsNum", "honorItem"),
+            # 不名誉詳細
+            ("dishonorItemsNum", "dishonorItem"),
+        ]:
+            for i in range(1, int(characterJson.get(numKey, "0")) + 1):
+                style: Union[Style, None] = FindStyle(
+                    characterJson.get(f"{key}{i}", "")
+                )
+                if style is not None and style not in styles:
+                    styles.append(style)
+
+        return tuple(styles)
+
+    def _ParseAbyssCurses(self) -> tuple[str, ...]:
+        """
+        武器・鎧・所持品・自由記入の表からアビスカースを解析する
+
+        Returns:
+            tuple[str, ...]: アビスカース
+        """
+        characterJson: dict = self._characterJson
+
+        # アビスカースを検索する文字列
+        abyssCurseTexts: list[str] = []
+
+        # 武器
+        weaponNum: int = int(characterJson.get("weaponNum", "0"))
+        for i in range(1, weaponNum + 1):
+            abyssCurseTexts.append(characterJson.get(f"weapon{i}Name", ""))
+            abyssCurseTexts.append(characterJson.get(f"weapon{i}Note", ""))
+
+        # 鎧
+        armourNum: int = int(characterJson.get("armourNum", "0"))
+        for i in range(1, armourNum + 1):
+            abyssCurseTexts.append(characterJson.get(f"armour{i}Name", ""))
+            abyssCurseTexts.append(characterJson.get(f"armour{i}Note", ""))
+
         # 所持品
-        self.AbyssCurses += _FindAbyssCurses(characterJson.get("items", ""))
+        abyssCurseTexts.append(characterJson.get("items", ""))
 
         # 自由記入の表
         effectBoxNum: int = int(characterJson.get("effectBoxNum", "0"))
@@ -311,15 +630,20 @@ class PlayerCharacter:
 
             effectNum: int = int(characterJson.get(f"effect{i}Num", "0"))
             for j in range(1, effectNum + 1):
-                self.AbyssCurses += _FindAbyssCurses(
-                    characterJson.get(f"effect{i}-{j}", "")
-                )
+                abyssCurseTexts.append(characterJson.get(f"effect{i}-{j}", ""))
 
-        # 重複を削除
-        self.AbyssCurses = list(set(self.AbyssCurses))
+        # 全ての文字列をまとめて検索
+        return tuple(FindAbyssCurses(abyssCurseTexts))
 
-        # 一般技能
-        self.GeneralSkills: list[GeneralSkill] = []
+    def _ParseGeneralSkills(self) -> tuple[LearnedGeneralSkill, ...]:
+        """
+        一般技能を解析する
+
+        Returns:
+            tuple[LearnedGeneralSkill, ...]: 一般技能
+        """
+        characterJson: dict = self._characterJson
+        generalSkills: list[LearnedGeneralSkill] = []
         for i in range(1, int(characterJson.get("commonClassNum", "0")) + 1):
             ytsheetGeneralSkillName: str = characterJson.get(
                 f"commonClass{i}", ""
@@ -328,8 +652,7 @@ class PlayerCharacter:
                 continue
 
             # カッコの中と外で分割
-            skillNameAndJob: list[str] = split(
-                r"[\(（《　]+",
+            skillNameAndJob: list[str] = GENERAL_SKILL_SEPARATOR_PATTERN.split(
                 ytsheetGeneralSkillName.removeprefix("|")
                 .removesuffix(")")
                 .removesuffix("）")
@@ -339,98 +662,58 @@ class PlayerCharacter:
             generalSkillLevel: int = int(
                 characterJson.get(f"lvCommon{i}", "0")
             )
-            officialGeneralSkill: Union[GeneralSkill, None] = next(
-                filter(
-                    lambda x: x.compareWithListOfStr(skillNameAndJob),
-                    sword_world.OFFICIAL_GENERAL_SKILLS,
-                ),
-                None,
-            )
-            if officialGeneralSkill is None:
+            officialIndexes: list[int] = [
+                _OFFICIAL_GENERAL_SKILL_NAME_INDEXES[x]
+                for x in skillNameAndJob
+                if x in _OFFICIAL_GENERAL_SKILL_NAME_INDEXES
+            ]
+            if len(officialIndexes) == 0:
                 # オリジナル一般技能
-                self.GeneralSkills.append(
-                    GeneralSkill(
-                        skillNameAndJob[0],
-                        skillNameAndJob[1] if len(skillNameAndJob) > 1 else "",
-                        generalSkillLevel,
-                        True,
-                    )
+                generalSkill: GeneralSkill = GeneralSkill(
+                    skillNameAndJob[0],
+                    skillNameAndJob[1] if len(skillNameAndJob) > 1 else "",
+                    IsOriginal=True,
                 )
             else:
                 # 公式一般技能
-                copiedOfficialGeneralSkill = deepcopy(officialGeneralSkill)
-                copiedOfficialGeneralSkill.Level = generalSkillLevel
-                self.GeneralSkills.append(copiedOfficialGeneralSkill)
+                generalSkill = sword_world.OFFICIAL_GENERAL_SKILLS[
+                    min(officialIndexes)
+                ]
 
-        # セッション履歴を集計
-        self.GameMasterScenarioKeys: list[str] = []
-        self.PlayerTimes: int = 0
-        self.DiedTimes: int = 0
-        historyNum: int = int(characterJson.get("historyNum", "0"))
-        for i in range(1, historyNum + 1):
-            gameMaster: str = characterJson.get(f"history{i}Gm", "")
-            if gameMaster == "":
-                continue
-
-            # 参加、GM回数を集計
-            if (
-                gameMaster == playerName
-                or gameMaster in _SELF_GAME_MASTER_NAMES
-            ):
-                # 複数PC所持PLのGM回数集計のため、シナリオごとに一意のキーを作成
-                date: str = characterJson.get(f"history{i}Date", "")
-                count: int = len(
-                    [
-                        x
-                        for x in self.GameMasterScenarioKeys
-                        if x.startswith(date)
-                    ]
-                )
+            generalSkills.append(
+                LearnedGeneralSkill(generalSkill, generalSkillLevel)
+            )
 
-                # 重複を避けるため、同一日の場合は連番を付与
-                self.GameMasterScenarioKeys.append(f"{date}_{count}")
-            else:
-                self.PlayerTimes += 1
+        return tuple(generalSkills)
 
-            # 備考
-            if search(_DIED_REGEXP, characterJson.get(f"history{i}Note", "")):
-                # 死亡回数を集計
-                self.DiedTimes += 1
+    def _ParseFreeNote(self) -> tuple[str, str]:
+        """
+        経歴から身長・体重を解析する
 
+        Returns:
+            tuple[str, str]: 身長と体重、記載がない場合は空文字
+        """
         # 経歴を1行ごとに分割
-        freeNotes: list[str] = characterJson.get("freeNote", "").split(
+        freeNotes: list[str] = self._characterJson.get("freeNote", "").split(
             "&lt;br&gt;"
         )
 
-        self.Height: str = ""
-        self.Weight: str = ""
+        heightResult: str = ""
+        weightResult: str = ""
         for freeNote in freeNotes:
-            if "身長" in freeNote:
-                height: str = sub(
-                    r".*身長[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*",
-                    r"\1",
-                    freeNote,
-                )
-                if height != freeNote:
-                    self.Height = normalize("NFKC", height)
-
-            if "背丈" in freeNote:
-                height = sub(
-                    r".*背丈[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*",
-                    r"\1",
-                    freeNote,
-                )
-                if height != freeNote:
-                    self.Height = normalize("NFKC", height)
-
-            if "体重" in freeNote:
-                weight: str = sub(
-                    r".*体重[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*",
-                    r"\1",
-                    freeNote,
-                )
-                if weight != freeNote:
-                    self.Weight = normalize("NFKC", weight)
+            height: Union[str, None] = ExtractFreeNoteValue(
+                freeNote, HEIGHT_PATTERNS
+            )
+            if height is not None:
+                heightResult = normalize("NFKC", height)
+
+            weight: Union[str, None] = ExtractFreeNoteValue(
+                freeNote, WEIGHT_PATTERNS
+            )
+            if weight is not None:
+                weightResult = normalize("NFKC", weight)
+
+        return heightResult, weightResult
 
     def GetMinorRace(self) -> str:
         """
@@ -445,8 +728,8 @@ class PlayerCharacter:
             # 特定種族はかっこをつけたまま返却
             return self.Race
 
-        minorRaceMatch: Union[Match[str], None] = search(
-            r"(?<=（)(.+)(?=）)", self.Race
+        minorRaceMatch: Union[Match[str], None] = MINOR_RACE_PATTERN.search(
+            self.Race
         )
         if minorRaceMatch is None:
             # カッコなしなのでそのまま返却
@@ -464,7 +747,7 @@ class PlayerCharacter:
             str: メジャー種族
         """
 
-        return sub(r"（.+）", "", self.Race)
+        return MINOR_RACE_BRACKETS_PATTERN.sub("", self.Race)
 
     def IsBattleDancer(self) -> bool:
         """
@@ -475,13 +758,16 @@ class PlayerCharacter:
             bool: True バトルダンサー
         """
 
-        return any(
-            map(
-                lambda x: x.SkillName
-                == sword_world.BATTLE_DANCER_ABILITY_NAME,
-                self.CombatAbilities,
+        if self._isBattleDancer is None:
+            self._isBattleDancer = any(
+                map(
+                    lambda x: x.SkillName
+                    == sword_world.BATTLE_DANCER_ABILITY_NAME,
+                    self.CombatAbilities,
+                )
             )
-        )
+
+        return self._isBattleDancer
 
     def IsVagrants(self) -> bool:
         """
@@ -492,113 +778,18 @@ class PlayerCharacter:
             bool: True ヴァグランツ
         """
 
-        if self.IsBattleDancer() and any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv1bat is not None
-                    and self.CombatFeatsLv1bat.IsSameCombatSkill(x),
-                    sword_world.VAGRANTS_COMBAT_SKILLS,
-                )
+        if self._isVagrants is None:
+            # 自動取得以外の習得済み戦闘特技
+            learnedCombatSkills: tuple[CombatSkill, ...] = (
+                self.GetCombatSkills()[len(self.AutoCombatFeats) :]
             )
-        ):
-            return True
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv1 is not None
-                    and self.CombatFeatsLv1.IsSameCombatSkill(x),
-                    sword_world.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
-
-        if self.Level < 3:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv3 is not None
-                    and self.CombatFeatsLv3.IsSameCombatSkill(x),
-                    sword_world.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
-
-        if self.Level < 5:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv5 is not None
-                    and self.CombatFeatsLv5.IsSameCombatSkill(x),
-                    sword_world.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
-
-        if self.Level < 7:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv7 is not None
-                    and self.CombatFeatsLv7.IsSameCombatSkill(x),
-                    sword_world.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
-
-        if self.Level < 9:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv9 is not None
-                    and self.CombatFeatsLv9.IsSameCombatSkill(x),
-                    sword_world.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
-
-        if self.Level < 11:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv11 is not None
-                    and self.CombatFeatsLv11.IsSameCombatSkill(x),
-                    sword_world.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
-
-        if self.Level < 13:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv13 is not None
-                    and self.CombatFeatsLv13.IsSameCombatSkill(x),
-                    sword_world.VAGRANTS_COMBAT_SKILLS,
-                )
+            self._isVagrants = any(
+                x.IsSameCombatSkill(y)
+                for x in learnedCombatSkills
+                for y in sword_world.VAGRANTS_COMBAT_SKILLS
             )
-        ):
-            return True
 
-        return False
+        return self._isVagrants
 
     def GetYtsheetUrl(self) -> str:
         """
@@ -632,114 +823,163 @@ class PlayerCharacter:
         Returns:
             Union[CombatSkill, None]: 戦闘特技、存在しない場合はNone
         """
+        if skillName in sword_world.COMBAT_SKILLS:
+            return self.GetCombatSkillIndex()[
+                sword_world.COMBAT_SKILLS.index(skillName)
+            ]
+
         for skill in self.GetCombatSkills():
             if skill.IsSameCombatSkill(skillName):
                 return skill
 
         return None
 
-    def GetCombatSkills(self) -> list[CombatSkill]:
-        """戦闘特技のリストを返却
+    def GetCombatSkillIndex(self) -> tuple[Union[CombatSkill, None], ...]:
+        """COMBAT_SKILLSの順に並べた戦闘特技を返却
+
+        レベルに応じて習得済みの戦闘特技のみを対象とする
 
         Returns:
-            list[CombatSkill]: 戦闘特技のリスト
+            tuple[Union[CombatSkill, None], ...]:
+                戦闘特技、習得していない場合はNone
         """
-        combatSkills: list[CombatSkill] = self.AutoCombatFeats.copy()
-        if self.IsBattleDancer() and self.CombatFeatsLv1bat is not None:
-            combatSkills.append(self.CombatFeatsLv1bat)
+        if self._combatSkillIndex is None:
+            combatSkillIndex: list[Union[CombatSkill, None]] = [None] * len(
+                sword_world.COMBAT_SKILLS
+            )
+            for skill in self.GetCombatSkills():
+                for i in GetCombatSkillIndexes(skill.SkillName):
+                    # 先に見つかった戦闘特技を優先する
+                    if combatSkillIndex[i] is None:
+                        combatSkillIndex[i] = skill
 
-        if self.CombatFeatsLv1 is not None:
-            combatSkills.append(self.CombatFeatsLv1)
+            self._combatSkillIndex = tuple(combatSkillIndex)
 
-        if self.Level < 3:
-            return combatSkills
+        return self._combatSkillIndex
 
-        if self.CombatFeatsLv3 is not None:
-            combatSkills.append(self.CombatFeatsLv3)
+    def GetCombatSkills(self) -> tuple[CombatSkill, ...]:
+        """戦闘特技のリストを返却
 
-        if self.Level < 5:
-            return combatSkills
+        レベルに応じて習得済みの戦闘特技のみを対象とする
 
-        if self.CombatFeatsLv5 is not None:
-            combatSkills.append(self.CombatFeatsLv5)
+        Returns:
+            tuple[CombatSkill, ...]: 戦闘特技のリスト
+        """
+        if self._combatSkills is None:
+            combatSkills: list[CombatSkill] = list(self.AutoCombatFeats)
+            if self.IsBattleDancer() and self.CombatFeatsLv1bat is not None:
+                combatSkills.append(self.CombatFeatsLv1bat)
 
-        if self.Level < 7:
-            return combatSkills
+            if self.CombatFeatsLv1 is not None:
+                combatSkills.append(self.CombatFeatsLv1)
 
-        if self.CombatFeatsLv7 is not None:
-            combatSkills.append(self.CombatFeatsLv7)
+            for level, combatSkill in [
+                (3, self.CombatFeatsLv3),
+                (5, self.CombatFeatsLv5),
+                (7, self.CombatFeatsLv7),
+                (9, self.CombatFeatsLv9),
+                (11, self.CombatFeatsLv11),
+                (13, self.CombatFeatsLv13),
+            ]:
+                if self.Level < level:
+                    break
 
-        if self.Level < 9:
-            return combatSkills
+                if combatSkill is not None:
+                    combatSkills.append(combatSkill)
 
-        if self.CombatFeatsLv9 is not None:
-            combatSkills.append(self.CombatFeatsLv9)
+            self._combatSkills = tuple(combatSkills)
 
-        if self.Level < 11:
-            return combatSkills
+        return self._combatSkills
 
-        if self.CombatFeatsLv11 is not None:
-            combatSkills.append(self.CombatFeatsLv11)
+    def GetLanguages(self) -> tuple[Language, ...]:
+        """言語のリストを返却
 
-        if self.Level < 13:
-            return combatSkills
+        Returns:
+            tuple[Language, ...]: 言語のリスト
+        """
+        if self._languages is None:
+            languages: list[Language] = []
+            for language in self.MajorRace.Languages:
+                languages.append(language)
 
-        if self.CombatFeatsLv13 is not None:
-            combatSkills.append(self.CombatFeatsLv13)
+            for language in self.LearnedLanguages:
+                if language not in languages:
+                    languages.append(language)
 
-        return combatSkills
+            self._languages = tuple(languages)
 
-    def GetLanguages(self) -> list[Language]:
-        """言語のリストを返却
+        return self._languages
+
+    def GetLanguageIndex(self) -> tuple[Union[Language, None], ...]:
+        """LANGUAGESの順に並べた言語を返却
 
         Returns:
-            list[Language]: 言語のリスト
+            tuple[Union[Language, None], ...]: 言語、習得していない場合はNone
         """
-        languages: list[Language] = []
-        for language in self.MajorRace.Languages:
-            languages.append(language)
-
-        for language in self.LearnedLanguages:
-            if language not in languages:
-                languages.append(language)
-
-        return languages
+        if self._languageIndex is None:
+            languages: tuple[Language, ...] = self.GetLanguages()
+            self._languageIndex = tuple(
+                next((y for y in languages if y.Name.startswith(x)), None)
+                for x in sword_world.LANGUAGES
+            )
 
+        return self._languageIndex
 
-def _FindStyle(string: str) -> Union[Style, None]:
-    """
+    def GetGeneralSkillIndex(
+        self,
+    ) -> tuple[Union[LearnedGeneralSkill, None], ...]:
+        """OFFICIAL_GENERAL_SKILLSの順に並べた公式一般技能を返却
 
-    引数が流派を表す文字列か調べ、一致する流派を返却する
+        Returns:
+            tuple[Union[LearnedGeneralSkill, None], ...]:
+                一般技能、習得していない場合はNone
+        """
+        if self._generalSkillIndex is None:
+            generalSkillIndex: list[Union[LearnedGeneralSkill, None]] = [
+                None
+            ] * len(sword_world.OFFICIAL_GENERAL_SKILLS)
+            for generalSkill in self.GeneralSkills:
+                skill: GeneralSkill = generalSkill.Skill
+                i: Union[int, None] = _OFFICIAL_GENERAL_SKILL_INDEXES.get(
+                    (skill.SkillName, skill.DisplayJob)
+                )
 
-    Args:
-        string str: 確認する文字列
+                # 先に見つかった一般技能を優先する
+                if i is not None and generalSkillIndex[i] is None:
+                    generalSkillIndex[i] = generalSkill
 
-    Returns:
-        Union[Style, None]: 存在する場合は流派、それ以外はNone
-    """
+            self._generalSkillIndex = tuple(generalSkillIndex)
 
-    for style in sword_world.STYLES:
-        if search(style.GetKeywordsRegexp(), string):
-            return style
+        return self._generalSkillIndex
 
-    return None
+    def GetStyleIndex(self) -> tuple[bool, ...]:
+        """STYLESの順に並べた入門状況を返却
 
+        Returns:
+            tuple[bool, ...]: True 入門している
+        """
+        if self._styleIndex is None:
+            styleIndex: list[bool] = [False] * len(sword_world.STYLES)
+            for style in self.Styles:
+                styleIndex[_STYLE_INDEXES[style.Name]] = True
 
-def _FindAbyssCurses(string: str) -> list[str]:
-    """
+            self._styleIndex = tuple(styleIndex)
 
-    引数に含まれるアビスカースを返却する
+        return self._styleIndex
 
-    Args:
-        string str: 確認する文字列
+    def GetAbyssCurseIndex(self) -> tuple[bool, ...]:
+        """ABYSS_CURSESの順に並べたアビスカースの有無を返却
 
-    Returns:
-        list[str]: 引数に含まれるアビスカース
-    """
+        Returns:
+            tuple[bool, ...]: True アビスカースを受けている
+        """
+        if self._abyssCurseIndex is None:
+            abyssCurseIndex: list[bool] = [False] * len(
+                sword_world.ABYSS_CURSES
+            )
+            for abyssCurse in self.AbyssCurses:
+                abyssCurseIndex[_ABYSS_CURSE_INDEXES[abyssCurse]] = True
 
-    result: list[str] = []
-    for abyssCurse in sword_world.ABYSS_CURSES:
-        if abyssCurse in string:
-            result.append(abyssCurse)
+            self._abyssCurseIndex = tuple(abyssCurseIndex)
 
-    return result
+        return self._abyssCurseIndex
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from gzip import compress, decompress
+from hashlib import sha256
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from typing import Union
+
+from .player_character import PlayerCharacter
+
+"""
+解析済みPCのキャッシュ
+変更のないPCを再解析しないよう、解析済みのPCをS3に保存して次回の実行で再利用する
+Lambdaのコンテナが再利用される間はメモリ上のキャッシュを使う
+"""
+
+# 解析時の入力(ETag、最終更新日時、PL名、最大経験点、最小経験点)
+_CacheKey = tuple[str, datetime, str, int, int]
+
+
+def _GetParserVersion() -> str:
+    """解析処理のバージョンを取得
+    解析処理を変更した後は以前に保存した解析結果を使わないよう、
+    PCの解析に関わるソースコードのハッシュを使う
+
+    Returns:
+        str: バージョン
+    """
+    myModulesDirectory: Path = Path(__file__).resolve().parents[1]
+    digest = sha256()
+    for path in sorted(
+        [
+            *(myModulesDirectory / "sword_world").glob("*.py"),
+            myModulesDirectory / "constants" / "sword_world.py",
+        ]
+    ):
+        digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+_PARSER_VERSION: str = _GetParserVersion()
+
+# シーズンIDとゆとシートIDごとの解析時の入力と解析済みPC
+# 入力が変わったPCは上書きするため、PCの数より大きくならない
+_playerCharacterCache: dict[
+    tuple[int, str], tuple[_CacheKey, PlayerCharacter]
+] = {}
+
+# S3から読み込んだシーズンID
+_loadedSeasonIds: set[int] = set()
+
+# 前回の保存以降に解析したPCがあるシーズンID
+_changedSeasonIds: set[int] = set()
+
+
+def IsPlayerCharacterCacheLoaded(seasonId: int) -> bool:
+    """
+    保存したキャッシュを読み込み済みか
+
+    Args:
+        seasonId int: シーズンID
+    Returns:
+        bool: True 読み込み済み
+    """
+    return seasonId in _loadedSeasonIds
+
+
+def LoadPlayerCharacterCache(seasonId: int, body: Union[bytes, None]):
+    """
+    保存したキャッシュを読み込む
+    解析処理のバージョンが異なる場合は読み込まない
+
+    Args:
+        seasonId int: シーズンID
+        body Union[bytes, None]: DumpPlayerCharacterCacheで作成した内容
+            先頭行が解析処理のバージョン、以降がgzip圧縮した解析済みPC
+            保存したキャッシュがない場合はNone
+    """
+    _loadedSeasonIds.add(seasonId)
+    if body is None:
+        return
+
+    # 解析処理が異なる場合は、PCの属性が異なる可能性があるため復元しない
+    version: bytes
+    compressed: bytes
+    version, _, compressed = body.partition(b"\n")
+    if version != _PARSER_VERSION.encode("ascii"):
+        return
+
+    entries: dict[str, tuple[_CacheKey, PlayerCharacter]] = loads(
+        decompress(compressed)
+    )
+    for ytsheetId, entry in entries.items():
+        # 読み込む前に解析したPCを優先する
+        _playerCharacterCache.setdefault((seasonId, ytsheetId), entry)
+
+
+def DumpPlayerCharacterCache(
+    seasonId: int, ytsheetIds: list[str]
+) -> Union[bytes, None]:
+    """
+    キャッシュを保存する内容を作成する
+
+    Args:
+        seasonId int: シーズンID
+        ytsheetIds list[str]: 保存するPCのゆとシートID
+    Returns:
+        Union[bytes, None]: 保存する内容
+            前回の保存以降に解析したPCがない場合はNone
+    """
+    if seasonId not in _changedSeasonIds:
+        return None
+
+    _changedSeasonIds.discard(seasonId)
+
+    # 同じ種族などの共通のオブジェクトは1回だけ書き込まれる
+    entries: dict[str, tuple[_CacheKey, PlayerCharacter]] = {
+        x: _playerCharacterCache[(seasonId, x)]
+        for x in ytsheetIds
+        if (seasonId, x) in _playerCharacterCache
+    }
+    return (
+        _PARSER_VERSION.encode("ascii")
+        + b"\n"
+        + compress(dumps(entries, protocol=HIGHEST_PROTOCOL), mtime=0)
+    )
+
+
+def FindPlayerCharacter(
+    seasonId: int,
+    ytsheetId: str,
+    eTag: Union[str, None],
+    updateTime: datetime,
+    playerName: str,
+    maxExp: int,
+    minimumExp: int,
+) -> Union[PlayerCharacter, None]:
+    """
+    解析時の入力が同じ解析済みのPCを返却する
+
+    Args:
+        seasonId int: シーズンID
+        ytsheetId str: ゆとシートのID
+        eTag Union[str, None]: PCオブジェクトのETag、Noneの場合はキャッシュしない
+        updateTime datetime: 最終更新日時
+        playerName str: PL名
+        maxExp int: 最大経験点
+        minimumExp int: 最小経験点
+    Returns:
+        Union[PlayerCharacter, None]: PC、解析済みでない場合はNone
+    """
+    if eTag is None:
+        return None
+
+    cached: Union[tuple[_CacheKey, PlayerCharacter], None] = (
+        _playerCharacterCache.get((seasonId, ytsheetId))
+    )
+    if cached is None or cached[0] != _MakeCacheKey(
+        eTag, updateTime, playerName, maxExp, minimumExp
+    ):
+        return None
+
+    return cached[1]
+
+
+def GetPlayerCharacter(
+    seasonId: int,
+    ytsheetId: str,
+    eTag: Union[str, None],
+    characterJson: dict,
+    playerName: str,
+    maxExp: int,
+    minimumExp: int,
+    updateTime: datetime,
+) -> PlayerCharacter:
+    """
+    PCを返却する
+    解析時の入力が前回と同じ場合は解析済みのPCを返却する
+
+    Args:
+        seasonId int: シーズンID
+        ytsheetId str: ゆとシートのID
+        eTag Union[str, None]: PCオブジェクトのETag、Noneの場合はキャッシュしない
+        characterJson dict: PC情報
+        playerName str: PL名
+        maxExp int: 最大経験点
+        minimumExp int: 最小経験点
+        updateTime datetime: 最終更新日時
+    Returns:
+        PlayerCharacter: PC
+    """
+    cached: Union[PlayerCharacter, None] = FindPlayerCharacter(
+        seasonId, ytsheetId, eTag, updateTime, playerName, maxExp, minimumExp
+    )
+    if cached is not None:
+        return cached
+
+    playerCharacter: PlayerCharacter = PlayerCharacter(
+        characterJson, playerName, maxExp, minimumExp, updateTime
+    )
+    if eTag is not None:
+        _playerCharacterCache[(seasonId, ytsheetId)] = (
+            _MakeCacheKey(eTag, updateTime, playerName, maxExp, minimumExp),
+            playerCharacter,
+        )
+        _changedSeasonIds.add(seasonId)
+
+    return playerCharacter
+
+
+def _MakeCacheKey(
+    eTag: str,
+    updateTime: datetime,
+    playerName: str,
+    maxExp: int,
+    minimumExp: int,
+) -> _CacheKey:
+    """
+    キャッシュのキーを作成する
+    同じ内容で保存し直した場合はETagが変わらないため、最終更新日時も含める
+    PL名と経験点の範囲は派生項目(GM回数、経験点の状態)に影響する
+
+    Args:
+        eTag str: PCオブジェクトのETag
+        updateTime datetime: 最終更新日時
+        playerName str: PL名
+        maxExp int: 最大経験点
+        minimumExp int: 最小経験点
+    Returns:
+        _CacheKey: キー
+    """
+    return (eTag, updateTime, playerName, maxExp, minimumExp)
@@ -40,13 +40,12 @@ class Race:
     Mental: RacesBaseStatus
     Languages: list[Language]
 
-    def GetTotalBaseStatus(self) -> RacesBaseStatus:
+    def __post_init__(self):
         """
-        合計ステータスを取得する
-        Returns:
-            RacesBaseStatus: 合計ステータス
+        合計ステータスを計算する
+        種族は定数のため、種族ごとに1回だけ計算する
         """
-        return RacesBaseStatus(
+        self._totalBaseStatus: RacesBaseStatus = RacesBaseStatus(
             self.Dexterity.DiceCount
             + self.Agility.DiceCount
             + self.Strength.DiceCount
@@ -61,6 +60,14 @@ class Race:
             + self.Mental.FixedValue,
         )
 
+    def GetTotalBaseStatus(self) -> RacesBaseStatus:
+        """
+        合計ステータスを取得する
+        Returns:
+            RacesBaseStatus: 合計ステータス
+        """
+        return self._totalBaseStatus
+
     def GetAllocationsPoint(self, playerCharacter: "PlayerCharacter") -> int:
         """
         割り振りポイントを取得する
@@ -5,6 +5,35 @@ from dataclasses import dataclass
 種族ごとのステータスの基準値
 """
 
+# ダイス1個の場合の出目ごとの割り振りポイント
+_ONE_DICE_ALLOCATIONS_POINTS: dict[int, int] = {
+    1: -15,
+    2: -10,
+    3: -5,
+    4: 5,
+    5: 10,
+}
+
+# ダイス1個の場合の上記以外の出目の割り振りポイント
+_ONE_DICE_DEFAULT_ALLOCATIONS_POINT: int = 20
+
+# ダイス2個の場合の出目ごとの割り振りポイント
+_TWO_DICE_ALLOCATIONS_POINTS: dict[int, int] = {
+    2: -25,
+    3: -20,
+    4: -15,
+    5: -10,
+    6: -5,
+    7: 0,
+    8: 5,
+    9: 10,
+    10: 20,
+    11: 40,
+}
+
+# ダイス2個の場合の上記以外の出目の割り振りポイント
+_TWO_DICE_DEFAULT_ALLOCATIONS_POINT: int = 70
+
 
 @dataclass
 class RacesBaseStatus:
@@ -29,38 +58,10 @@ class RacesBaseStatus:
         # 出目を取得
         pip: int = status - self.FixedValue
         if self.DiceCount == 1:
-            if pip == 1:
-                return -15
-            elif pip == 2:
-                return -10
-            elif pip == 3:
-                return -5
-            elif pip == 4:
-                return 5
-            elif pip == 5:
-                return 10
-            else:
-                return 20
-        else:
-            if pip == 2:
-                return -25
-            elif pip == 3:
-                return -20
-            elif pip == 4:
-                return -15
-            elif pip == 5:
-                return -10
-            elif pip == 6:
-                return -5
-            elif pip == 7:
-                return 0
-            elif pip == 8:
-                return 5
-            elif pip == 9:
-                return 10
-            elif pip == 10:
-                return 20
-            elif pip == 11:
-                return 40
-            else:
-                return 70
+            return _ONE_DICE_ALLOCATIONS_POINTS.get(
+                pip, _ONE_DICE_DEFAULT_ALLOCATIONS_POINT
+            )
+
+        return _TWO_DICE_ALLOCATIONS_POINTS.get(
+            pip, _TWO_DICE_DEFAULT_ALLOCATIONS_POINT
+        )
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from threading import Lock
+from time import monotonic, sleep
+
+"""
+トークンバケットによる流量制限
+"""
+
+
+class TokenBucket:
+    """
+    トークンバケットによる流量制限
+    複数のスレッドから共有でき、取得順に待機時間を割り当てる
+    Attributes:
+        RequestsPerSecond float: 1秒あたりに補充するトークンの数
+        Capacity float: 貯められるトークンの最大数
+    """
+
+    def __init__(
+        self,
+        requestsPerSecond: float,
+        capacity: float = 1,
+        initialTokens: float = 0,
+    ):
+        """
+        コンストラクタ
+
+        Args:
+            requestsPerSecond float: 1秒あたりに補充するトークンの数
+            capacity float: 貯められるトークンの最大数
+            initialTokens float: 最初に貯まっているトークンの数
+        """
+        if requestsPerSecond <= 0:
+            raise ValueError(f"不正な流量 : {requestsPerSecond}")
+
+        self.RequestsPerSecond: float = requestsPerSecond
+        self.Capacity: float = capacity
+        self._tokens: float = min(initialTokens, capacity)
+        self._updatedAt: float = monotonic()
+        self._lock: Lock = Lock()
+
+    def Acquire(self) -> float:
+        """
+        トークンを1つ取得する
+        トークンがない場合は補充されるまで待機する
+
+        Returns:
+            float: 待機した秒数
+        """
+        with self._lock:
+            now: float = monotonic()
+            refilled: float = (now - self._updatedAt) * self.RequestsPerSecond
+            self._tokens = min(self.Capacity, self._tokens + refilled)
+            self._updatedAt = now
+
+            # 先にトークンを予約し、不足分は待機する
+            # ロックの外で待機するため、他のスレッドは続けて予約できる
+            self._tokens -= 1
+            waitSeconds: float = max(0, -self._tokens / self.RequestsPerSecond)
+
+        if waitSeconds > 0:
+            sleep(waitSeconds)
+
+        return waitSeconds
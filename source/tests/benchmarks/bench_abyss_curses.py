@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+from typing import Any
+
+from tests.benchmarks.common import LoadCharacterJsons
+
+"""
+アビスカースの検索時間
+文字列ごとに全アビスカースを検索する方法と、連結して1回だけ検索する方法を比較する
+"""
+
+
+def _GetAbyssCurseTexts(characterJson: dict[str, Any]) -> list[str]:
+    """アビスカースを検索する文字列(武器・鎧・所持品)
+
+    Args:
+        characterJson (dict[str, Any]): PC情報
+
+    Returns:
+        list[str]: 検索する文字列
+    """
+    texts: list[str] = []
+    for key in ["weapon", "armour"]:
+        for i in range(1, int(characterJson.get(f"{key}Num", "0")) + 1):
+            texts.append(characterJson.get(f"{key}{i}Name", ""))
+            texts.append(characterJson.get(f"{key}{i}Note", ""))
+
+    texts.append(characterJson.get("items", ""))
+    return texts
+
+
+def main():
+    """
+    ベンチマークを実行する
+    """
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--count", type=int, default=300)
+    parser.add_argument("--directory", default=None)
+    parser.add_argument(
+        "--items-length", type=int, nargs="+", default=[2000, 20000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args: Namespace = parser.parse_args()
+
+    from my_modules.constants.sword_world import ABYSS_CURSES
+    from my_modules.sword_world.character_patterns import FindAbyssCurses
+
+    for itemsLength in args.items_length:
+        textsList: list[list[str]] = [
+            _GetAbyssCurseTexts(x)
+            for x in LoadCharacterJsons(
+                args.count, args.directory, itemsLength
+            )
+        ]
+
+        perStringTimes: list[float] = []
+        joinedTimes: list[float] = []
+        for _ in range(args.repeat):
+            startTime: float = perf_counter()
+            perStringResults: list[set[str]] = [
+                {y for x in texts for y in ABYSS_CURSES if y in x}
+                for texts in textsList
+            ]
+            perStringTimes.append(perf_counter() - startTime)
+
+            startTime = perf_counter()
+            joinedResults: list[set[str]] = [
+                FindAbyssCurses(texts) for texts in textsList
+            ]
+            joinedTimes.append(perf_counter() - startTime)
+
+            assert perStringResults == joinedResults
+
+        count: int = len(textsList)
+        print(f"所持品{itemsLength}文字 {count}件 ({args.repeat}回の最小値)")
+        print(f"  文字列ごと: {min(perStringTimes) / count * 1000:.3f}ms/PC")
+        print(f"  連結: {min(joinedTimes) / count * 1000:.3f}ms/PC")
+
+        if args.directory is not None:
+            # 実データでは所持品の文字数を変えられない
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+from argparse import ArgumentParser, Namespace
+from json import dumps
+from time import perf_counter, sleep
+from typing import Any
+
+from tests.benchmarks.common import LoadCharacterJsons, MockS3Bucket
+
+"""
+PCオブジェクトの逐次取得と並列取得の比較
+motoはネットワークを経由しないため、S3の往復時間をGetObjectごとの待機で再現する
+"""
+
+
+def main():
+    """
+    ベンチマークを実行する
+    """
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16, 32]
+    )
+    args: Namespace = parser.parse_args()
+
+    from my_modules.aws.my_s3_client import MyS3Client
+
+    with MockS3Bucket():
+        s3: MyS3Client = MyS3Client()
+        keys: list[tuple[int, str]] = []
+        for characterJson in LoadCharacterJsons(args.count):
+            s3.PutPlayerCharacterObject(
+                1, characterJson["id"], dumps(characterJson)
+            )
+            keys.append((1, characterJson["id"]))
+
+        def wait(**kwargs: Any):
+            # S3の往復時間
+            sleep(args.latency)
+
+        s3.Client.meta.events.register("before-call.s3.GetObject", wait)
+
+        startTime: float = perf_counter()
+        for key in keys:
+            s3.GetPlayerCharacterObject(*key)
+
+        print(f"逐次: {perf_counter() - startTime:.2f}s ({len(keys)}件)")
+        for concurrency in args.concurrency:
+            startTime = perf_counter()
+            results = s3.GetPlayerCharacterObjects(keys, concurrency)
+            assert not any(isinstance(x, Exception) for x in results)
+            print(f"並列{concurrency}: {perf_counter() - startTime:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
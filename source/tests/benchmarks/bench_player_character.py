@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+from argparse import ArgumentParser, Namespace
+from datetime import datetime
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Union
+
+from tests.benchmarks.common import LoadCharacterJsons
+
+"""
+PC情報の解析時間とメモリ使用量
+--directoryにゆとシートのJSONを置いたディレクトリを指定すると実データで計測する
+"""
+
+
+def main():
+    """
+    ベンチマークを実行する
+    """
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--count", type=int, default=300)
+    parser.add_argument("--directory", default=None)
+    parser.add_argument("--items-length", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args: Namespace = parser.parse_args()
+
+    from my_modules.sword_world.player_character import PlayerCharacter
+    from my_modules.sword_world.player_character_cache import (
+        DumpPlayerCharacterCache,
+        GetPlayerCharacter,
+        LoadPlayerCharacterCache,
+    )
+
+    characterJsons: list[dict[str, Any]] = LoadCharacterJsons(
+        args.count, args.directory, args.items_length
+    )
+    updateTime: datetime = datetime.now()
+
+    constructTimes: list[float] = []
+    parseTimes: list[float] = []
+    for _ in range(args.repeat):
+        startTime: float = perf_counter()
+        characters: list[PlayerCharacter] = [
+            PlayerCharacter(x, "PL", 100000, 0, updateTime)
+            for x in characterJsons
+        ]
+        constructTimes.append(perf_counter() - startTime)
+
+        # 初回参照時に解析する項目
+        startTime = perf_counter()
+        for character in characters:
+            character.Styles
+            character.AbyssCurses
+            character.GeneralSkills
+            character.Height
+            character.Weight
+
+        parseTimes.append(perf_counter() - startTime)
+
+    # S3に保存した解析済みPCの復元
+    for i, character in enumerate(characters):
+        GetPlayerCharacter(
+            1, str(i), "etag", characterJsons[i], "PL", 100000, 0, updateTime
+        )
+
+    body: Union[bytes, None] = DumpPlayerCharacterCache(
+        1, [str(i) for i in range(len(characters))]
+    )
+    assert body is not None
+    loadTimes: list[float] = []
+    for _ in range(args.repeat):
+        startTime = perf_counter()
+        LoadPlayerCharacterCache(2, body)
+        loadTimes.append(perf_counter() - startTime)
+
+    count: int = len(characterJsons)
+    print(f"{count}件 ({args.repeat}回の最小値)")
+    print(f"構築: {min(constructTimes) / count * 1000:.3f}ms/PC")
+    print(f"遅延解析: {min(parseTimes) / count * 1000:.3f}ms/PC")
+    print(
+        f"解析済みPCの復元: {min(loadTimes) / count * 1000:.3f}ms/PC "
+        f"({len(body) / count / 1024:.1f}KiB/PC)"
+    )
+
+    # 計測のオーバーヘッドが時間に影響しないよう、メモリは別に計測する
+    # 元のJSONは含めず、PCが追加で確保した分のみ数える
+    start()
+    characters = [
+        PlayerCharacter(x, "PL", 100000, 0, updateTime)
+        for x in characterJsons
+    ]
+    constructedSize: int = get_traced_memory()[0]
+    for character in characters:
+        character.Styles
+        character.AbyssCurses
+        character.GeneralSkills
+        character.Height
+        character.GetCombatSkillIndex()
+        character.GetLanguageIndex()
+        character.GetGeneralSkillIndex()
+        character.GetStyleIndex()
+        character.GetAbyssCurseIndex()
+
+    parsedSize: int = get_traced_memory()[0]
+    stop()
+    print(f"メモリ(構築後): {constructedSize / count / 1024:.1f}KiB/PC")
+    print(f"メモリ(全項目参照後): {parsedSize / count / 1024:.1f}KiB/PC")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+from argparse import ArgumentParser, Namespace
+from json import dumps, loads
+from os import environ
+from time import perf_counter
+
+from tests.benchmarks.common import (
+    BUCKET_NAME,
+    LoadCharacterJsons,
+    MockS3Bucket,
+)
+
+"""
+PCオブジェクトの圧縮有無による保存サイズと保存・取得時間の比較
+あわせて、文字列とバイト列のどちらで保存するかの変換時間も比較する
+"""
+
+
+def main():
+    """
+    ベンチマークを実行する
+    """
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--directory", default=None)
+    parser.add_argument("--items-length", type=int, default=2000)
+    args: Namespace = parser.parse_args()
+
+    from my_modules.aws.my_s3_client import MyS3Client
+    from my_modules.constants.env_keys import (
+        PLAYER_CHARACTER_CONTENT_ENCODING,
+    )
+
+    characterJsons: list[dict] = LoadCharacterJsons(
+        args.count, args.directory, args.items_length
+    )
+    bodies: list[bytes] = [
+        dumps(x, ensure_ascii=False).encode("utf-8") for x in characterJsons
+    ]
+
+    # ゆとシートの応答はバイト列なので、文字列を経由しない方が変換が少ない
+    startTime: float = perf_counter()
+    for body in bodies:
+        loads(body.decode("utf-8")).get("id")
+    print(f"bytes→str→json: {perf_counter() - startTime:.3f}s")
+    startTime = perf_counter()
+    for body in bodies:
+        loads(body).get("id")
+    print(f"bytes→json: {perf_counter() - startTime:.3f}s")
+
+    for contentEncoding in ["", "gzip"]:
+        environ[PLAYER_CHARACTER_CONTENT_ENCODING] = contentEncoding
+        with MockS3Bucket():
+            s3: MyS3Client = MyS3Client()
+            startTime = perf_counter()
+            for characterJson, body in zip(characterJsons, bodies):
+                s3.PutPlayerCharacterObject(1, characterJson["id"], body)
+            putSeconds: float = perf_counter() - startTime
+
+            startTime = perf_counter()
+            for characterJson in characterJsons:
+                s3.GetPlayerCharacterObject(1, characterJson["id"])
+            getSeconds: float = perf_counter() - startTime
+
+            storedSize: int = sum(
+                x["Size"]
+                for x in s3.Client.list_objects_v2(Bucket=BUCKET_NAME)[
+                    "Contents"
+                ]
+            )
+
+        print(
+            f"{contentEncoding or 'なし'}: "
+            f"保存 {putSeconds:.2f}s, 取得 {getSeconds:.2f}s, "
+            f"サイズ {storedSize / 1024:.0f}KiB "
+            f"(元 {sum(len(x) for x in bodies) / 1024:.0f}KiB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from random import Random
+from threading import Thread
+from time import perf_counter, sleep
+from typing import Any
+
+from tests.benchmarks.common import MakeCharacterJson
+
+"""
+ゆとシートへのリクエスト時間
+ローカルで起動したサーバーに対し、接続を再利用するセッションと
+リクエストごとに接続する場合を比較する
+"""
+
+
+class _YtsheetHandler(BaseHTTPRequestHandler):
+    """
+    PC情報を返すゆとシートの代わり
+    """
+
+    body: bytes = b""
+    latency: float = 0
+    protocol_version: str = "HTTP/1.1"
+    # ヘッダーと本文を分けて送信するため、遅延ACKで待たされないようにする
+    disable_nagle_algorithm: bool = True
+
+    def do_GET(self):
+        # サーバーの処理時間
+        sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+
+def main():
+    """
+    ベンチマークを実行する
+    """
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.01)
+    args: Namespace = parser.parse_args()
+
+    from get_ytsheet_data import app
+    from my_modules.token_bucket import TokenBucket
+    from requests import get
+
+    _YtsheetHandler.body = dumps(
+        MakeCharacterJson(Random(0), 0), ensure_ascii=False
+    ).encode("utf-8")
+    _YtsheetHandler.latency = args.latency
+    server: ThreadingHTTPServer = ThreadingHTTPServer(
+        ("127.0.0.1", 0), _YtsheetHandler
+    )
+    Thread(target=server.serve_forever, daemon=True).start()
+    url: str = f"http://127.0.0.1:{server.server_address[1]}/?mode=json"
+
+    # 流量制限の待機を含めないよう、十分なトークンを用意する
+    tokenBucket: TokenBucket = TokenBucket(
+        10000, capacity=args.count, initialTokens=args.count
+    )
+    for name, request in [
+        ("接続ごと", lambda: get(url, timeout=10)),
+        ("セッション", lambda: app.requestYtsheet(url, {}, tokenBucket)[0]),
+    ]:
+        for workers in [1, 8]:
+            startTime: float = perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(
+                    executor.map(lambda _: request(), range(args.count))
+                )
+
+            assert all(x.status_code == 200 for x in responses)
+            print(
+                f"{name} {workers}並列: "
+                f"{(perf_counter() - startTime) / args.count * 1000:.2f}"
+                "ms/リクエスト"
+            )
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from contextlib import contextmanager
+from json import load
+from os import environ
+from pathlib import Path
+from random import Random
+from typing import Any, Iterator, Union
+
+"""
+ベンチマーク共通処理
+ソースディレクトリで python -m tests.benchmarks.<モジュール名> として実行する
+"""
+
+_SOURCE_DIRECTORY: Path = Path(__file__).resolve().parents[2]
+for _path in (_SOURCE_DIRECTORY / "layers", _SOURCE_DIRECTORY / "functions"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from my_modules.constants import sword_world  # noqa: E402
+
+# テスト用のバケット名
+BUCKET_NAME: str = "summarize-character-sheets-benchmark-bucket"
+
+# 本文に混ぜる文字
+_TEXT_CHARACTERS: str = "あいうえおカキクケコ剣盾鎧0123456789 "
+
+
+def MakeText(random: Random, length: int) -> str:
+    """流派やアビスカースを含むことがある文字列を作成
+
+    Args:
+        random (Random): 乱数
+        length (int): 文字数の目安
+
+    Returns:
+        str: 文字列
+    """
+    keywords: list[str] = sword_world.ABYSS_CURSES + [
+        y for x in sword_world.STYLES for y in x.Keywords
+    ]
+    return "".join(
+        (
+            random.choice(keywords)
+            if random.random() < 0.02
+            else random.choice(_TEXT_CHARACTERS)
+        )
+        for _ in range(length)
+    )
+
+
+def MakeCharacterJson(
+    random: Random, index: int, itemsLength: int = 2000
+) -> dict[str, Any]:
+    """ゆとシートのJSONに似たPC情報を作成
+
+    Args:
+        random (Random): 乱数
+        index (int): 連番
+        itemsLength (int): 所持品の文字数
+
+    Returns:
+        dict[str, Any]: PC情報
+    """
+    characterJson: dict[str, Any] = {
+        "id": f"benchmark{index}",
+        "race": random.choice(sword_world.RACES).Name,
+        "characterName": f"|ＰＣ《ピーシー》{index}",
+        "level": str(random.randint(2, 15)),
+        "expTotal": str(random.randint(3000, 80000)),
+        "combatFeatsAuto": ",".join(
+            random.sample(sword_world.COMBAT_SKILLS, 2)
+        ),
+        "items": MakeText(random, itemsLength),
+        "freeNote": "&lt;br&gt;".join(
+            ["身長：１７０cm", "体重：６０kg", MakeText(random, 200)]
+        ),
+    }
+    for level in ["1", "3", "5", "7", "9", "11", "13", "1bat"]:
+        characterJson[f"combatFeatsLv{level}"] = random.choice(
+            sword_world.COMBAT_SKILLS
+        )
+
+    for key in random.sample(list(sword_world.COMBAT_ABILITIES), 3):
+        characterJson[key] = str(random.randint(1, 15))
+
+    for key, count in [("weapon", 5), ("armour", 3)]:
+        characterJson[f"{key}Num"] = str(count)
+        for i in range(1, count + 1):
+            characterJson[f"{key}{i}Name"] = MakeText(random, 15)
+            characterJson[f"{key}{i}Note"] = MakeText(random, 60)
+
+    for key, numKey in [
+        ("mysticArts", "mysticArtsNum"),
+        ("honorItem", "honorItemsNum"),
+    ]:
+        characterJson[numKey] = "3"
+        for i in range(1, 4):
+            characterJson[f"{key}{i}"] = MakeText(random, 20)
+
+    characterJson["commonClassNum"] = "3"
+    for i in range(1, 4):
+        generalSkill = random.choice(sword_world.OFFICIAL_GENERAL_SKILLS)
+        characterJson[f"commonClass{i}"] = f"{generalSkill.SkillName}（）"
+        characterJson[f"lvCommon{i}"] = str(random.randint(1, 5))
+
+    characterJson["historyNum"] = "40"
+    for i in range(1, 41):
+        characterJson[f"history{i}Date"] = f"2024-01-{i % 28 + 1:02}"
+        characterJson[f"history{i}Gm"] = random.choice(["GM", "俺"])
+        characterJson[f"history{i}Note"] = random.choice(["", "死亡"])
+
+    # ゆとシートは空欄の項目も出力する
+    for i in range(800):
+        characterJson[f"unused{i}"] = ""
+
+    return characterJson
+
+
+def LoadCharacterJsons(
+    count: int, directory: Union[str, None] = None, itemsLength: int = 2000
+) -> list[dict[str, Any]]:
+    """ベンチマークに使うPC情報を読み込む
+
+    Args:
+        count (int): 作成する件数、directoryを指定した場合は無視する
+        directory (Union[str, None]): ゆとシートのJSONを置いたディレクトリ
+            Noneの場合は合成したPC情報を使う
+        itemsLength (int): 合成する場合の所持品の文字数
+
+    Returns:
+        list[dict[str, Any]]: PC情報
+    """
+    if directory is not None:
+        characterJsons: list[dict[str, Any]] = []
+        for path in sorted(Path(directory).glob("*.json")):
+            with path.open(encoding="utf-8") as file:
+                characterJsons.append(load(file))
+
+        return characterJsons
+
+    random: Random = Random(0)
+    return [MakeCharacterJson(random, i, itemsLength) for i in range(count)]
+
+
+@contextmanager
+def MockS3Bucket() -> Iterator[str]:
+    """motoで作成したS3バケット
+
+    Yields:
+        str: バケット名
+    """
+    from boto3 import client
+    from moto import mock_aws
+
+    environ["MY_AWS_REGION"] = "ap-northeast-1"
+    environ["MY_BUCKET_NAME"] = BUCKET_NAME
+    environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        client("s3", region_name="ap-northeast-1").create_bucket(
+            Bucket=BUCKET_NAME,
+            CreateBucketConfiguration={
+                "LocationConstraint": "ap-northeast-1"
+            },
+        )
+        yield BUCKET_NAME
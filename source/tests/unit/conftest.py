@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+"""
+ユニットテスト共通設定
+Lambdaと同じくレイヤーと各関数のディレクトリからインポートできるようにする
+"""
+
+_SOURCE_DIRECTORY: Path = Path(__file__).resolve().parents[2]
+for _path in (_SOURCE_DIRECTORY / "layers", _SOURCE_DIRECTORY / "functions"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+# テスト用のバケット名
+BUCKET_NAME: str = "summarize-character-sheets-test-bucket"
+
+
+@pytest.fixture
+def s3Bucket(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """motoで作成したS3バケット
+
+    Yields:
+        str: バケット名
+    """
+    moto = pytest.importorskip("moto")
+    from boto3 import client
+
+    monkeypatch.setenv("MY_AWS_REGION", "ap-northeast-1")
+    monkeypatch.setenv("MY_BUCKET_NAME", BUCKET_NAME)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with moto.mock_aws():
+        client("s3", region_name="ap-northeast-1").create_bucket(
+            Bucket=BUCKET_NAME,
+            CreateBucketConfiguration={
+                "LocationConstraint": "ap-northeast-1"
+            },
+        )
+        yield BUCKET_NAME
+
+
+@pytest.fixture
+def emptyPlayerCharacterCache(monkeypatch: pytest.MonkeyPatch):
+    """メモリ上の解析済みPCのキャッシュを空にする
+    他のテストで解析したPCを使わないようにする
+    """
+    from my_modules.sword_world import player_character_cache
+
+    monkeypatch.setattr(player_character_cache, "_playerCharacterCache", {})
+    monkeypatch.setattr(player_character_cache, "_loadedSeasonIds", set())
+    monkeypatch.setattr(player_character_cache, "_changedSeasonIds", set())
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from my_modules.constants import sword_world
+from my_modules.sword_world.character_patterns import (
+    HEIGHT_PATTERNS,
+    WEIGHT_PATTERNS,
+    ExtractFreeNoteValue,
+    FindAbyssCurses,
+    FindStyle,
+)
+
+"""
+PCの解析に使用するパターンのテスト
+"""
+
+
+def test_find_style():
+    for style in sword_world.STYLES:
+        for keyword in style.Keywords:
+            found = FindStyle(f"秘伝：{keyword}")
+            assert found is not None
+            # 複数の流派に一致する場合は先に定義した流派
+            assert sword_world.STYLES.index(found) <= (
+                sword_world.STYLES.index(style)
+            )
+
+    assert FindStyle("流派なし") is None
+
+
+def test_extract_free_note_value():
+    assert ExtractFreeNoteValue("身長：170cm", HEIGHT_PATTERNS) == "170"
+    # 同じ行では後に定義したキーワードを優先する
+    assert (
+        ExtractFreeNoteValue("身長：170cm 背丈：1.8m", HEIGHT_PATTERNS)
+        == "1.8"
+    )
+    assert ExtractFreeNoteValue("体重|60kg", WEIGHT_PATTERNS) == "60"
+    assert ExtractFreeNoteValue("年齢：20", HEIGHT_PATTERNS) is None
+
+
+def test_find_abyss_curses():
+    assert FindAbyssCurses(["ソード(自傷の)", "", "優しきメイス"]) == {
+        "自傷の",
+        "優しき",
+    }
+    # 文字列をまたいで一致させない
+    assert FindAbyssCurses(["自傷", "の"]) == set()
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+from types import SimpleNamespace
+
+from my_modules.common_functions import getChangedRowIndexes
+from my_modules.sword_world.player import Player
+
+"""
+共通関数のテスト
+"""
+
+
+def _makePlayers() -> list[Player]:
+    return [
+        Player(
+            "PL1",
+            [SimpleNamespace(YtsheetId="a"), SimpleNamespace(YtsheetId="b")],
+        ),
+        Player("PL2", [SimpleNamespace(YtsheetId="c")]),
+        Player("PL3", [SimpleNamespace(YtsheetId="d")]),
+    ]  # type: ignore
+
+
+def test_get_changed_row_indexes():
+    players: list[Player] = _makePlayers()
+
+    assert getChangedRowIndexes(players, None) is None
+    assert getChangedRowIndexes(players, set()) == []
+    assert getChangedRowIndexes(players, {"b", "d"}) == [3, 5]
+    assert getChangedRowIndexes(players, {"b", "d"}, True) == [2, 4]
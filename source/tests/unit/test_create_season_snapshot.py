@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps
+from time import sleep
+from typing import Any
+
+from create_season_snapshot.app import createSeasonSnapshot
+from my_modules.aws.my_s3_client import MyS3Client
+from my_modules.common_functions import initializePlayers
+
+"""
+シーズンのスナップショット作成のテスト
+"""
+
+
+def _putPlayerCharacter(s3: MyS3Client, ytsheetId: str, name: str):
+    s3.PutPlayerCharacterObject(
+        1,
+        ytsheetId,
+        dumps({"id": ytsheetId, "race": "人間", "characterName": name}),
+    )
+
+
+def test_rebuilds_only_changed_player_characters(s3Bucket: str):
+    s3: MyS3Client = MyS3Client()
+    for i in range(3):
+        _putPlayerCharacter(s3, f"pc{i}", f"PC{i}")
+
+    assert createSeasonSnapshot(1) == {"FetchedCount": 3, "SnapshotCount": 3}
+
+    # 変更なし
+    assert createSeasonSnapshot(1, set()) == {
+        "FetchedCount": 0,
+        "SnapshotCount": 3,
+    }
+
+    # 変更があったPCのみ取得し直す
+    _putPlayerCharacter(s3, "pc1", "変更後")
+    assert createSeasonSnapshot(1, {"pc1"}) == {
+        "FetchedCount": 1,
+        "SnapshotCount": 3,
+    }
+    snapshot = s3.GetSeasonSnapshotObject(1)
+    assert snapshot["pc1"]["Body"]["characterName"] == "変更後"
+    assert snapshot["pc0"]["Body"]["characterName"] == "PC0"
+
+
+def test_refetches_player_characters_with_stale_etag(s3Bucket: str):
+    s3: MyS3Client = MyS3Client()
+    for i in range(2):
+        _putPlayerCharacter(s3, f"pc{i}", f"PC{i}")
+
+    createSeasonSnapshot(1)
+
+    # 変更の通知が漏れてもETagの不一致で検知する
+    _putPlayerCharacter(s3, "pc0", "変更後")
+    assert createSeasonSnapshot(1, set())["FetchedCount"] == 1
+    assert (
+        s3.GetSeasonSnapshotObject(1)["pc0"]["Body"]["characterName"]
+        == "変更後"
+    )
+
+
+def test_initialize_players_ignores_stale_snapshot_entries(
+    s3Bucket: str, monkeypatch, emptyPlayerCharacterCache: None
+):
+    s3: MyS3Client = MyS3Client()
+    for i in range(3):
+        _putPlayerCharacter(s3, f"pc{i}", f"PC{i}")
+
+    createSeasonSnapshot(1)
+    _putPlayerCharacter(s3, "pc2", "変更後")
+
+    fetchedKeys: list[tuple[int, str]] = []
+    getObjects = MyS3Client.GetPlayerCharacterObjects
+
+    def recordGetObjects(self, keys):
+        fetchedKeys.extend(keys)
+        return getObjects(self, keys)
+
+    monkeypatch.setattr(
+        MyS3Client, "GetPlayerCharacterObjects", recordGetObjects
+    )
+    playerJsons: list[dict[str, Any]] = [
+        {
+            "name": "PL",
+            "characters": [{"ytsheet_id": f"pc{i}"} for i in range(3)],
+        }
+    ]
+    levelCap: dict[str, Any] = {"max_exp": 10000, "minimum_exp": 0}
+    players = initializePlayers(playerJsons, levelCap, 1)
+
+    assert [x.Name for x in players[0].Characters] == ["PC0", "PC1", "変更後"]
+    # スナップショットが古いPCのみ個別に取得する
+    assert fetchedKeys == [(1, "pc2")]
+
+
+def test_refreshes_last_modified_of_identical_content(s3Bucket: str):
+    s3: MyS3Client = MyS3Client()
+    _putPlayerCharacter(s3, "pc0", "PC0")
+    createSeasonSnapshot(1)
+    previous = s3.GetSeasonSnapshotObject(1)["pc0"]
+
+    # 同じ内容で保存し直した場合、ETagは変わらず最終更新日時のみ変わる
+    sleep(1)
+    _putPlayerCharacter(s3, "pc0", "PC0")
+
+    current = s3.GetPlayerCharacterObject(1, "pc0")
+    assert current["ETag"] == previous["ETag"]
+    assert current["LastModified"] > previous["LastModified"]
+
+    # 本文は取得し直さず、最終更新日時のみ一覧取得の値で更新する
+    assert createSeasonSnapshot(1, set())["FetchedCount"] == 1
+    snapshot = s3.GetSeasonSnapshotObject(1)
+    assert snapshot["pc0"]["LastModified"] == current["LastModified"]
+    assert createSeasonSnapshot(1, set())["FetchedCount"] == 0
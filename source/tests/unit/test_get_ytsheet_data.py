@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, load, loads
+from pathlib import Path
+from re import search
+from socket import socket
+from threading import Thread
+from time import sleep
+from typing import Any, Iterator
+
+import pytest
+from get_ytsheet_data import app
+from my_modules.aws.my_s3_client import MyS3Client
+from my_modules.constants.common import DEFAULT_YTSHEET_REQUESTS_PER_SECOND
+from my_modules.constants.env_keys import (
+    PLAYER_CHARACTER_CONTENT_ENCODING,
+    YTSHEET_REQUESTS_PER_SECOND,
+)
+from my_modules.token_bucket import TokenBucket
+from requests import Response, exceptions
+
+"""
+ゆとシートデータ取得のテスト
+"""
+
+
+def test_get_ytsheet_data_fetches_characters_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls: list[tuple[Any, ...]] = []
+
+    def getPlayerCharacterData(*args: Any) -> tuple[bool, dict[str, float]]:
+        calls.append(args)
+        return args[3] == "b", {"Requests": 1}
+
+    monkeypatch.setattr(app, "MyS3Client", lambda: "s3")
+    monkeypatch.setattr(app, "_tokenBuckets", {})
+    monkeypatch.setattr(app, "getPlayerCharacterData", getPlayerCharacterData)
+    players: list[dict[str, Any]] = [
+        {
+            "id": 1,
+            "characters": [
+                {"ytsheet_id": "a", "is_deleted": False},
+                {"ytsheet_id": "deleted", "is_deleted": True},
+            ],
+        },
+        {"id": 2, "characters": [{"ytsheet_id": "b", "is_deleted": False}]},
+    ]
+
+    result: dict[str, Any] = app.getYtsheetData(1, players)
+
+    assert sorted(x[2:4] for x in calls) == [(1, "a"), (2, "b")]
+    assert all(x[:2] == ("s3", 1) for x in calls)
+    assert all(x[5] is app.getTokenBucket(x[4]) for x in calls)
+    assert result["ChangedYtsheetIds"] == ["b"]
+    assert result["Metrics"]["Requests"] == 2
+
+
+def test_get_ytsheet_data_keeps_results_of_other_characters(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    def getPlayerCharacterData(*args: Any) -> tuple[bool, dict[str, float]]:
+        if args[3] == "broken":
+            raise ValueError("broken")
+
+        return True, {"Requests": 1}
+
+    messages: list[dict] = []
+    monkeypatch.setattr(app, "MyS3Client", lambda: "s3")
+    monkeypatch.setattr(app, "_tokenBuckets", {})
+    monkeypatch.setattr(app, "getPlayerCharacterData", getPlayerCharacterData)
+    monkeypatch.setattr(app, "publish_error_message", messages.append)
+    players: list[dict[str, Any]] = [
+        {
+            "id": 1,
+            "characters": [
+                {"ytsheet_id": x, "is_deleted": False}
+                for x in ["a", "broken", "b"]
+            ],
+        },
+    ]
+
+    # 1PCの失敗は通知し、保存済みの他のPCの変更は返却する
+    result: dict[str, Any] = app.getYtsheetData(1, players)
+
+    assert result["ChangedYtsheetIds"] == ["a", "b"]
+    assert result["FailedYtsheetIds"] == ["broken"]
+    assert result["Metrics"]["Requests"] == 2
+    assert [(x["message"], x["ytsheet_id"]) for x in messages] == [
+        ("取得エラー", "broken")
+    ]
+
+    # 全て失敗した場合は再実行できるよう例外とする
+    players[0]["characters"] = [{"ytsheet_id": "broken", "is_deleted": False}]
+    with pytest.raises(Exception) as e:
+        app.getYtsheetData(1, players)
+
+    assert isinstance(e.value.__cause__, ValueError)
+
+
+def test_get_token_bucket_default_rate(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(YTSHEET_REQUESTS_PER_SECOND, raising=False)
+    monkeypatch.setattr(app, "_tokenBuckets", {})
+
+    assert (
+        app.getTokenBucket("https://example.com/sw2.5/").RequestsPerSecond
+        == DEFAULT_YTSHEET_REQUESTS_PER_SECOND
+    )
+
+
+class _YtsheetHandler(BaseHTTPRequestHandler):
+    """
+    指定した順にステータスコードを返すゆとシートの代わり
+    """
+
+    # ステータスコード、Retry-After、応答までの秒数
+    responses: list[tuple[int, str, float]] = []
+    body: bytes = b'{"id": "pc"}'
+    protocol_version: str = "HTTP/1.1"
+
+    def do_GET(self):
+        status, retryAfter, delaySeconds = self.responses.pop(0)
+        sleep(delaySeconds)
+        body: bytes = self.body
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if retryAfter != "":
+            self.send_header("Retry-After", retryAfter)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+
+@pytest.fixture
+def ytsheetUrl() -> Iterator[str]:
+    """ローカルで起動したゆとシートの代わりのURL
+
+    Yields:
+        str: URL
+    """
+    server: ThreadingHTTPServer = ThreadingHTTPServer(
+        ("127.0.0.1", 0), _YtsheetHandler
+    )
+    thread: Thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/?id=pc&mode=json"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """再試行までの待機秒数を記録し、実際には待機しない
+
+    Returns:
+        list[float]: 待機秒数
+    """
+    sleeps: list[float] = []
+    monkeypatch.setattr(app, "sleep", sleeps.append)
+    return sleeps
+
+
+def _makeTokenBucket() -> TokenBucket:
+    return TokenBucket(1000, capacity=10, initialTokens=10)
+
+
+def test_request_ytsheet_retries_status_codes(
+    ytsheetUrl: str, sleeps: list[float]
+):
+    # Retry-Afterは上限までのみ従う
+    _YtsheetHandler.responses = [(503, "", 0), (429, "3600", 0), (200, "", 0)]
+
+    response, metrics = app.requestYtsheet(ytsheetUrl, {}, _makeTokenBucket())
+
+    assert response.status_code == 200
+    assert sleeps == [2, 10]
+    assert metrics["Requests"] == 3
+    assert metrics["Retries"] == 2
+
+
+def test_request_ytsheet_retries_connection_errors(sleeps: list[float]):
+    # 閉じているポートには接続できない
+    with socket() as closedSocket:
+        closedSocket.bind(("127.0.0.1", 0))
+        url: str = f"http://127.0.0.1:{closedSocket.getsockname()[1]}/"
+
+    response, metrics = app.requestYtsheet(url, {}, _makeTokenBucket())
+
+    assert isinstance(response, exceptions.ConnectionError)
+    assert sleeps == [2, 4, 8]
+    assert metrics["Requests"] == 4
+
+
+def test_request_ytsheet_retries_timeouts(
+    ytsheetUrl: str, sleeps: list[float], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(app, "_TIMEOUT_SECONDS", (1, 0.2))
+    _YtsheetHandler.responses = [(200, "", 1), (200, "", 0)]
+
+    response, metrics = app.requestYtsheet(ytsheetUrl, {}, _makeTokenBucket())
+
+    assert response.status_code == 200
+    assert sleeps == [2]
+    assert metrics["Requests"] == 2
+
+
+def _makeResponse(content: bytes) -> Response:
+    response: Response = Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+def test_to_utf8_keeps_utf8_body():
+    content: bytes = dumps({"characterName": "ＰＣ"}).encode("utf-8")
+    response: Response = _makeResponse(content)
+
+    body, isFallback = app.toUtf8(response)
+
+    assert body is content
+    assert not isFallback
+
+
+def test_to_utf8_falls_back_to_detected_encoding():
+    text: str = dumps(
+        {"characterName": "冒険者", "freeNote": "身長：１７０cm" * 20},
+        ensure_ascii=False,
+    )
+    response: Response = _makeResponse(text.encode("shift_jis"))
+
+    body, isFallback = app.toUtf8(response)
+
+    assert isFallback
+    assert loads(body.decode("utf-8")) == loads(text)
+
+
+def test_get_player_character_data_saves_only_changed_content(
+    s3Bucket: str,
+    ytsheetUrl: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv(PLAYER_CHARACTER_CONTENT_ENCODING, "gzip")
+    monkeypatch.setattr(_YtsheetHandler, "body", b'{"id": "pc", "level": 1}')
+    _YtsheetHandler.responses = [(200, "", 0)] * 3
+    s3: MyS3Client = MyS3Client()
+
+    def getPlayerCharacterData() -> bool:
+        return app.getPlayerCharacterData(
+            s3, 1, 1, "pc", ytsheetUrl, _makeTokenBucket()
+        )[0]
+
+    assert getPlayerCharacterData()
+    assert s3.GetPlayerCharacterObject(1, "pc")["Body"]["level"] == 1
+
+    # 内容が同じであれば、メタデータのハッシュで判定して保存しない
+    lastModified = s3.GetPlayerCharacterObject(1, "pc")["LastModified"]
+    assert not getPlayerCharacterData()
+    assert s3.GetPlayerCharacterObject(1, "pc")["LastModified"] == (
+        lastModified
+    )
+
+    monkeypatch.setattr(_YtsheetHandler, "body", b'{"id": "pc", "level": 2}')
+    assert getPlayerCharacterData()
+    assert s3.GetPlayerCharacterObject(1, "pc")["Body"]["level"] == 2
+
+
+def test_get_player_character_data_reports_connection_errors(
+    monkeypatch: pytest.MonkeyPatch, sleeps: list[float]
+):
+    with socket() as closedSocket:
+        closedSocket.bind(("127.0.0.1", 0))
+        url: str = f"http://127.0.0.1:{closedSocket.getsockname()[1]}/"
+
+    messages: list[dict] = []
+    monkeypatch.setattr(app, "publish_error_message", messages.append)
+    s3: Any = type("S3", (), {"GetPlayerCharacterMetadata": lambda *_: {}})
+
+    # 例外は送出せず、他のPCと同じくエラーを通知して変更なしとする
+    isChanged, metrics = app.getPlayerCharacterData(
+        s3(), 1, 1, "pc", url, _makeTokenBucket()
+    )
+
+    assert not isChanged
+    assert metrics["Requests"] == 4
+    assert [(x["message"], x["ytsheet_id"]) for x in messages] == [
+        ("接続エラー", "pc")
+    ]
+
+
+def test_batch_size_reserves_worst_case_request_seconds():
+    # ステートマシンが差し引く秒数は、1PCの取得にかかる最大秒数以上
+    with (
+        Path(__file__).parents[2]
+        / "statemachine"
+        / "summarize_character_sheets.asl.json"
+    ).open(encoding="utf-8") as file:
+        definition: dict[str, Any] = load(file)
+
+    expression: str = definition["States"]["initialize_pass"]["Assign"][
+        "ytsheet_batch_characters"
+    ]
+    reserveMatch = search(r"\$\{GetYtsheetDataTimeout\} - (\d+)", expression)
+    assert reserveMatch is not None
+    assert (
+        int(reserveMatch.group(1)) >= app._MAX_SECONDS_PER_PLAYER_CHARACTER
+    )
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+from gzip import compress, decompress
+from hashlib import sha256
+from json import dumps
+from time import sleep
+
+import pytest
+from botocore.exceptions import ClientError
+from my_modules.aws.my_s3_client import MyS3Client
+from my_modules.constants.env_keys import PLAYER_CHARACTER_CONTENT_ENCODING
+
+"""
+MyS3Clientのテスト
+"""
+
+
+def test_get_player_character_objects_keeps_order(s3Bucket: str):
+    s3: MyS3Client = MyS3Client()
+    for i in range(20):
+        s3.PutPlayerCharacterObject(1, f"pc{i}", dumps({"id": f"pc{i}"}))
+
+    keys: list[tuple[int, str]] = [(1, f"pc{i}") for i in reversed(range(20))]
+    results = s3.GetPlayerCharacterObjects(keys, 4)
+
+    assert [x["Body"]["id"] for x in results] == [x[1] for x in keys]
+
+
+def test_get_player_character_objects_returns_errors_per_key(s3Bucket: str):
+    s3: MyS3Client = MyS3Client()
+    s3.PutPlayerCharacterObject(1, "pc0", dumps({"id": "pc0"}))
+
+    results = s3.GetPlayerCharacterObjects([(1, "missing"), (1, "pc0")])
+
+    assert isinstance(results[0], ClientError)
+    assert results[1]["Body"] == {"id": "pc0"}
+
+
+def test_get_player_character_objects_empty(s3Bucket: str):
+    assert MyS3Client().GetPlayerCharacterObjects([]) == []
+
+
+@pytest.mark.parametrize("contentEncoding", ["gzip", ""])
+def test_put_player_character_object_round_trip(
+    s3Bucket: str, monkeypatch: pytest.MonkeyPatch, contentEncoding: str
+):
+    monkeypatch.setenv(PLAYER_CHARACTER_CONTENT_ENCODING, contentEncoding)
+    s3: MyS3Client = MyS3Client()
+    characterJson: dict = {"id": "pc0", "characterName": "ＰＣ" * 100}
+    body: bytes = dumps(characterJson, ensure_ascii=False).encode("utf-8")
+    metadata: dict[str, str] = {"content-sha256": sha256(body).hexdigest()}
+
+    s3.PutPlayerCharacterObject(1, "pc0", body, metadata)
+
+    # 保存したオブジェクトはContent-Encodingの通りに圧縮されている
+    response = s3.Client.get_object(
+        Bucket=s3Bucket, Key="player_characters/1/pc0.json"
+    )
+    storedBody: bytes = response["Body"].read()
+    if contentEncoding == "gzip":
+        assert response["ContentEncoding"] == "gzip"
+        assert len(storedBody) < len(body)
+        assert decompress(storedBody) == body
+        # gzipヘッダーに時刻を含めないため、同じ内容は同じバイト列になる
+        assert storedBody == compress(body, mtime=0)
+    else:
+        assert "ContentEncoding" not in response
+        assert storedBody == body
+
+    # 取得時は圧縮の有無に関わらず同じ内容になる
+    assert s3.GetPlayerCharacterObject(1, "pc0")["Body"] == characterJson
+    assert s3.GetPlayerCharacterMetadata(1, "pc0") == metadata
+
+
+def test_put_player_character_object_keeps_etag_of_same_content(
+    s3Bucket: str, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv(PLAYER_CHARACTER_CONTENT_ENCODING, "gzip")
+    s3: MyS3Client = MyS3Client()
+    body: bytes = dumps({"id": "pc0"}).encode("utf-8")
+
+    # 保存し直しても、内容が同じであればETagは変わらない
+    s3.PutPlayerCharacterObject(1, "pc0", body)
+    eTag: str = s3.GetPlayerCharacterObject(1, "pc0")["ETag"]
+    sleep(1)
+    s3.PutPlayerCharacterObject(1, "pc0", body)
+
+    assert s3.GetPlayerCharacterObject(1, "pc0")["ETag"] == eTag
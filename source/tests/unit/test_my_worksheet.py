@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps
+from random import Random
+from typing import Any
+
+from gspread.utils import a1_range_to_grid_range, rowcol_to_a1
+from gspread.worksheet import CellFormat
+from my_modules.constants.spread_sheet import DEFAULT_TEXT_FORMAT
+from my_modules.spreadsheet.my_worksheet import MyWorksheet, OptimizeFormats
+
+"""
+Worksheet拡張クラスのテスト
+"""
+
+
+class _FakeWorksheet:
+    """
+    値の取得のみ行うWorksheet
+    """
+
+    id: int = 0
+    title: str = "シート"
+
+    def __init__(self, values: list[list]):
+        self.values: list[list] = values
+
+    def batch_get(self, ranges: list[str]) -> list[list[list]]:
+        return [self.values[:1], [x[1:2] for x in self.values]]
+
+    def get(self, **kwargs: Any) -> list[list]:
+        return self.values
+
+
+class _FakeSpreadsheet:
+    """
+    送信内容を記録するスプレッドシート
+    """
+
+    def __init__(self):
+        self.data: list[dict] = []
+        self.requests: list[dict] = []
+
+    def batchUpdate(self, data: list[dict], requests: list[dict]):
+        self.data.extend(data)
+        self.requests.extend(requests)
+
+
+def _makeWorksheet(
+    currentValues: list[list],
+) -> tuple[MyWorksheet, _FakeSpreadsheet]:
+    spreadsheet: _FakeSpreadsheet = _FakeSpreadsheet()
+    worksheet: MyWorksheet = MyWorksheet.__new__(MyWorksheet)
+    worksheet.worksheet = _FakeWorksheet(currentValues)  # type: ignore
+    worksheet.spreadsheet = spreadsheet  # type: ignore
+    return worksheet, spreadsheet
+
+
+def _getFormatRequests(spreadsheet: _FakeSpreadsheet) -> list[dict]:
+    return [x["repeatCell"] for x in spreadsheet.requests if "repeatCell" in x]
+
+
+_GRAY_FORMAT: dict = {"backgroundColor": {"red": 0.5}}
+
+
+def test_update_rows_resets_format_of_changed_rows():
+    currentValues: list[list] = [
+        ["No.", "PC", "値"],
+        [1, "PC1", 1],
+        [2, "PC2", 2],
+        ["", "合計", 3],
+    ]
+    worksheet, spreadsheet = _makeWorksheet(currentValues)
+
+    # 2行目のみ書式を変更
+    values: list[list] = [
+        ["No.", "PC", "値"],
+        [1, "PC1", 5],
+        [2, "PC2", 2],
+        ["", "合計", 7],
+    ]
+    worksheet.Update(
+        values,
+        [
+            {"range": "A2:C2", "format": _GRAY_FORMAT},
+            {"range": "A3:C3", "format": _GRAY_FORMAT},
+        ],
+        True,
+        [2],
+    )
+
+    requests: list[dict] = _getFormatRequests(spreadsheet)
+    # デフォルトの書式に戻してから、変更した行の書式のみ適用する
+    assert [x["range"] for x in requests] == [
+        {
+            "sheetId": 0,
+            "startRowIndex": 1,
+            "endRowIndex": 2,
+            "startColumnIndex": 0,
+            "endColumnIndex": 3,
+        },
+        {
+            "sheetId": 0,
+            "startRowIndex": 3,
+            "endRowIndex": 4,
+            "startColumnIndex": 0,
+            "endColumnIndex": 3,
+        },
+        {
+            "sheetId": 0,
+            "startRowIndex": 1,
+            "endRowIndex": 2,
+            "startColumnIndex": 0,
+            "endColumnIndex": 3,
+        },
+    ]
+    assert [
+        x["cell"]["userEnteredFormat"].get("textFormat") for x in requests
+    ] == [DEFAULT_TEXT_FORMAT, DEFAULT_TEXT_FORMAT, None]
+
+
+def test_update_same_size_resets_format_of_changed_rows():
+    currentValues: list[list] = [
+        ["No.", "PC", "値"],
+        [1, "PC1", 1],
+        [2, "PC2", 2],
+    ]
+    worksheet, spreadsheet = _makeWorksheet(currentValues)
+
+    values: list[list] = [
+        ["No.", "PC", "値"],
+        [1, "PC1", 1],
+        [2, "PC2", 5],
+    ]
+    worksheet.Update(
+        values, [{"range": "A2:C2", "format": _GRAY_FORMAT}], False
+    )
+
+    # 値が変わった3行目のみデフォルトの書式に戻す
+    requests: list[dict] = _getFormatRequests(spreadsheet)
+    assert [x["range"] for x in requests] == [
+        {
+            "sheetId": 0,
+            "startRowIndex": 2,
+            "endRowIndex": 3,
+            "startColumnIndex": 0,
+            "endColumnIndex": 3,
+        }
+    ]
+    assert (
+        requests[0]["cell"]["userEnteredFormat"]["textFormat"]
+        == DEFAULT_TEXT_FORMAT
+    )
+
+
+def test_update_bytes_sent_matches_serialized_request():
+    currentValues: list[list] = [["No.", "PC"], [1, "PC1"], [2, "PC2"]]
+    worksheet, spreadsheet = _makeWorksheet(currentValues)
+
+    values: list[list] = [["No.", "PC"], [1, "変更1"], [2, "変更2"]]
+    result: dict[str, int] = worksheet.Update(
+        values,
+        [
+            {"range": "A2:B2", "format": _GRAY_FORMAT},
+            {"range": "A3:B3", "format": _GRAY_FORMAT},
+        ],
+        False,
+    )
+
+    assert result["BytesSent"] == len(
+        dumps(
+            {"data": spreadsheet.data, "requests": spreadsheet.requests},
+            ensure_ascii=False,
+        ).encode("utf-8")
+    )
+    # 2行のグレーアウトと2行のデフォルトの書式がそれぞれ1つにまとまる
+    assert len(_getFormatRequests(spreadsheet)) == 2
+    assert result["FormatBytesSaved"] > 0
+
+
+_GRID_SIZE: int = 6
+
+
+def _applyFormats(formats: list[CellFormat]) -> list[list[dict]]:
+    """
+    書式を順に適用したセルの書式を返す
+    repeatCellと同じく、指定した項目のみ上書きする
+    """
+    cells: list[list[dict]] = [
+        [{} for _ in range(_GRID_SIZE)] for _ in range(_GRID_SIZE)
+    ]
+    for cellFormat in formats:
+        gridRange: dict[str, int] = a1_range_to_grid_range(cellFormat["range"])
+        for row in range(
+            gridRange.get("startRowIndex", 0),
+            gridRange.get("endRowIndex", _GRID_SIZE),
+        ):
+            for column in range(
+                gridRange.get("startColumnIndex", 0),
+                gridRange.get("endColumnIndex", _GRID_SIZE),
+            ):
+                cells[row][column] |= cellFormat["format"]
+
+    return cells
+
+
+def _makeRandomFormats(random: Random, count: int) -> list[CellFormat]:
+    candidates: list[dict] = [
+        {"textFormat": {"bold": True}},
+        {"textFormat": {"bold": False}},
+        {"backgroundColor": {"red": 0.5}},
+        {"backgroundColor": {"blue": 0.5}},
+        {"horizontalAlignment": "CENTER"},
+    ]
+    formats: list[CellFormat] = []
+    for _ in range(count):
+        if random.random() < 0.05:
+            # 行や列が指定されていない範囲
+            column: str = rowcol_to_a1(1, random.randint(1, _GRID_SIZE))[:-1]
+            cellRange: str = f"{column}:{column}"
+        else:
+            startRow: int = random.randint(1, _GRID_SIZE)
+            startColumn: int = random.randint(1, _GRID_SIZE)
+            cellRange = (
+                f"{rowcol_to_a1(startRow, startColumn)}:"
+                + rowcol_to_a1(
+                    random.randint(startRow, min(startRow + 1, _GRID_SIZE)),
+                    random.randint(
+                        startColumn, min(startColumn + 1, _GRID_SIZE)
+                    ),
+                )
+            )
+
+        formats.append(
+            {"range": cellRange, "format": random.choice(candidates)}
+        )
+
+    return formats
+
+
+def test_optimize_formats_matches_applying_formats_in_order():
+    random: Random = Random(0)
+    for _ in range(500):
+        formats: list[CellFormat] = _makeRandomFormats(
+            random, random.randint(0, 30)
+        )
+        optimizedFormats: list[CellFormat] = OptimizeFormats(formats)
+
+        assert len(optimizedFormats) <= len(formats)
+        assert _applyFormats(optimizedFormats) == _applyFormats(formats)
+
+
+def test_optimize_formats_merges_adjacent_rows():
+    formats: list[CellFormat] = [
+        {"range": f"A{x}:C{x}", "format": _GRAY_FORMAT} for x in range(2, 6)
+    ]
+
+    assert OptimizeFormats(formats) == [
+        {"range": "A2:C5", "format": _GRAY_FORMAT}
+    ]
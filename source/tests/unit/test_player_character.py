@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from json import load
+from pathlib import Path
+from typing import Any, Union
+
+import pytest
+
+from my_modules.constants import sword_world
+from my_modules.sword_world.character_patterns import (
+    GENERAL_SKILL_SEPARATOR_PATTERN,
+)
+from my_modules.sword_world.general_skill import GeneralSkill
+from my_modules.sword_world.player import Player
+from my_modules.sword_world.player_character import PlayerCharacter
+
+"""
+PCのテスト
+"""
+
+_FIXTURES_DIRECTORY: Path = Path(__file__).resolve().parent / "fixtures"
+
+
+def _makePlayerCharacter(characterJson: dict[str, Any]) -> PlayerCharacter:
+    return PlayerCharacter(
+        {"id": "pc", "race": "人間"} | characterJson,
+        "PL",
+        100000,
+        0,
+        datetime(2024, 1, 1),
+    )
+
+
+def _loadFixturePlayerCharacter() -> PlayerCharacter:
+    with (_FIXTURES_DIRECTORY / "player_character.json").open(
+        encoding="utf-8"
+    ) as file:
+        characterJson: dict[str, Any] = load(file)
+
+    return PlayerCharacter(
+        characterJson, "PL", 100000, 0, datetime(2024, 1, 1)
+    )
+
+
+def test_fixture_styles_and_abyss_curses():
+    # 期待値は遅延解析を導入する前の実装で同じシートを解析した結果
+    character: PlayerCharacter = _loadFixturePlayerCharacter()
+
+    # 秘伝、名誉アイテム、不名誉詳細の順に重複を除いて入門した流派
+    assert [x.Name for x in character.Styles] == [
+        "イーヴァル狂闘術",
+        "ミハウ式流円闘技",
+        "ナルザラント柔盾活用術",
+        "カスロット豪砂拳・バタス派",
+    ]
+    assert character.GetStyleIndex() == tuple(
+        x in character.Styles for x in sword_world.STYLES
+    )
+
+    # 武器、鎧、所持品、アビス侵蝕の表から重複を除いたアビスカース
+    # 表のタイトルが異なる場合は対象外
+    assert sorted(character.AbyssCurses) == [
+        "優しき",
+        "嘆きの",
+        "無謀な",
+        "脆弱な",
+        "自傷の",
+    ]
+    assert character.GetAbyssCurseIndex() == tuple(
+        x in character.AbyssCurses for x in sword_world.ABYSS_CURSES
+    )
+
+
+def test_fixture_general_skills():
+    character: PlayerCharacter = _loadFixturePlayerCharacter()
+
+    # 空欄の一般技能は対象外
+    assert [
+        (
+            x.Skill.SkillName,
+            x.Skill.DisplayJob,
+            x.Skill.IsOriginal,
+            x.Level,
+        )
+        for x in character.GeneralSkills
+    ] == [
+        ("コック", "料理人", False, 3),
+        ("ウェイター/ウェイトレス", "給仕", False, 2),
+        ("冒険者", "剣士", True, 1),
+        ("ソルジャー", "兵士", False, 4),
+    ]
+    assert [
+        (x.Skill.SkillName, x.Level)
+        for x in character.GetGeneralSkillIndex()
+        if x is not None
+    ] == [("ウェイター/ウェイトレス", 2), ("コック", 3), ("ソルジャー", 4)]
+
+
+def test_fixture_combat_skills():
+    character: PlayerCharacter = _loadFixturePlayerCharacter()
+
+    # 前方一致する戦闘特技は先に習得したものを返却する
+    assert [
+        (x.SkillName, x.detail) if x is not None else None
+        for x in map(
+            character.GetCombatSkillByName,
+            ["全力攻撃", "武器習熟Ａ", "薙ぎ払い", "回避行動", "全力攻撃Ⅱ"],
+        )
+    ] == [
+        ("全力攻撃Ⅰ", "Ⅰ"),
+        ("武器習熟Ａ／ソード", "ソード"),
+        ("薙ぎ払いⅠ", "Ⅰ"),
+        None,
+        ("全力攻撃Ⅱ", "Ⅱ"),
+    ]
+
+
+def test_fixture_height_and_weight():
+    character: PlayerCharacter = _loadFixturePlayerCharacter()
+
+    # 全角の小数点は数値として扱わない
+    assert character.Height == "172"
+    assert character.Weight == "68"
+
+    assert _makePlayerCharacter({}).Height == ""
+    assert _makePlayerCharacter({}).Weight == ""
+
+
+def test_fixture_is_read_only():
+    character: PlayerCharacter = _loadFixturePlayerCharacter()
+
+    with pytest.raises(AttributeError):
+        character.Styles = ()  # type: ignore
+
+    with pytest.raises(AttributeError):
+        # __slots__にない属性は追加できない
+        character.Unknown = 1  # type: ignore
+
+    # 解析済みの値は変わらない
+    assert len(character.Styles) == 4
+
+
+def _makeHistoryCharacter(
+    histories: list[tuple[str, str]], playerName: str = "PL"
+) -> PlayerCharacter:
+    characterJson: dict[str, Any] = {
+        "id": "pc",
+        "race": "人間",
+        "historyNum": str(len(histories)),
+    }
+    for i, (date, gameMaster) in enumerate(histories, 1):
+        characterJson[f"history{i}Date"] = date
+        characterJson[f"history{i}Gm"] = gameMaster
+
+    return PlayerCharacter(
+        characterJson, playerName, 100000, 0, datetime(2024, 1, 1)
+    )
+
+
+def _baselineGameMasterScenarioKeys(
+    histories: list[tuple[str, str]], playerName: str = "PL"
+) -> list[str]:
+    # 日付ごとの連番を導入する前の実装
+    # 同じ日付で始まる作成済みのキーの数を連番にする
+    keys: list[str] = []
+    for date, gameMaster in histories:
+        if gameMaster == "":
+            continue
+
+        if gameMaster == playerName or gameMaster in ["俺", "私", "自分"]:
+            count: int = len([x for x in keys if x.startswith(date)])
+            keys.append(f"{date}_{count}")
+
+    return keys
+
+
+def test_game_master_scenario_keys_match_baseline():
+    historiesList: list[list[tuple[str, str]]] = [
+        # 同じ日付に複数回GMし、間に他の日付を挟む
+        [
+            ("2024-01-01", "PL"),
+            ("2024-01-01", "PL"),
+            ("2024-01-02", "他のGM"),
+            ("2024-01-01", "自分"),
+            ("2024-01-03", "PL"),
+            ("", ""),
+        ],
+        [
+            ("2024-01-01", "PL"),
+            ("2024-01-03", "俺"),
+            ("2024-01-03", "PL"),
+            ("2024-01-04", "私"),
+            ("2024-01-04", "他のGM"),
+        ],
+        [("2024-01-05", "他のGM")],
+    ]
+    characters: list[PlayerCharacter] = [
+        _makeHistoryCharacter(x) for x in historiesList
+    ]
+
+    for character, histories in zip(characters, historiesList):
+        assert list(character.GameMasterScenarioKeys) == (
+            _baselineGameMasterScenarioKeys(histories)
+        )
+
+    assert characters[0].GameMasterScenarioKeys == (
+        "2024-01-01_0",
+        "2024-01-01_1",
+        "2024-01-01_2",
+        "2024-01-03_0",
+    )
+    assert [x.PlayerTimes for x in characters] == [1, 1, 1]
+
+    # PL単位では、複数のPCで同じ日付・連番のシナリオを1回と数える
+    player: Player = Player("PL", characters)
+    expected: int = len(
+        set().union(
+            *(_baselineGameMasterScenarioKeys(x) for x in historiesList)
+        )
+    )
+    assert expected == 6
+    assert player.GetGameMasterTimes() == expected
+    assert player.GetGameMasterTimes() == expected
+
+
+def _baselineGeneralSkill(
+    ytsheetGeneralSkillName: str, level: int
+) -> tuple[str, str, bool, int]:
+    # 名前の索引を導入する前の実装
+    # 公式一般技能を先頭から順にcompareWithListOfStrで比較する
+    skillNameAndJob: list[str] = GENERAL_SKILL_SEPARATOR_PATTERN.split(
+        ytsheetGeneralSkillName.removeprefix("|")
+        .removesuffix(")")
+        .removesuffix("）")
+        .removesuffix("》"),
+        1,
+    )
+    official: Union[GeneralSkill, None] = next(
+        (
+            x
+            for x in sword_world.OFFICIAL_GENERAL_SKILLS
+            if x.compareWithListOfStr(skillNameAndJob)
+        ),
+        None,
+    )
+    if official is None:
+        return (
+            skillNameAndJob[0],
+            skillNameAndJob[1] if len(skillNameAndJob) > 1 else "",
+            True,
+            level,
+        )
+
+    return official.SkillName, official.DisplayJob, False, level
+
+
+def test_general_skills_match_baseline():
+    officialSkills = sword_world.OFFICIAL_GENERAL_SKILLS
+    names: list[str] = [
+        "コック（料理人）",
+        "ウェイトレス",
+        "|高級男娼《コーティザン》",
+        "冒険者（剣士）",
+        "冒険者",
+        "コック　見習い",
+    ]
+    for i, skill in enumerate(officialSkills):
+        names.append(f"{skill.SkillName}（{skill.DisplayJob}）")
+        names.append(f"{skill.SkillName}({skill.DisplayJob})")
+        names.extend(skill.keywords)
+        # スキル名と職業名が別の公式一般技能の場合
+        other = officialSkills[(i + 1) % len(officialSkills)]
+        names.append(f"{skill.SkillName}（{other.DisplayJob}）")
+        names.append(f"{other.SkillName}（{skill.DisplayJob}）")
+
+    characterJson: dict[str, Any] = {"commonClassNum": str(len(names))}
+    for i, name in enumerate(names, 1):
+        characterJson[f"commonClass{i}"] = name
+        characterJson[f"lvCommon{i}"] = str(i % 15 + 1)
+
+    generalSkills = _makePlayerCharacter(characterJson).GeneralSkills
+
+    assert [
+        (
+            x.Skill.SkillName,
+            x.Skill.DisplayJob,
+            x.Skill.IsOriginal,
+            x.Level,
+        )
+        for x in generalSkills
+    ] == [
+        _baselineGeneralSkill(name, i % 15 + 1)
+        for i, name in enumerate(names, 1)
+    ]
+
+    # 既知の入力の分類
+    assert [
+        (x.Skill.getFormattedSkill(), x.Skill.IsOriginal, x.Level)
+        for x in generalSkills[:6]
+    ] == [
+        ("コック(料理人)", False, 2),
+        ("ウェイター/ウェイトレス(給仕)", False, 3),
+        ("コーティザン(高級娼婦/男娼)", False, 4),
+        ("冒険者(剣士)", True, 5),
+        ("冒険者", True, 6),
+        ("コック(料理人)", False, 7),
+    ]
+    # 公式一般技能は定義のインスタンスを共有する
+    assert generalSkills[0].Skill is next(
+        x for x in officialSkills if x.SkillName == "コック"
+    )
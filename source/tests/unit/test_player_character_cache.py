@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps
+from time import sleep
+from typing import Any
+
+import pytest
+from my_modules.aws.my_s3_client import MyS3Client
+from my_modules.common_functions import initializePlayers
+from my_modules.sword_world import player_character_cache
+from my_modules.sword_world.player import Player
+
+"""
+解析済みPCのキャッシュのテスト
+"""
+
+_LEVEL_CAP: dict[str, Any] = {"max_exp": 10000, "minimum_exp": 0}
+
+
+# テストごとにメモリ上のキャッシュを空にする
+pytestmark = pytest.mark.usefixtures("emptyPlayerCharacterCache")
+
+
+@pytest.fixture
+def parseCount(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """PCを解析した回数"""
+    count: list[int] = [0]
+    playerCharacter = player_character_cache.PlayerCharacter
+
+    def countParse(*args):
+        count[0] += 1
+        return playerCharacter(*args)
+
+    monkeypatch.setattr(player_character_cache, "PlayerCharacter", countParse)
+    return count
+
+
+def _putPlayerCharacter(
+    s3: MyS3Client, seasonId: int, ytsheetId: str, name: str
+):
+    s3.PutPlayerCharacterObject(
+        seasonId,
+        ytsheetId,
+        dumps(
+            {
+                "id": ytsheetId,
+                "race": "人間",
+                "characterName": name,
+                "freeNote": "身長：170cm&lt;br&gt;体重：60kg",
+                "commonClassNum": "1",
+                "commonClass1": "オリジナル技能",
+                "lvCommon1": "2",
+            }
+        ),
+    )
+
+
+def _initializePlayers(seasonId: int, count: int = 3) -> list[Player]:
+    return initializePlayers(
+        [
+            {
+                "name": "PL",
+                "characters": [
+                    {"ytsheet_id": f"pc{i}"} for i in range(count)
+                ],
+            }
+        ],
+        _LEVEL_CAP,
+        seasonId,
+    )
+
+
+def _coldStart(monkeypatch: pytest.MonkeyPatch):
+    # コンテナが替わった場合、メモリ上のキャッシュは空になる
+    monkeypatch.setattr(player_character_cache, "_playerCharacterCache", {})
+    monkeypatch.setattr(player_character_cache, "_loadedSeasonIds", set())
+
+
+def test_reuses_parsed_player_characters_after_cold_start(
+    s3Bucket: str, monkeypatch: pytest.MonkeyPatch, parseCount: list[int]
+):
+    s3: MyS3Client = MyS3Client()
+    for i in range(3):
+        _putPlayerCharacter(s3, 1, f"pc{i}", f"PC{i}")
+
+    expected = _initializePlayers(1)[0].Characters
+    assert parseCount[0] == 3
+
+    _coldStart(monkeypatch)
+    snapshotReads: list[int] = []
+    monkeypatch.setattr(
+        MyS3Client,
+        "GetSeasonSnapshotObject",
+        lambda self, x: snapshotReads.append(x) or {},
+    )
+    actual = _initializePlayers(1)[0].Characters
+
+    # S3に保存した解析結果を使い、PC情報の取得も解析もしない
+    assert parseCount[0] == 3
+    assert snapshotReads == []
+    assert [
+        (x.Name, x.Height, x.Weight, x.GeneralSkills, x.UpdateDatetime)
+        for x in actual
+    ] == [
+        (x.Name, x.Height, x.Weight, x.GeneralSkills, x.UpdateDatetime)
+        for x in expected
+    ]
+
+
+def test_reparses_only_changed_player_characters(
+    s3Bucket: str, monkeypatch: pytest.MonkeyPatch, parseCount: list[int]
+):
+    s3: MyS3Client = MyS3Client()
+    for i in range(3):
+        _putPlayerCharacter(s3, 1, f"pc{i}", f"PC{i}")
+
+    _initializePlayers(1)
+    _putPlayerCharacter(s3, 1, "pc1", "変更後")
+    _coldStart(monkeypatch)
+    characters = _initializePlayers(1)[0].Characters
+
+    assert parseCount[0] == 4
+    assert [x.Name for x in characters] == ["PC0", "変更後", "PC2"]
+
+
+def test_update_time_follows_identical_content_put(
+    s3Bucket: str, parseCount: list[int]
+):
+    s3: MyS3Client = MyS3Client()
+    _putPlayerCharacter(s3, 1, "pc0", "PC0")
+    previous = _initializePlayers(1, 1)[0].Characters[0]
+
+    # 同じ内容で保存し直すとETagは変わらず、最終更新日時のみ変わる
+    sleep(1)
+    _putPlayerCharacter(s3, 1, "pc0", "PC0")
+    current = _initializePlayers(1, 1)[0].Characters[0]
+
+    assert parseCount[0] == 2
+    assert current.UpdateDatetime > previous.UpdateDatetime
+
+
+def test_separates_seasons_with_same_ytsheet_id(
+    s3Bucket: str, parseCount: list[int]
+):
+    s3: MyS3Client = MyS3Client()
+    _putPlayerCharacter(s3, 1, "pc0", "シーズン1")
+    _putPlayerCharacter(s3, 2, "pc0", "シーズン2")
+
+    assert _initializePlayers(1, 1)[0].Characters[0].Name == "シーズン1"
+    assert _initializePlayers(2, 1)[0].Characters[0].Name == "シーズン2"
+    assert _initializePlayers(1, 1)[0].Characters[0].Name == "シーズン1"
+    assert parseCount[0] == 2
+
+
+def test_ignores_cache_saved_by_other_parser_version(
+    s3Bucket: str, monkeypatch: pytest.MonkeyPatch, parseCount: list[int]
+):
+    s3: MyS3Client = MyS3Client()
+    _putPlayerCharacter(s3, 1, "pc0", "PC0")
+    _initializePlayers(1, 1)
+
+    # 解析処理を変更した後は、保存した解析結果を使わない
+    _coldStart(monkeypatch)
+    monkeypatch.setattr(player_character_cache, "_PARSER_VERSION", "other")
+    assert _initializePlayers(1, 1)[0].Characters[0].Name == "PC0"
+    assert parseCount[0] == 2
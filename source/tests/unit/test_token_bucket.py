@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+
+import pytest
+from my_modules import token_bucket
+from my_modules.token_bucket import TokenBucket
+
+"""
+トークンバケットのテスト
+"""
+
+
+class _FakeClock:
+    """
+    sleepした分だけ進む時計
+    """
+
+    def __init__(self):
+        self.now: float = 0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def test_acquire_waits_for_refill(monkeypatch: pytest.MonkeyPatch):
+    clock: _FakeClock = _FakeClock()
+    monkeypatch.setattr(token_bucket, "monotonic", clock.monotonic)
+    monkeypatch.setattr(token_bucket, "sleep", clock.sleep)
+
+    bucket: TokenBucket = TokenBucket(0.1)
+    # 空の状態から開始し、1回ごとに1/流量秒待機する
+    assert [bucket.Acquire() for _ in range(3)] == pytest.approx(
+        [10, 10, 10]
+    )
+    assert clock.now == pytest.approx(30)
+
+    # 待機中に貯まったトークンは容量までしか使えない
+    clock.now += 100
+    assert bucket.Acquire() == 0
+    assert bucket.Acquire() == pytest.approx(10)
+
+
+def test_acquire_limits_rate_across_threads():
+    requestsPerSecond: float = 50
+    count: int = 10
+    bucket: TokenBucket = TokenBucket(requestsPerSecond)
+
+    startTime: float = monotonic()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: bucket.Acquire(), range(count)))
+
+    assert monotonic() - startTime >= count / requestsPerSecond * 0.9
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)